@@ -13,7 +13,8 @@ from tqdm import tqdm
 
 from pyteltools.geom.transformation import Transformation
 from pyteltools.slf import Serafin
-from pyteltools.slf.variables import do_calculations_in_frame, get_necessary_equations
+from pyteltools.slf.prefetch import PrefetchReader
+from pyteltools.slf.variables import do_calculations_in_frame, get_necessary_equations, get_read_var_IDs
 from pyteltools.slf.variable.variables_2d import FRICTION_LAWS, get_US_equation, STRICKLER_ID
 from pyteltools.utils.cli_base import logger, PyTelToolsArgParse
 
@@ -71,13 +72,17 @@ def slf_base(args):
         necessary_equations = get_necessary_equations(resin.header.var_IDs, output_header.var_IDs,
                                                       is_2d=resin.header.is_2d, us_equation=us_equation)
 
-        with Serafin.Write(args.out_slf, args.lang, overwrite=args.force) as resout:
+        read_var_IDs = get_read_var_IDs(resin.header.var_IDs, necessary_equations, output_header.var_IDs)
+        selected_time = resin.subset_time(args.start, args.end, args.ech)
+
+        with Serafin.Write(args.out_slf, args.lang, overwrite=args.force) as resout, \
+                PrefetchReader(resin, [time_index for time_index, _ in selected_time], read_var_IDs) as input_stream:
             resout.write_header(output_header)
 
-            for time_index, time in tqdm(resin.subset_time(args.start, args.end, args.ech), unit='frame'):
-                values = do_calculations_in_frame(necessary_equations, resin, time_index, output_header.var_IDs,
-                                                  output_header.np_float_type, is_2d=output_header.is_2d,
-                                                  us_equation=us_equation, ori_values={})
+            for time_index, time in tqdm(selected_time, unit='frame'):
+                values = do_calculations_in_frame(necessary_equations, input_stream, time_index,
+                                                  output_header.var_IDs, output_header.np_float_type,
+                                                  is_2d=output_header.is_2d, us_equation=us_equation, ori_values={})
                 resout.write_entire_frame(output_header, time + args.shift_time, values)
 
 
@@ -9,11 +9,11 @@ Outputs:
 import csv
 import numpy as np
 from shapefile import ShapefileException
-from shapely.geometry import Point
 import sys
 from tqdm import tqdm
 
 from pyteltools.geom import Shapefile
+from pyteltools.geom.geometry import points_in_polygons
 from pyteltools.slf import Serafin
 from pyteltools.slf.variables import do_calculations_in_frame, get_necessary_equations
 from pyteltools.slf.variable.variables_2d import FRICTION_LAWS, get_US_equation, STRICKLER_ID
@@ -89,12 +89,10 @@ def slf_bottom_friction(args):
 
             logger.debug('Recomputing friction coefficient values from zones')
             friction_coeff = np.full(resin.header.nb_nodes_2d, 0.0)  # default value for nodes not included in any zone
-            for i, (x, y) in enumerate(zip(tqdm(resin.header.x), tqdm(resin.header.y))):
-                point = Point(x, y)
-                for zone in strickler_zones:
-                    if zone.contains(point):
-                        friction_coeff[i] = zone.attributes()[index_attr]
-                        exit
+            zone_indices = points_in_polygons(resin.header.x, resin.header.y, strickler_zones, keep_last=True)
+            is_inside = zone_indices >= 0
+            friction_coeff[is_inside] = np.array([zone.attributes()[index_attr]
+                                                  for zone in strickler_zones])[zone_indices[is_inside]]
             in_varIDs.append('W')
             ori_values['W'] = friction_coeff
         else:
@@ -132,12 +130,7 @@ def slf_bottom_friction(args):
                                                       us_equation=strickler_equation, ori_values=ori_values)
                     resout.write_entire_frame(output_header, time, values)
 
-                    row = [time]
-                    for j in range(len(calculator.polygons)):
-                        weight = calculator.weights[j]
-                        volume = calculator.volume_in_frame_in_polygon(weight, values[pos_TAU], calculator.polygons[j])
-                        row.append(volume)
-                    csvwriter.writerow(row)
+                    csvwriter.writerow([time] + calculator.volumes_in_frame(values[pos_TAU]))
 
 
 parser = PyTelToolsArgParse(description=__doc__, add_args=['in_slf', 'out_slf', 'out_csv'])
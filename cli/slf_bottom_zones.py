@@ -17,7 +17,7 @@ import shapely.geometry as geo
 
 import pyteltools.geom.BlueKenue as bk
 import pyteltools.geom.Shapefile as shp
-from pyteltools.geom.geometry import Polyline
+from pyteltools.geom.geometry import points_in_polygons, Polyline
 from pyteltools.geom.transformation import Transformation
 from pyteltools.slf import Serafin
 from pyteltools.utils.cli_base import logger, PyTelToolsArgParse
@@ -136,6 +136,7 @@ def bottom(args):
             output_header = resin.header
             resout.write_header(output_header)
             pos_B = output_header.var_IDs.index('B')
+            zone_indices = points_in_polygons(output_header.x, output_header.y, [zone.polygon for zone in zones])
 
             for time_index, time in enumerate(resin.time):
                 var = resin.read_vars_in_frame(time_index)
@@ -149,20 +150,20 @@ def bottom(args):
 
                     found = False
                     # Check if it is inside a zone
-                    for j, zone in enumerate(zones):
-                        if zone.contains(pt):
-                            # Current point is inside zone number j and is between polylines a and b
-                            z_int = zone.interpolate(pt)
-                            new_z = zone.operator(z_int, old_z)
-                            var[pos_B, i] = new_z
-
-                            print("BOTTOM at node {} (zone n°{}) {} to {} (dz={})".format(
-                                i + 1, j, operator_str, new_z, new_z - old_z
-                            ))
-
-                            nmodif += 1
-                            found = True
-                            break
+                    j = zone_indices[i]
+                    if j >= 0:
+                        zone = zones[j]
+                        # Current point is inside zone number j and is between polylines a and b
+                        z_int = zone.interpolate(pt)
+                        new_z = zone.operator(z_int, old_z)
+                        var[pos_B, i] = new_z
+
+                        print("BOTTOM at node {} (zone n°{}) {} to {} (dz={})".format(
+                            i + 1, j, operator_str, new_z, new_z - old_z
+                        ))
+
+                        nmodif += 1
+                        found = True
 
                     if not found and args.rescue_distance > 0.0:
                         # Try to rescue some very close nodes
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+"""
+Convert a Serafin file to a chunked compressed container (*.slfz) or convert it back (lossless conversions)
+
+The conversion direction is given by the input file extension.
+"""
+
+import sys
+
+from pyteltools.conf import settings
+from pyteltools.slf import Serafin
+from pyteltools.slf.chunked import CHUNKED_EXT, chunked_to_slf, DEFAULT_NODE_CHUNK, DEFAULT_TIME_CHUNK, \
+    slf_to_chunked
+from pyteltools.utils.cli_base import logger, PyTelToolsArgParse
+
+
+def slf_chunked(args):
+    if args.in_file.endswith(CHUNKED_EXT):
+        chunked_to_slf(args.in_file, args.out_file, args.lang, overwrite=args.force)
+    else:
+        slf_to_chunked(args.in_file, args.out_file, args.lang, time_chunk=args.time_chunk,
+                       node_chunk=args.node_chunk, compress=not args.no_compress, overwrite=args.force)
+
+
+parser = PyTelToolsArgParse(description=__doc__)
+parser.add_argument('in_file', help='Serafin or chunked container (%s) input filename' % CHUNKED_EXT)
+parser.add_argument('out_file', help='chunked container or Serafin output filename')
+parser.add_argument('--time_chunk', type=int, help='number of frames per chunk', default=DEFAULT_TIME_CHUNK)
+parser.add_argument('--node_chunk', type=int, help='number of nodes per chunk', default=DEFAULT_NODE_CHUNK)
+parser.add_argument('--no_compress', help='store chunks without compression', action='store_true')
+parser.add_argument('--lang', help="Serafin language for variables detection: 'fr' or 'en'",
+                    default=settings.LANG)
+parser.add_group_general(['force', 'verbose'])
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+
+    try:
+        slf_chunked(args)
+    except (Serafin.SerafinRequestError, Serafin.SerafinValidationError):
+        # Message is already reported by slf logger
+        sys.exit(1)
+    except FileExistsError:
+        logger.critical('Output file already exists, use `--force` to overwrite it')
+        sys.exit(3)
@@ -71,20 +71,7 @@ def slf_flux2d(args):
         calculator = FluxCalculator(flux_type, var_IDs, resin, section_names, polylines, args.ech)
         calculator.construct_triangles(tqdm)
         calculator.construct_intersections()
-        result = []
-        for time_index, time in enumerate(tqdm(resin.time, unit='frame')):
-            i_result = [str(time)]
-            values = []
-
-            for var_ID in calculator.var_IDs:
-                values.append(resin.read_var_in_frame(time_index, var_ID))
-
-            for j in range(len(polylines)):
-                intersections = calculator.intersections[j]
-                flux = calculator.flux_in_frame(intersections, values)
-                i_result.append(settings.FMT_FLOAT.format(flux))
-
-            result.append(i_result)
+        result = calculator.run(tqdm, settings.FMT_FLOAT, nb_processes=args.nb_processes)
 
         # Write CSV
         mode = 'w' if args.force else 'x'
@@ -98,6 +85,8 @@ parser.add_argument('--ech', type=int, help='frequency sampling of input', defau
 parser.add_argument('--scalars', nargs='*', help='scalars to integrate (up to 2)', default=[], metavar=('VA', 'VB'))
 parser.add_argument('--vectors', nargs=2, help='couple of vectors to integrate (X and Y vectors)', default=[],
                     metavar=('VX', 'VY'))
+parser.add_argument('--nb_processes', type=int, help='number of processes (the frames are split in chunks)',
+                    default=1)
 
 parser.add_known_argument('out_csv')
 parser.add_group_general(['force', 'verbose'])
@@ -54,6 +54,15 @@ def slf_int2d(args):
 
         var_IDs = output_header.var_IDs if args.vars is None else args.vars
 
+        # Interpolate by blocks of frames (only the vertices of the triangles containing the points are read)
+        columns = [None] * len(points)  # column of each point inside the mesh in interpolated values
+        for pt_id, index in enumerate([i for i, point_interpolator in enumerate(point_interpolators)
+                                       if point_interpolator is not None]):
+            columns[index] = pt_id
+        inside_interpolators = [p for p in point_interpolators if p is not None]
+        int_values = MeshInterpolator.iter_interpolate_on_points(resin, var_IDs, range(len(resin.time)),
+                                                                 inside_interpolators)
+
         mode = 'w' if args.force else 'x'
         with open(args.out_csv, mode, newline='') as csvfile:
             csvwriter = csv.writer(csvfile, delimiter=args.sep)
@@ -68,23 +77,21 @@ def slf_int2d(args):
                                                                settings.FMT_COORD.format(y)))
             csvwriter.writerow(header)
 
-            for time_index, time in enumerate(tqdm(resin.time, unit='frame')):
+            for (time_index, time), frame_values in zip(enumerate(tqdm(resin.time, unit='frame')), int_values):
                 values = [time_index, time]
 
-                for var_ID in var_IDs:
-                    var = resin.read_var_in_frame(time_index, var_ID)
-                    for pt_id, (point, point_interpolator) in enumerate(zip(points, point_interpolators)):
+                for var_ID, var in zip(var_IDs, frame_values):
+                    for pt_id, (point, column) in enumerate(zip(points, columns)):
                         if args.long:
                             values_long = values + [str(pt_id + 1)] + [settings.FMT_COORD.format(x) for x in point]
 
-                        if point_interpolator is None:
+                        if column is None:
                             if args.long:
                                 csvwriter.writerow(values_long + [var_ID, settings.NAN_STR])
                             else:
                                 values.append(settings.NAN_STR)
                         else:
-                            (i, j, k), interpolator = point_interpolator
-                            int_value = settings.FMT_FLOAT.format(interpolator.dot(var[[i, j, k]]))
+                            int_value = settings.FMT_FLOAT.format(var[column])
                             if args.long:
                                 csvwriter.writerow(values_long + [var_ID, int_value])
                             else:
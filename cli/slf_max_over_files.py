@@ -11,11 +11,11 @@ This tool has some limitations:
 """
 import numpy as np
 from shapefile import ShapefileException
-from shapely.geometry import Point
 import sys
 
 from pyteltools.conf import settings
 from pyteltools.geom import Shapefile
+from pyteltools.geom.geometry import points_in_polygons
 from pyteltools.slf import Serafin
 from pyteltools.utils.cli_base import logger, PyTelToolsArgParse
 
@@ -23,7 +23,7 @@ from pyteltools.utils.cli_base import logger, PyTelToolsArgParse
 def slf_max_over_files(args):
     if args.vars is None:
         with Serafin.Read(args.in_slfs[0], args.lang) as resin:
-            resin.read_header()
+            resin.read_header(lazy=True)  # only variables are needed
             var_IDs = resin.header.var_IDs if args.vars is None else args.vars
     else:
         var_IDs = args.vars
@@ -80,13 +80,7 @@ def slf_max_over_files(args):
                 out_values = np.empty((output_header.nb_var, output_header.nb_nodes),
                                       dtype=output_header.np_float_type)
                 if polygons is not None:
-                    mask_nodes = np.zeros(output_header.nb_nodes, dtype=bool)
-                    for idx_node, (x, y) in enumerate(zip(output_header.x, output_header.y)):
-                        point = Point(x, y)
-                        for polygon in polygons:
-                            if polygon.contains(point):
-                                mask_nodes[idx_node] = True
-                                break
+                    mask_nodes = points_in_polygons(output_header.x, output_header.y, polygons) >= 0
                     logger.info('Number of nodes inside polygon(s): %i (over %i)'
                                 % (mask_nodes.sum(), output_header.nb_nodes))
                 else:
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+"""
+Build the node-major cache of a Serafin file (sidecar folder `*.nodes` next to the input file)
+
+The cache is automatically used to extract time series at nodes
+(as long as the Serafin file is not modified).
+"""
+
+import sys
+from tqdm import tqdm
+
+from pyteltools.slf import Serafin
+from pyteltools.slf.transposed import build_transposed_cache, cache_folder
+from pyteltools.utils.cli_base import logger, PyTelToolsArgParse
+
+
+def slf_node_cache(args):
+    with Serafin.Read(args.in_slf, args.lang) as resin:
+        resin.read_header()
+        logger.info(resin.header.summary())
+
+        var_IDs = resin.header.var_IDs if args.vars is None else args.vars
+        for var_ID in var_IDs:
+            if var_ID not in resin.header.var_IDs:
+                logger.critical('The variable %s is missing' % var_ID)
+                sys.exit(1)
+
+        build_transposed_cache(resin, var_IDs, iter_pbar=lambda x, unit: tqdm(x, unit=unit))
+        logger.info('Node cache written in %s' % cache_folder(args.in_slf))
+
+
+parser = PyTelToolsArgParse(description=__doc__, add_args=['in_slf'])
+parser.add_argument('--vars', nargs='+', help='variable(s) to cache (by default: every variables)', default=None,
+                    metavar=('VA', 'VB'))
+parser.add_group_general(['verbose'])
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+
+    try:
+        slf_node_cache(args)
+    except (Serafin.SerafinRequestError, Serafin.SerafinValidationError):
+        # Message is already reported by slf logger
+        sys.exit(1)
+    except PermissionError as e:
+        logger.critical('Cache folder could not be written: %s' % e)
+        sys.exit(3)
@@ -9,8 +9,9 @@ import sys
 
 from pyteltools.geom.transformation import Transformation
 from pyteltools.slf import Serafin
+from pyteltools.slf.prefetch import PrefetchReader
 from pyteltools.slf.variable.variables_2d import FRICTION_LAWS, get_US_equation, STRICKLER_ID
-from pyteltools.slf.variables import do_calculations_in_frame, get_necessary_equations
+from pyteltools.slf.variables import do_calculations_in_frame, get_necessary_equations, get_read_var_IDs
 from pyteltools.utils.cli_base import logger, PyTelToolsArgParse
 
 
@@ -54,15 +55,18 @@ def slf_sedi_chain(args):
         output_header.add_variable_from_ID('B')
         output_header.add_variable_from_ID('EV')
 
-        with Serafin.Write(args.out_slf, args.lang, overwrite=args.force) as resout:
+        read_var_IDs = get_read_var_IDs(resin.header.var_IDs, necessary_equations, ['TAU'])
+
+        with Serafin.Write(args.out_slf, args.lang, overwrite=args.force) as resout, \
+                PrefetchReader(resin, range(len(resin.time)), read_var_IDs) as input_stream:
             resout.write_header(output_header)
 
             prev_time = None
             prev_tau = None
-            initial_bottom = resin.read_var_in_frame(0, 'B')
+            initial_bottom = input_stream.read_var_in_frame(0, 'B')
             bottom = copy(initial_bottom)
             for time_index, time in enumerate(resin.time):
-                tau = do_calculations_in_frame(necessary_equations, resin, time_index, ['TAU'],
+                tau = do_calculations_in_frame(necessary_equations, input_stream, time_index, ['TAU'],
                                                output_header.np_float_type, is_2d=True, us_equation=us_equation,
                                                ori_values={})[0]
                 if prev_time is not None:
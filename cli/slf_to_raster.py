@@ -1,31 +1,36 @@
 #!/usr/bin/env python
 """
 Convert all variables of a single frame (from a Serafin file) to a tif raster (one band per variable)
+Multiple frames are written as additional bands or as one raster per frame
+The raster is processed tile by tile, so that memory usage is bounded by the tile size
 Beware: Output file is overwritten if already present
 """
+from itertools import islice
+from multiprocessing import Pool
 from osgeo import gdal, osr
-import matplotlib.tri as mtri
 import numpy as np
+import os.path
+from scipy import sparse
 import sys
 
+from pyteltools.conf import settings
 from pyteltools.geom.transformation import Transformation
 from pyteltools.slf import Serafin
+from pyteltools.slf.interpolation import MeshInterpolator
 from pyteltools.utils.cli_base import logger, PyTelToolsArgParse
 
 
 WATER_DEPTH_ID = 'H'
 
 
-def arrays2raster(raster_filename, xy_raster_origin, dx, dy, array_list, epsg=None):
-    nb_var = len(array_list)
-    nb_rows, nb_cols = array_list[0][1].shape
+def create_raster(raster_filename, xy_raster_origin, dx, dy, nb_rows, nb_cols, nb_bands, epsg=None):
     logger.info("Regular grid size : %i rows x %i columns" % (nb_rows, nb_cols))
 
     origin_x = xy_raster_origin[0]
     origin_y = xy_raster_origin[1]
 
     driver = gdal.GetDriverByName('GTiff')
-    out_raster = driver.Create(raster_filename, nb_cols, nb_rows, nb_var, gdal.GDT_Float64)
+    out_raster = driver.Create(raster_filename, nb_cols, nb_rows, nb_bands, gdal.GDT_Float64)
 
     # Set grid and EPSG if necessary
     out_raster.SetGeoTransform((origin_x, dx, 0, origin_y, 0, dy))
@@ -33,15 +38,70 @@ def arrays2raster(raster_filename, xy_raster_origin, dx, dy, array_list, epsg=No
         out_raster_srs = osr.SpatialReference()
         out_raster_srs.ImportFromEPSG(epsg)
         out_raster.SetProjection(out_raster_srs.ExportToWkt())
+    return out_raster
 
-    # Add one band per variable
-    for i_var, (var_ID, array) in enumerate(array_list):
-        if array.shape != (nb_rows, nb_cols):
-            raise RuntimeError
-        outband = out_raster.GetRasterBand(i_var + 1)
-        outband.SetDescription(var_ID)
-        outband.WriteArray(array)
-        outband.FlushCache()
+
+def write_band(out_raster, i_band, description, array, xoff=0, yoff=0):
+    if xoff + array.shape[1] > out_raster.RasterXSize or yoff + array.shape[0] > out_raster.RasterYSize:
+        raise RuntimeError
+    outband = out_raster.GetRasterBand(i_band + 1)
+    if description is not None:
+        outband.SetDescription(description)
+    outband.WriteArray(array, xoff, yoff)
+    outband.FlushCache()
+
+
+def frame_raster_filename(raster_filename, time_index):
+    root, ext = os.path.splitext(raster_filename)
+    return '%s_%i%s' % (root, time_index, ext)
+
+
+def grid_tiles(nb_rows, nb_cols, tile_size):
+    """Tiles (first row, first column, number of rows, number of columns) of the raster"""
+    for row in range(0, nb_rows, tile_size):
+        for col in range(0, nb_cols, tile_size):
+            yield row, col, min(tile_size, nb_rows - row), min(tile_size, nb_cols - col)
+
+
+def tile_operator(mesh, x_coords, y_coords):
+    """
+    Locate the points of a tile in the mesh
+    Returns the mask of the points inside the mesh, the nodes used for interpolation
+    and the interpolation operator from these nodes to the points of the tile
+    """
+    m_xi, m_yi = np.meshgrid(x_coords, y_coords)
+    is_inside, operator = mesh.get_projection_matrix(np.column_stack((m_xi.ravel(), m_yi.ravel())))
+    nodes, indices = np.unique(operator.indices, return_inverse=True)
+    operator = sparse.csr_matrix((operator.data, indices, operator.indptr), shape=(operator.shape[0], len(nodes)))
+    return is_inside, nodes, operator
+
+
+_worker_mesh = None  # mesh of the worker processes
+
+
+def _init_worker(header):
+    global _worker_mesh
+    _worker_mesh = MeshInterpolator(header, True)
+
+
+def _worker_tile_operator(coords):
+    return tile_operator(_worker_mesh, *coords)
+
+
+def iter_tile_operators(header, tiles, x_coords, y_coords, nb_processes):
+    """Iterate over the tiles with their interpolation operators (computed in parallel if nb_processes > 1)"""
+    tiles_coords = ((x_coords[col:col + nb_cols], y_coords[row:row + nb_rows])
+                    for row, col, nb_rows, nb_cols in tiles)
+    if nb_processes > 1:
+        with Pool(nb_processes, initializer=_init_worker, initargs=(header,)) as pool:
+            # tiles are processed by batches to bound the number of operators in memory
+            for start in range(0, len(tiles), nb_processes):
+                batch = tiles[start:start + nb_processes]
+                yield from zip(batch, pool.map(_worker_tile_operator, islice(tiles_coords, len(batch))))
+    else:
+        mesh = MeshInterpolator(header, True)
+        for tile, coords in zip(tiles, tiles_coords):
+            yield tile, tile_operator(mesh, *coords)
 
 
 def slf_to_raster(args):
@@ -61,43 +121,91 @@ def slf_to_raster(args):
                 if var_ID in args.vars:
                     var_names.append(var_name.decode('utf-8'))
                     var_IDs.append(var_ID)
+        time_indices = list(range(header.nb_frames)) if args.all_frames else args.frame_index
 
         # Shift mesh coordinates if necessary
         if args.shift:
             header.transform_mesh([Transformation(0, 1, 1, args.shift[0], args.shift[1], 0)])
 
-        # Build output regular grid and matplotlib triangulation of the mesh
-        m_xi, m_yi = np.meshgrid(np.arange(header.x.min(), header.x.max(), args.resolution),
-                                 np.arange(header.y.min(), header.y.max(), args.resolution))
-        triang = mtri.Triangulation(header.x, header.y, triangles=header.ikle_2d - 1)
-
-        # Build mask to clip values where water depth is below Hmin_to_clip
-        if args.Hmin_to_clip is not None:
-            values = resin.read_var_in_frame(args.frame_index, WATER_DEPTH_ID)
-            interp = mtri.LinearTriInterpolator(triang, values)
-            data = interp(m_xi, m_yi)[::-1]  # reverse array so the tif looks like the array
-            with np.errstate(invalid='ignore'):
-                mask = data <= args.Hmin_to_clip
+        # Build output regular grid (rows are reversed so the tif looks like the array)
+        x_coords = np.arange(header.x.min(), header.x.max(), args.resolution)
+        y_coords = np.arange(header.y.min(), header.y.max(), args.resolution)[::-1]
+        nb_rows, nb_cols = len(y_coords), len(x_coords)
+        origin = header.x.min(), header.y.max()
+
+        # Water depth is read to build mask to clip values where it is below Hmin_to_clip
+        read_var_IDs = list(var_IDs)
+        if args.Hmin_to_clip is not None and WATER_DEPTH_ID not in read_var_IDs:
+            read_var_IDs.append(WATER_DEPTH_ID)
+
+        # Create output rasters: one band per variable and per frame, or one raster per frame
+        nb_vars = len(var_IDs)
+        if args.multi_frame_output == 'bands' or len(time_indices) == 1:
+            out_raster = create_raster(args.out_tif, origin, args.resolution, -args.resolution,
+                                       nb_rows, nb_cols, nb_vars * len(time_indices), args.epsg)
+            for i_frame, time_index in enumerate(time_indices):
+                for i_var, var_name in enumerate(var_names):
+                    description = var_name if len(time_indices) == 1 \
+                        else '%s (t=%g s)' % (var_name, resin.time[time_index])
+                    out_raster.GetRasterBand(i_frame * nb_vars + i_var + 1).SetDescription(description)
+            out_rasters = [(out_raster, i_frame * nb_vars) for i_frame in range(len(time_indices))]
         else:
-            mask = None
-
-        # Build list containing all interpolated variables on the regular grid
-        array_list = []
-        for i, (var_ID, var_name) in enumerate(zip(var_IDs, var_names)):
-            values = resin.read_var_in_frame(args.frame_index, var_ID)
-            interp = mtri.LinearTriInterpolator(triang, values)
-            data = interp(m_xi, m_yi)[::-1]  # reverse array so the tif looks like the array
-
-            if mask is not None:
-                data = np.where(mask, np.nan, data)
-
-            array_list.append((var_name, data))
-            logger.info("Min and max values for interpolated %s variable: [%f, %f]"
-                        % (var_name, np.nanmin(data), np.nanmax(data)))
-
-        # Write data in the raster output file
-        arrays2raster(args.out_tif, (header.x.min(), header.y.max()),
-                      args.resolution, -args.resolution, array_list, epsg=args.epsg)
+            out_rasters = []  # rasters are reopened when written (to limit the number of open files)
+            for time_index in time_indices:
+                raster_filename = frame_raster_filename(args.out_tif, time_index)
+                out_raster = create_raster(raster_filename, origin, args.resolution, -args.resolution,
+                                           nb_rows, nb_cols, nb_vars, args.epsg)
+                for i_var, var_name in enumerate(var_names):
+                    out_raster.GetRasterBand(i_var + 1).SetDescription(var_name)
+                out_raster = None  # close file
+                out_rasters.append((raster_filename, 0))
+
+        # Interpolate and write the rasters tile by tile: points of a tile are located once,
+        # every variable and frame is then interpolated by a sparse product (only the nodes of the tile are read)
+        tiles = list(grid_tiles(nb_rows, nb_cols, args.tile_size))
+        logger.info("Raster is processed in %i tile(s) of at most %i x %i cells"
+                    % (len(tiles), args.tile_size, args.tile_size))
+        # NaN values are ignored (min and max remain NaN if no cell is inside the mesh)
+        min_values = np.full((len(time_indices), nb_vars), np.nan)
+        max_values = np.full((len(time_indices), nb_vars), np.nan)
+        for (row, col, tile_rows, tile_cols), (is_inside, nodes, operator) in \
+                iter_tile_operators(header, tiles, x_coords, y_coords, args.nb_processes):
+            # frames are processed by blocks to bound the memory
+            block_size = max(1, settings.SERAFIN_BLOCK_MEMORY // (len(read_var_IDs) * tile_rows * tile_cols * 8))
+            for start_index in range(0, len(time_indices), block_size):
+                block_indices = time_indices[start_index:start_index + block_size]
+                interpolated = np.full((len(block_indices), len(read_var_IDs), tile_rows * tile_cols), np.nan)
+                if len(nodes) > 0:
+                    values = np.stack([resin.read_var_at_nodes(var_ID, nodes, block_indices)
+                                       for var_ID in read_var_IDs], axis=1)  # shape: (frames, variables, nodes)
+                    interpolated[:, :, is_inside] = operator.dot(values.reshape(-1, len(nodes)).T).T.reshape(
+                        len(block_indices), len(read_var_IDs), -1)[:, :, is_inside]
+                interpolated = interpolated.reshape(len(block_indices), len(read_var_IDs), tile_rows, tile_cols)
+
+                if args.Hmin_to_clip is not None:
+                    with np.errstate(invalid='ignore'):
+                        mask = interpolated[:, read_var_IDs.index(WATER_DEPTH_ID)] <= args.Hmin_to_clip
+                    interpolated = np.where(mask[:, np.newaxis], np.nan, interpolated)
+
+                for i, data in enumerate(interpolated[:, :nb_vars]):
+                    i_frame = start_index + i
+                    out_raster, first_band = out_rasters[i_frame]
+                    if isinstance(out_raster, str):  # raster of the frame, opened once per block
+                        out_raster = gdal.Open(out_raster, gdal.GA_Update)
+                    for i_var, array in enumerate(data):
+                        write_band(out_raster, first_band + i_var, None, array, col, row)
+                    out_raster = None  # close file (a raster with all the frames is kept open in out_rasters)
+                    data = data.reshape(nb_vars, -1)
+                    min_values[i_frame] = np.fmin(min_values[i_frame], np.fmin.reduce(data, axis=1))
+                    max_values[i_frame] = np.fmax(max_values[i_frame], np.fmax.reduce(data, axis=1))
+        out_raster, out_rasters = None, None  # close files
+
+        for i_frame, time_index in enumerate(time_indices):
+            for i_var, var_name in enumerate(var_names):
+                if len(time_indices) > 1:
+                    var_name = '%s (frame %i)' % (var_name, time_index)
+                logger.info("Min and max values for interpolated %s variable: [%f, %f]"
+                            % (var_name, min_values[i_frame, i_var], max_values[i_frame, i_var]))
 
 
 parser = PyTelToolsArgParse(description=__doc__, add_args=['in_slf', 'shift'])
@@ -105,10 +213,20 @@ parser.add_argument('out_tif', help='output GeoTIFF raster file (with .tif exten
 parser.add_argument('resolution', type=float, help='sampling space step (in meters)')
 parser.add_argument('--vars', nargs='+', help='variable(s) to extract (by default: every variables)', default=None,
                     metavar=('VA', 'VB'))
-parser.add_argument('--frame_index', type=int, help='index of the target temporal frame (0-indexed integer)', default=0)
+parser.add_argument('--frame_index', type=int, nargs='+',
+                    help='index(es) of the target temporal frame(s) (0-indexed integers)', default=[0])
+parser.add_argument('--all_frames', help='convert all the temporal frames (overrides --frame_index)',
+                    action='store_true')
+parser.add_argument('--multi_frame_output', choices=('bands', 'files'), default='bands',
+                    help='write multiple frames as additional bands of the output raster, '
+                         'or as one raster per frame (with the frame index as suffix)')
 parser.add_argument('--epsg', type=int, help='EPSG code for output file', default=None)
 parser.add_argument('--Hmin_to_clip', type=float,
                     help='set to NaN all values where water depth (H) is below this threshold', default=None)
+parser.add_argument('--tile_size', type=int, help='size of the square tiles processed at once (in number of cells)',
+                    default=1024)
+parser.add_argument('--nb_processes', type=int, help='number of processes to locate the tiles in the mesh',
+                    default=1)
 parser.add_group_general(['verbose'])
 
 
@@ -9,6 +9,7 @@ from tqdm import tqdm
 from pyteltools.conf import settings
 from pyteltools.geom import BlueKenue, Shapefile
 from pyteltools.slf import Serafin
+from pyteltools.slf.prefetch import PrefetchReader
 from pyteltools.slf.volume import VolumeCalculator
 from pyteltools.utils.cli_base import logger, PyTelToolsArgParse
 
@@ -71,20 +72,15 @@ def slf_volume(args):
         calculator.construct_triangles(tqdm)
         calculator.construct_weights(tqdm)
 
-        result = []
-        for time_index in tqdm(calculator.time_indices, unit='frame'):
-            i_result = [str(resin.time[time_index])]
-            values = calculator.read_values_in_frame(time_index)
-
-            for j in range(len(calculator.polygons)):
-                weight = calculator.weights[j]
-                volume = calculator.volume_in_frame_in_polygon(weight, values, calculator.polygons[j])
-                if calculator.volume_type == VolumeCalculator.POSITIVE:
-                    for v in volume:
-                        i_result.append(settings.FMT_FLOAT.format(v))
-                else:
-                    i_result.append(settings.FMT_FLOAT.format(volume))
-            result.append(i_result)
+        if args.nb_processes > 1:
+            result = calculator.run(settings.FMT_FLOAT, args.nb_processes)
+        else:
+            result = []
+            with PrefetchReader(resin, calculator.time_indices, calculator.get_read_var_IDs()) as input_stream:
+                for time_index in tqdm(calculator.time_indices, unit='frame'):
+                    values = calculator.read_values_in_frame(time_index, input_stream)
+                    volumes = calculator.volumes_in_frame(values)
+                    result.append(calculator.format_volumes(time_index, volumes, settings.FMT_FLOAT))
 
         # Write CSV
         mode = 'w' if args.force else 'x'
@@ -98,6 +94,8 @@ parser.add_argument('--ech', type=int, help='frequency sampling of input', defau
 parser.add_argument('--upper_var', help='upper variable', metavar='VA', required=True)
 parser.add_argument('--lower_var', help='lower variable', metavar='VB', default=None)
 parser.add_argument('--detailed', help='add positive and negative volumes', action='store_true')
+parser.add_argument('--nb_processes', type=int, help='number of processes (the frames are split in chunks)',
+                    default=1)
 
 parser.add_known_argument('out_csv')
 parser.add_group_general(['force', 'verbose'])
@@ -2,6 +2,7 @@
 Update node numbering in a file describing culverts
 """
 
+import numpy as np
 import sys
 
 from pyteltools.conf import settings
@@ -15,17 +16,20 @@ def update_culverts_file(args):
     with Serafin.Read(args.in_slf_new, args.lang) as mesh_new:
         mesh_new.read_header()
     with open(args.in_txt, 'r') as in_txt:
-        with open(args.out_txt, 'w', newline='') as out_txt:
-            for i, line in enumerate(in_txt):
-                if i < 3:
-                    out_txt.write(line)
-                else:
-                    n1_ori, n2_ori, txt = line.split(maxsplit=2)
-                    n1_new = mesh_new.header.nearest_node(mesh_ori.header.x[int(n1_ori) - 1],
-                                                          mesh_ori.header.y[int(n1_ori) - 1])
-                    n2_new = mesh_new.header.nearest_node(mesh_ori.header.x[int(n2_ori) - 1],
-                                                          mesh_ori.header.y[int(n2_ori) - 1])
-                    out_txt.write('%i %i %s' % (n1_new, n2_new, txt))
+        lines = in_txt.readlines()
+    culverts = [line.split(maxsplit=2) for line in lines[3:]]
+
+    # Nearest nodes of both culvert ends are found in a single query
+    nodes_ori = np.array([(int(n1_ori), int(n2_ori)) for n1_ori, n2_ori, _ in culverts], dtype=np.int64).reshape(-1)
+    points = np.column_stack((mesh_ori.header.x[nodes_ori - 1], mesh_ori.header.y[nodes_ori - 1]))
+    nodes_new, _ = mesh_new.header.nearest_nodes(points)
+    nodes_new = nodes_new.reshape(-1, 2)
+
+    with open(args.out_txt, 'w', newline='') as out_txt:
+        for line in lines[:3]:
+            out_txt.write(line)
+        for (n1_new, n2_new), (_, __, txt) in zip(nodes_new, culverts):
+            out_txt.write('%i %i %s' % (n1_new, n2_new, txt))
 
 
 parser = PyTelToolsArgParse(description=__doc__, add_args=[])
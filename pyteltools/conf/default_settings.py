@@ -1,6 +1,7 @@
 from collections import OrderedDict
 import logging
 from multiprocessing import cpu_count
+import os
 
 
 # ~> GENERAL CONFIGURATION
@@ -33,6 +34,35 @@ SERAFIN_EXT = ['.srf', '.slf', '.res', '.geo']
 # Language (for variables detection)
 LANG = 'fr'
 
+# Read frame values through a memory-mapped view of the file (buffered reads are used otherwise)
+SERAFIN_MMAP = True
+
+# Use the node-major cache (sidecar folder `*.nodes`, see `slf_node_cache.py`) for time series queries if present
+SERAFIN_NODE_CACHE = True
+
+# Memory budget (in bytes) for a block of frames read at once (see `Serafin.Read.iter_frame_blocks`)
+SERAFIN_BLOCK_MEMORY = 256 * 1024 ** 2
+
+# Number of frames read in advance by a background thread in calculators (0 to disable, see `slf/prefetch.py`)
+SERAFIN_PREFETCH_FRAMES = 4
+
+# Memory budget (in bytes) for the decompressed chunks kept by `slf.chunked.ChunkedRead`
+# (the chunks of all variables in a time window are always kept)
+SERAFIN_CHUNK_CACHE_MEMORY = 512 * 1024 ** 2
+
+# Cache of parsed headers and time series (see `slf/header_cache.py`)
+# (always used by the multi-folder workflow, used everywhere else if True)
+SERAFIN_HEADER_CACHE = False
+SERAFIN_HEADER_CACHE_FOLDER = os.path.join(os.path.expanduser('~'), '.pyteltools', 'header_cache')
+SERAFIN_HEADER_CACHE_MAX_SIZE = 1024 ** 3  # in bytes
+
+# Cache of mesh spatial indexes (see `slf/index_cache.py`), only for meshes with at least MIN_ELEMENTS triangles
+# (always used by the multi-folder workflow, used everywhere else if True)
+SERAFIN_INDEX_CACHE = False
+SERAFIN_INDEX_CACHE_FOLDER = os.path.join(os.path.expanduser('~'), '.pyteltools', 'index_cache')
+SERAFIN_INDEX_CACHE_MAX_SIZE = 4 * 1024 ** 3  # in bytes
+SERAFIN_INDEX_CACHE_MIN_ELEMENTS = 100000
+
 # ~> INPUTS/OUTPUTS
 
 # Format to write float values (in CSV, LandXML, VTK)
@@ -3,6 +3,7 @@ Geometrical objects
 """
 
 import numpy as np
+import shapely
 from shapely.geometry import Point, MultiPolygon, LineString as OpenPolyline, Polygon as ClosedPolyline
 
 
@@ -197,3 +198,34 @@ class Polyline:
 
     def __repr__(self):
         return "%sPolyline with %i vertices" % ('Closed ' if self.is_closed() else '', len(self.coords()))
+
+
+def points_in_polygons(x, y, polygons, keep_last=False):
+    """!
+    @brief Find the polygon containing every point (vectorized, with a bounding box prefilter)
+    @param x <numpy 1D-array>: abscissas of the points
+    @param y <numpy 1D-array>: ordinates of the points
+    @param polygons <[Polyline or shapely.geometry.Polygon]>: polygons (holes are supported)
+    @param keep_last <bool>: if a point is inside several polygons, select the last one instead of the first one
+    @return <numpy 1D-array>: index of the polygon containing every point (-1 if outside all polygons).
+        As for `shapely` contains, points on the boundary are not inside the polygon.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    polygon_indices = np.full(x.shape, -1, dtype=np.int64)
+    order = np.argsort(x, kind='stable')
+    sorted_x = x[order]
+    for index, polygon in enumerate(polygons):
+        if isinstance(polygon, Polyline):
+            polygon = polygon.polyline()
+        if polygon.is_empty:
+            continue
+        xmin, ymin, xmax, ymax = polygon.bounds
+        candidates = order[np.searchsorted(sorted_x, xmin, side='left'):np.searchsorted(sorted_x, xmax, side='right')]
+        candidates = candidates[(y[candidates] >= ymin) & (y[candidates] <= ymax)]
+        if not keep_last:
+            candidates = candidates[polygon_indices[candidates] < 0]
+        if candidates.size > 0:
+            is_inside = shapely.contains_xy(polygon, x[candidates], y[candidates])
+            polygon_indices[candidates[is_inside]] = index
+    return polygon_indices
@@ -43,20 +43,9 @@ class VolumeCalculatorThread(OutputThread):
         for time_index in iter_pbar(self.calculator.time_indices):
             if self.canceled:
                 return []
-            i_result = [str(self.calculator.input_stream.time[time_index])]
             values = self.calculator.read_values_in_frame(time_index)
-
-            for j in range(len(self.calculator.polygons)):
-                if self.canceled:
-                    return []
-                weight = self.calculator.weights[j]
-                volume = self.calculator.volume_in_frame_in_polygon(weight, values, self.calculator.polygons[j])
-                if self.calculator.volume_type == VolumeCalculator.POSITIVE:
-                    for v in volume:
-                        i_result.append(self.fmt_float.format(v))
-                else:
-                    i_result.append(self.fmt_float.format(volume))
-            result.append(i_result)
+            volumes = self.calculator.volumes_in_frame(values)
+            result.append(self.calculator.format_volumes(time_index, volumes, self.fmt_float))
 
         return result
 
@@ -9,6 +9,7 @@ import sys
 
 from pyteltools.conf import settings
 from pyteltools.slf import Serafin
+from pyteltools.slf.interpolation import MeshInterpolator
 
 from .util import LoadMeshDialog, MapViewer, MapCanvas, open_points, OutputProgressDialog, OutputThread, \
     PointAttributeTable, PointLabelEditor, PointPlotViewer, ProgressBarIterator, PyTelToolWidget, read_csv, \
@@ -31,29 +32,28 @@ class WriteCSVProcess(OutputThread):
                                                              settings.FMT_COORD.format(y)))
         output_stream.write('\n')
 
-    def write_csv(self, input_stream, output_time, selected_vars, output_stream, indices,
+    def write_csv(self, input_stream, time_indices, selected_vars, output_stream, indices,
                   points, point_interpolators):
         self.write_header(output_stream, selected_vars, indices, points)
 
         nb_selected_vars = len(selected_vars)
-        # nb_frames = len(output_time)
 
-        iter_pbar = ProgressBarIterator.prepare(self.tick.emit)
-        for index, time in enumerate(iter_pbar(output_time)):
+        # frames are interpolated by blocks when they are iterated
+        var_values = MeshInterpolator.iter_interpolate_on_points(input_stream, selected_vars, time_indices,
+                                                                 point_interpolators)
+
+        iter_pbar = ProgressBarIterator.prepare(self.tick.emit, length=len(time_indices))
+        for time_index, values in iter_pbar(zip(time_indices, var_values)):
             if self.canceled:
                 return
-            output_stream.write(str(time))
-
-            var_values = []
-            for var in selected_vars:
-                var_values.append(input_stream.read_var_in_frame(index, var))
+            output_stream.write(str(input_stream.time[time_index]))
 
-            for (i, j, k), interpolator in point_interpolators:
+            for index_point in range(len(point_interpolators)):
                 if self.canceled:
                     return
                 for index_var in range(nb_selected_vars):
                     output_stream.write(self.separator)
-                    output_stream.write(self.fmt_float.format(interpolator.dot(var_values[index_var][[i, j, k]])))
+                    output_stream.write(self.fmt_float.format(values[index_var, index_point]))
 
             output_stream.write('\n')
 
@@ -359,7 +359,7 @@ class InputTab(SerafinInputTab):
 
 
         sampling_frequency = int(self.timeSampling.text())
-        selected_time = self.data.time[::sampling_frequency]
+        time_indices = list(range(0, len(self.data.time), sampling_frequency))
         indices_inside = [i for i in range(len(self.points)) if self.point_interpolators[i] is not None]
 
         # initialize the progress bar
@@ -376,7 +376,7 @@ class InputTab(SerafinInputTab):
 
                 with open(filename, 'w') as output_stream:
                     progressBar.connectToThread(process)
-                    process.write_csv(input_stream, selected_time, selected_var_IDs, output_stream,
+                    process.write_csv(input_stream, time_indices, selected_var_IDs, output_stream,
                                       indices_inside,
                                       [self.points[i] for i in indices_inside],
                                       [self.point_interpolators[i] for i in indices_inside])
@@ -14,7 +14,6 @@ from PyQt5.QtWidgets import (QAbstractItemView, QAction, QApplication, QCheckBox
                              QTableWidget, QTableWidgetItem, QTextEdit, QTreeView, QToolBar, QToolTip,
                              QVBoxLayout, QWidget)
 from shapefile import ShapefileException
-import shapely
 
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT
@@ -834,8 +833,9 @@ class TimeRangeSlider(QSlider):
         try:
             start_value = float(self.info.startValue.text())
             end_value = float(self.info.endValue.text())
-            start_index = self.info.parent.time.index(start_value) + 1
-            end_index = self.info.parent.time.index(end_value) + 1
+            time = list(self.info.parent.time)
+            start_index = time.index(start_value) + 1
+            end_index = time.index(end_value) + 1
         except ValueError:
             self.info.updateText(self._low, self.time_frames[self._low].total_seconds(), self.low(),
                                  self._high, self.time_frames[self._high].total_seconds(), self.high())
@@ -1185,12 +1185,15 @@ class ConstructIndexThread(OutputThread):
         logging.info('Processing the mesh')
 
         iter_pbar = ProgressBarIterator.prepare(self.tick.emit)
-        for i, j, k in iter_pbar(self.mesh.ikle):
-            if self.canceled:
-                return
-            t = shapely.geometry.Polygon([self.mesh.points[i], self.mesh.points[j], self.mesh.points[k]])
-            self.mesh.triangles[i, j, k] = t
-            self.mesh.index.insert(i, t.bounds, obj=(i, j, k))
+
+        def iter_steps(steps, unit):
+            for step in iter_pbar(steps, unit):
+                if self.canceled:
+                    return
+                yield step
+
+        # Vectorized construction (or read from the index cache)
+        self.mesh._construct_index(iter_steps)
 
 
 class LoadMeshDialog(OutputProgressDialog):
@@ -9,8 +9,10 @@ The sizes (file, header, frame) are in bytes (8 bits).
 """
 
 import copy
+import mmap
 import numpy as np
 import os
+from scipy.spatial import cKDTree
 from shapely.geometry import LinearRing
 import struct
 
@@ -18,12 +20,16 @@ from pyteltools.conf import settings
 from pyteltools.slf.variable.variables_2d import VARIABLES_2D
 from pyteltools.slf.variable.variables_3d import VARIABLES_3D
 
-from .util import logger
+from .transposed import TransposedCache
+from .util import logger, mesh_fingerprint
 
 
 # Encoding Information Type (EIT) for Serafin title, variable names and units
 SLF_EIT = 'iso-8859-1'
 
+# Header attributes which are read on first access for a lazy header (see `SerafinHeader.from_file`)
+LAZY_MESH_ATTRIBUTES = ('x_stored', 'y_stored', 'x', 'y', 'ikle', 'ikle_2d', 'ipobo')
+
 
 VARIABLES_ID_2D, VARIABLES_ID_3D = {'fr': {}, 'en': {}}, {'fr': {}, 'en': {}}
 
@@ -173,10 +179,33 @@ class SerafinHeader:
         self.ikle_2d = None
         self.ipobo = None
 
+        self._lazy_mesh = None  # (path, offset) of the mesh arrays not loaded yet (set by `from_file`)
+        self._kdtree = None  # KD-tree of the horizontal coordinates (built by `nearest_nodes`)
+        self._mesh_fingerprint = None  # content hash of the 2D mesh (see `mesh_fingerprint`)
+
+    def __getattr__(self, name):
+        # Only called if the attribute is not found: mesh arrays of a lazy header are loaded on first access
+        if name in LAZY_MESH_ATTRIBUTES and self.__dict__.get('_lazy_mesh') is not None:
+            self._load_mesh()
+            return getattr(self, name)
+        raise AttributeError("'%s' object has no attribute '%s'" % (type(self).__name__, name))
+
     @property
     def np_type(self):
         return np.dtype(self.np_float_type).newbyteorder(self.endian)
 
+    @property
+    def np_frame_type(self):
+        """!
+        @brief Structured type of a whole frame (time and values of all variables) with its record markers
+        (its itemsize is equal to `frame_size`)
+        """
+        int_type = np.dtype(np.int32).newbyteorder(self.endian)
+        var_type = np.dtype([('marker_start', int_type), ('values', self.np_type, (self.nb_nodes,)),
+                             ('marker_end', int_type)])
+        return np.dtype([('time_marker_start', int_type), ('time', self.np_type), ('time_marker_end', int_type),
+                         ('vars', var_type, (self.nb_var,))])
+
     def _check_dim(self):
         # verify data consistence and determine 2D or 3D
         if self.is_2d:
@@ -221,6 +250,7 @@ class SerafinHeader:
         )
 
     def _build_ikle_2d(self):
+        self._mesh_fingerprint = None
         if self.is_2d:
             self.ikle_2d = self.ikle.reshape(self.nb_elements, self.nb_nodes_per_elem)
         else:
@@ -301,6 +331,8 @@ class SerafinHeader:
         else:
             self.x = self.x_stored
             self.y = self.y_stored
+        self._kdtree = None
+        self._mesh_fingerprint = None
 
     def _set_header_size(self):
         """Set header size"""
@@ -359,6 +391,7 @@ class SerafinHeader:
         new_header.x_stored = self.x_stored[:self.nb_nodes_2d]
         new_header.y_stored = self.y_stored[:self.nb_nodes_2d]
         new_header._compute_mesh_coordinates()
+        new_header._mesh_fingerprint = self.__dict__.get('_mesh_fingerprint')  # same 2D mesh
 
         # Update sizes
         new_header._set_header_size()
@@ -406,6 +439,7 @@ class SerafinHeader:
         new_header.x_stored = np.tile(self.x_stored, nb_planes)
         new_header.y_stored = np.tile(self.y_stored, nb_planes)
         new_header._compute_mesh_coordinates()
+        new_header._mesh_fingerprint = self.__dict__.get('_mesh_fingerprint')  # same 2D mesh
 
         # Update sizes
         new_header._set_header_size()
@@ -421,8 +455,40 @@ class SerafinHeader:
         @param target_y <float>: north target coordinate
         @return <int>: node number (1-indexed)
         """
-        dist = np.sqrt(np.power(self.x - target_x, 2) + np.power(self.y - target_y, 2))
-        return np.argmin(dist) + 1
+        nodes, _ = self.nearest_nodes(np.array([[target_x, target_y]]))
+        return nodes[0]
+
+    def nearest_nodes(self, points, k=1, max_distance=None, plane=0):
+        """!
+        @brief Find the nearest nodes of multiple target points (with a KD-tree built once per mesh)
+        @param points <numpy 2D-array>: x and y coordinates of the target points (shape: (N, 2))
+        @param k <int>: number of nearest nodes for every target point
+        @param max_distance <float>: maximum distance to the target point (no limit if None)
+        @param plane <int>: index of the plane for a 3D mesh (0-based, the first plane by default)
+        @return <numpy array, numpy array>: node numbers (1-indexed, 0 if no node is found within max_distance)
+            and distances (inf if no node is found), with shape (N,) if k = 1 and (N, k) otherwise
+        """
+        if not 0 <= plane < max(1, self.nb_planes):
+            raise SerafinRequestError('Plane index should be inside [0, %i]' % (max(1, self.nb_planes) - 1))
+        if getattr(self, '_kdtree', None) is None:  # not set for headers pickled by older versions
+            self._kdtree = cKDTree(np.column_stack((self.x[:self.nb_nodes_2d], self.y[:self.nb_nodes_2d])))
+        distances, indices = self._kdtree.query(np.asarray(points, dtype=np.float64).reshape(-1, 2), k=k,
+                                                distance_upper_bound=np.inf if max_distance is None else max_distance)
+        is_found = indices < self.nb_nodes_2d
+        nodes = np.where(is_found, indices + 1 + plane * self.nb_nodes_2d, 0)
+        return nodes, distances
+
+    @property
+    def mesh_fingerprint(self):
+        """!
+        @brief Content hash of the 2D mesh (coordinates and connectivity table), computed on first access
+        and kept by copies and pickling
+        @return <str>: hexadecimal digest
+        """
+        if self.__dict__.get('_mesh_fingerprint') is None:
+            self._mesh_fingerprint = mesh_fingerprint(self.x[:self.nb_nodes_2d], self.y[:self.nb_nodes_2d],
+                                                      self.ikle_2d)
+        return self._mesh_fingerprint
 
     def same_2d_mesh(self, other):
         """!
@@ -433,12 +499,7 @@ class SerafinHeader:
         # Speedup in comparing by increasing complexity
         if self.nb_nodes_2d != other.nb_nodes_2d or self.nb_elements != other.nb_elements:
             return False
-        elif np.all(self.x_stored != other.x_stored) or np.all(self.y_stored != other.y_stored):
-            return False
-        elif np.all(self.ikle != other.ikle) or np.all(self.ipobo != other.ipobo):
-            return False
-        else:
-            return True
+        return self.mesh_fingerprint == other.mesh_fingerprint
 
     def is_double_precision(self):
         return self.float_type == 'd'
@@ -562,21 +623,18 @@ class SerafinHeader:
 
     def get_all_edges(self):
         """Get all edges (pair of nodes)"""
-        edges = np.zeros((3 * len(self.ikle_2d), 2), dtype=np.int64)
-        for i, (n1, n2, n3) in enumerate(self.ikle_2d):
-            edges[3 * i, :] = [n1, n2]
-            edges[3 * i + 1, :] = [n2, n3]
-            edges[3 * i + 2, :] = [n3, n1]
-        return edges
+        # Edges (n1, n2), (n2, n3) and (n3, n1) of every element
+        return self.ikle_2d[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2).astype(np.int64)
 
     def get_external_edges(self):
         """Get external edges (pair of nodes)"""
         edges = self.get_all_edges()
-        # Trick to identify unique pair of nodes (even if node orders might differ) in defining a strange function
-        edges_multi = edges[:, 0] * edges[:, 1] / (edges[:, 0] + edges[:, 1])
-        unique, unique_inverse, unique_counts = np.unique(edges_multi, return_inverse=True, return_counts=True)
+        # Identify unique pair of nodes (even if node orders might differ) with sorted pairs
+        sorted_edges = np.sort(edges, axis=1)
+        edges_key = sorted_edges[:, 0] * (sorted_edges[:, 1].max(initial=0) + 1) + sorted_edges[:, 1]
+        unique, unique_inverse, unique_counts = np.unique(edges_key, return_inverse=True, return_counts=True)
         # A boundary node is connected only once to another node (not twice!)
-        boundary_edges = edges[unique_counts[unique_inverse] == 1]
+        boundary_edges = edges[unique_counts[unique_inverse.reshape(-1)] == 1]
         return boundary_edges
 
     def iter_on_boundaries(self):
@@ -592,30 +650,49 @@ class SerafinHeader:
         - the first boundary node should be the node with the minimum value of x+y (corresponds to the bottom left corner)
         """
         boundary_edges = self.get_external_edges()
+        nb_edges = len(boundary_edges)
+
+        # Edges connected to each node (sorted by edge index), stored in `node_edges[node_start[n]:node_start[n+1]]`
+        edge_ends = boundary_edges.reshape(-1)
+        order = np.argsort(edge_ends, kind='stable')
+        node_edges = order // 2
+        node_start = np.searchsorted(edge_ends[order], np.arange(self.nb_nodes_2d + 2))
+        node_next_edge = node_start[:-1].copy()  # position of the first edge which might not be used yet
+        node_degree = np.diff(node_start)  # number of unused edges
+        is_used = np.zeros(nb_edges, dtype=bool)
+
+        # Candidate first nodes sorted by increasing x+y
+        boundary_nodes = np.unique(edge_ends)  # Node numbering 1-indexed
+        x_plus_y = self.x[boundary_nodes - 1] + self.y[boundary_nodes - 1]
+        candidate_first_nodes = boundary_nodes[np.argsort(x_plus_y, kind='stable')]
+        pos_candidate = 0
 
         # Build boundaries by iteration on all boundary edges (for each boundary, from first node until it loops)
         id_boundary = 1
-        while len(boundary_edges) != 0:
-            boundary_nodes = np.unique(boundary_edges.flatten())  # Node numbering 1-indexed
-            x_plus_y = self.x[boundary_nodes - 1] + self.y[boundary_nodes - 1]
-
+        nb_used_edges = 0
+        while nb_used_edges != nb_edges:
             # current_boundary_nodes, first_node, prev_node and next_node contain 1-indexed node(s)
-            first_node = boundary_nodes[np.argmin(x_plus_y)]
-            logger.debug("Build new boundary from node %i among %i nodes" % (first_node, len(boundary_nodes)))
-            prev_node = copy.deepcopy(first_node)
+            while node_degree[candidate_first_nodes[pos_candidate]] == 0:
+                pos_candidate += 1
+            first_node = candidate_first_nodes[pos_candidate]
+            logger.debug("Build new boundary from node %i" % first_node)
+            prev_node = first_node
             next_node = -1
 
             # Build list of nodes describing the boundary (/!\ first and last node are explicitly duplicated):
             current_boundary_nodes = [first_node]
             while next_node != first_node:
-                try:
-                    index = np.where(boundary_edges == prev_node)[0][0]
-                except IndexError:
-                    logger.critical(np.where(boundary_edges == prev_node))
+                if node_degree[prev_node] == 0:
                     raise SerafinRequestError('Unexpected error while determining next boundary node after node %i'
                                               % prev_node)
+                while is_used[node_edges[node_next_edge[prev_node]]]:
+                    node_next_edge[prev_node] += 1
+                index = node_edges[node_next_edge[prev_node]]
+                is_used[index] = True
+                nb_used_edges += 1
                 n1, n2 = boundary_edges[index, :]
-                boundary_edges = np.delete(boundary_edges, index, axis=0)
+                node_degree[n1] -= 1
+                node_degree[n2] -= 1
                 next_node = n1 if n2 == prev_node else n2
                 prev_node = next_node
                 current_boundary_nodes.append(next_node)
@@ -649,9 +726,9 @@ class SerafinHeader:
         try:
             id_boundary_node = 0
             for boundary_nodes in self.iter_on_boundaries():
-                for n in boundary_nodes:
-                    id_boundary_node += 1
-                    ipobo_2d[n - 1] = id_boundary_node
+                ipobo_2d[np.array(boundary_nodes) - 1] = np.arange(id_boundary_node + 1,
+                                                                    id_boundary_node + len(boundary_nodes) + 1)
+                id_boundary_node += len(boundary_nodes)
 
             self.ipobo = ipobo_2d
             if not self.is_2d:
@@ -698,10 +775,58 @@ class SerafinHeader:
                 raise SerafinValidationError("IPOBO table is not a 1D-array with length of %i." % len(nodes))
             self.ipobo = ipobo
 
-    def from_file(self, file, file_size):
+    def _read_mesh(self, file):
+        """!
+        @brief Read IKLE, IPOBO and coordinates arrays (the file has to be positioned at the IKLE record)
+        @param file <_io.BufferedReader>: input Serafin stream
+        @return <tuple>: ikle, ipobo, x_stored and y_stored arrays
+        """
+        file.read(4)
+        nb_ikle_values = self.nb_elements * self.nb_nodes_per_elem
+        ikle = np.frombuffer(file.read(4 * nb_ikle_values), dtype=np.dtype(np.int32).newbyteorder(self.endian))
+        file.read(4)
+
+        file.read(4)
+        ipobo = np.frombuffer(file.read(4 * self.nb_nodes), dtype=np.dtype(np.int32).newbyteorder(self.endian))
+        # A valid IPOBO should not be equal to zero array
+        if not np.any(ipobo):
+            logger.warning('The IPOBO array seems corrupted (zeros array). Try to rebuild it with `build_ipobo()`.')
+        file.read(4)
+
+        coord_size = self.nb_nodes * self.float_size
+        file.read(4)
+        x_stored = np.frombuffer(file.read(coord_size), dtype=self.np_type)
+        file.read(4)
+        file.read(4)
+        y_stored = np.frombuffer(file.read(coord_size), dtype=self.np_type)
+        file.read(4)
+        return ikle, ipobo, x_stored, y_stored
+
+    def _load_mesh(self):
+        """!
+        @brief Load the mesh arrays of a lazy header from the input file
+            (attributes which were already set are kept)
+        """
+        filename, offset = self._lazy_mesh
+        self._lazy_mesh = None
+        logger.debug('Loading mesh arrays from "%s"' % filename)
+        with open(filename, 'rb') as file:
+            file.seek(offset, 0)
+            arrays = self._read_mesh(file)
+        for name, array in zip(('ikle', 'ipobo', 'x_stored', 'y_stored'), arrays):
+            if name not in self.__dict__:
+                self.__dict__[name] = array
+        if 'x' not in self.__dict__ and 'y' not in self.__dict__:
+            self._compute_mesh_coordinates()
+        if 'ikle_2d' not in self.__dict__:
+            self._build_ikle_2d()
+
+    def from_file(self, file, file_size, lazy=False):
         """!
         @param file <_io.BufferedReader>: input Serafin stream
         @param file_size <int>: file size (in bytes)
+        @param lazy <bool>: defer the reading of mesh arrays (IKLE, IPOBO and coordinates) to their first access
+            (only for a stream opened from a file path)
         @return <slf.Serafin.SerafinHeader>: output Serafin header
         """
         # Check if file is empty (usefull if re-runs after a crash)
@@ -785,34 +910,15 @@ class SerafinHeader:
         else:
             self.nb_nodes_2d = self.nb_nodes // self.nb_planes
 
-        # IKLE
-        file.read(4)
-        nb_ikle_values = self.nb_elements * self.nb_nodes_per_elem
-        self.ikle = np.frombuffer(file.read(4 * nb_ikle_values),
-                                  dtype=np.dtype(np.int32).newbyteorder(self.endian))
-        file.read(4)
-
-        # IPOBO
-        file.read(4)
-        self.ipobo = np.frombuffer(file.read(4 * self.nb_nodes),
-                                   dtype=np.dtype(np.int32).newbyteorder(self.endian))
-        # A valid IPOBO should not be equal to zero array
-        if not np.any(self.ipobo):
-            logger.warning('The IPOBO array seems corrupted (zeros array). Try to rebuild it with `build_ipobo()`.')
-        file.read(4)
-
-        # x coordinates
-        file.read(4)
-        coord_size = self.nb_nodes * self.float_size
-        self.x_stored = np.frombuffer(file.read(coord_size), dtype=self.np_type)
-        file.read(4)
-
-        # y coordinates
-        file.read(4)
-        self.y_stored = np.frombuffer(file.read(coord_size), dtype=self.np_type)
-        file.read(4)
-
-        self._compute_mesh_coordinates()
+        # IKLE, IPOBO, x and y coordinates
+        lazy = lazy and isinstance(getattr(file, 'name', None), str)
+        if lazy:
+            self._lazy_mesh = os.path.abspath(file.name), file.tell()
+            for name in LAZY_MESH_ATTRIBUTES:
+                del self.__dict__[name]
+        else:
+            self.ikle, self.ipobo, self.x_stored, self.y_stored = self._read_mesh(file)
+            self._compute_mesh_coordinates()
 
         # Compute and set header and frame sizes
         self._set_header_size()
@@ -842,7 +948,8 @@ class SerafinHeader:
                 var_id = var_table[name]
             self.var_IDs.append(var_id)
 
-        self._build_ikle_2d()
+        if not lazy:
+            self._build_ikle_2d()
 
         logger.debug('Finished reading the header')
         return self
@@ -882,19 +989,35 @@ class Read(Serafin):
 
     # Additional attributes:
     - header <SerafinHeader>: Serafin header
-    - time <[float]>: time series in seconds
+    - time <numpy 1D-array>: time series in seconds
+    - use_mmap <bool>: read frame values through a memory-mapped view of the file
+    - use_node_cache <bool>: use the node-major cache (if present and up to date) for time series queries
     """
-    def __init__(self, filename, language):
+    def __init__(self, filename, language, use_mmap=None, use_node_cache=None):
         """!
         @param filename <str>: path to input Serafin file
         @param language <str>: Serafin variable name language ('fr' or 'en')
+        @param use_mmap <bool>: use memory-mapped reads (default value is given by `settings.SERAFIN_MMAP`)
+        @param use_node_cache <bool>: use node cache (default value is given by `settings.SERAFIN_NODE_CACHE`)
         """
         super().__init__(filename, 'rb', language)
         self.header = None
-        self.time = []
+        self.time = np.empty(0, dtype=np.float64)
         self.file_size = os.path.getsize(self.filename)
+        self.use_mmap = settings.SERAFIN_MMAP if use_mmap is None else use_mmap
+        self._mmap = None  # <mmap.mmap>: memory map of the file (set by `_map_file`)
+        self._mmap_header = None  # header used to build the memory-mapped views
+        self._values = None  # <numpy 3D-array>: memory-mapped values (set by `_map_file`)
+        self._time_values = None  # <numpy 1D-array>: memory-mapped times (set by `_map_file`)
+        self.use_node_cache = settings.SERAFIN_NODE_CACHE if use_node_cache is None else use_node_cache
+        self._node_cache = None  # <slf.transposed.TransposedCache> (set by `_get_node_cache`)
         logger.info('Reading the input file: "%s" of size %d bytes' % (filename, self.file_size))
 
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._close_mmap()
+        self._node_cache = None
+        return super().__exit__(exc_type, exc_val, exc_tb)
+
     def unpack_array(self, size, np_type):
         """!
         @brief Interpret the buffer file as a 1-dimensional array
@@ -903,12 +1026,13 @@ class Read(Serafin):
         """
         return np.frombuffer(self.file.read(size), dtype=np_type)
 
-    def read_header(self):
+    def read_header(self, lazy=False):
         """!
         @brief Read the file header and check the file consistency
+        @param lazy <bool>: defer the reading of mesh arrays (IKLE, IPOBO and coordinates) to their first access
         """
         self.header = SerafinHeader(lang=self.language)
-        self.header.from_file(self.file, self.file_size)
+        self.header.from_file(self.file, self.file_size, lazy)
 
     def get_time(self):
         """!
@@ -917,12 +1041,23 @@ class Read(Serafin):
         if self.header is None:
             raise SerafinRequestError('Cannot read time without any header (forgot read_header ?)')
         logger.debug('Reading the time series from the file')
+        if self.use_mmap:
+            self._map_file()
+        if self._time_values is not None:
+            # Single strided gather (only one value per frame is touched)
+            self.time = self._time_values.astype(np.float64)
+            return
+        # Frames are read by blocks (a single read if they fit in the memory budget) and viewed with a strided type
+        time_type = np.dtype({'names': ['time'], 'formats': [self.header.np_type], 'offsets': [4],
+                              'itemsize': self.header.frame_size})
+        block_size = max(1, settings.SERAFIN_BLOCK_MEMORY // max(1, self.header.frame_size))
+        time = np.empty(self.header.nb_frames, dtype=np.float64)
         self.file.seek(self.header.header_size, 0)
-        for _ in range(self.header.nb_frames):
-            self.file.read(4)
-            self.time.append(self.header.unpack_float(self.file.read(self.header.float_size), 1)[0])
-            self.file.read(4)
-            self.file.seek(self.header.frame_size - 8 - self.header.float_size, 1)
+        for start_index in range(0, self.header.nb_frames, block_size):
+            nb_frames = min(block_size, self.header.nb_frames - start_index)
+            frames = np.frombuffer(self.file.read(nb_frames * self.header.frame_size), dtype=time_type)
+            time[start_index:start_index + nb_frames] = frames['time']
+        self.time = time
 
     def subset_time(self, start, end, ech):
         """!
@@ -930,14 +1065,12 @@ class Read(Serafin):
         @param start <float>: starting time (in seconds)
         @param end <float>: ending time (in seconds)
         @param ech <int>: sampling frequency
-        @return <[float]>: sampled time serie
+        @return <[(int, float)]>: sampled time serie (with time indices)
         """
-        new_time = []
-        for time_index, time in enumerate(self.time):
-            if start <= time <= end:
-                if time_index % ech == 0:
-                    new_time.append((time_index, time))
-        return new_time
+        time = np.asarray(self.time, dtype=np.float64)
+        time_indices = np.flatnonzero((time >= start) & (time <= end))
+        time_indices = time_indices[time_indices % ech == 0]
+        return list(zip(time_indices.tolist(), time[time_indices].tolist()))
 
     def _get_var_index(self, var_ID):
         """!
@@ -953,6 +1086,70 @@ class Read(Serafin):
             raise SerafinRequestError('Variable ID %s not found' % var_ID)
         return index
 
+    def _map_file(self):
+        """!
+        @brief Map the whole file in memory and build strided views of all frame times and values
+            (record markers are skipped). Views are rebuilt only if the header has changed.
+        Falls back to buffered reads (by disabling `use_mmap`) if the file can not be mapped
+        """
+        header = self.header
+        if self._mmap_header is header:
+            return
+        self._close_mmap()
+        self._mmap_header = header
+        if header.nb_frames == 0:
+            return
+        try:
+            self._mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            raw = np.frombuffer(self._mmap, dtype=np.uint8)
+            self._time_values = np.ndarray(shape=(header.nb_frames,), dtype=header.np_type, buffer=raw,
+                                           offset=header.header_size + 4, strides=(header.frame_size,))
+            self._values = np.ndarray(shape=(header.nb_frames, header.nb_var, header.nb_nodes),
+                                      dtype=header.np_type, buffer=raw,
+                                      offset=header.header_size + 8 + header.float_size + 4,
+                                      strides=(header.frame_size, 8 + header.nb_nodes * header.float_size,
+                                               header.float_size))
+        except (OSError, ValueError, TypeError) as e:
+            logger.debug('Memory mapping of the file failed (%s), buffered reads are used instead' % e)
+            self.use_mmap = False
+            self._close_mmap()
+
+    def _close_mmap(self):
+        """!
+        @brief Release the memory-mapped views and close the memory map
+            (if views returned by `get_values_view` are still referenced, the map is closed when they are deleted)
+        """
+        self._mmap_header = None
+        self._values, self._time_values = None, None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                logger.debug('Memory map of "%s" is still referenced by a view' % self.filename)
+            self._mmap = None
+
+    def get_values_view(self):
+        """!
+        @brief Get a read-only view on all the values of the file (without copying them)
+            The view is only valid while the stream is open and should not be kept after it is closed.
+            Its byte order is the one of the file (see `SerafinHeader.np_type`).
+        @return <numpy 3D-array>: values with shape (number of frames, number of variables, number of nodes)
+            or None if memory mapping is disabled or not possible
+        """
+        if self.header is None:
+            raise SerafinRequestError('Cannot read values without any header (forgot read_header ?)')
+        if not self.use_mmap:
+            return None
+        self._map_file()
+        return self._values
+
+    def _check_time_index(self, time_index):
+        if time_index < 0:
+            raise SerafinRequestError('Impossible to read a negative time index!')
+        if time_index >= self.header.nb_frames:
+            raise SerafinRequestError('Time index %i is out of range (the file has %i frames)'
+                                      % (time_index, self.header.nb_frames))
+
     def _seek_to_frame(self, time_index, pos_var=0):
         return self.file.seek(
             self.header.header_size + time_index * self.header.frame_size + 8 +
@@ -966,10 +1163,12 @@ class Read(Serafin):
         @param var_ID <str>: variable ID
         @return <numpy 1D-array>: values of the variables, of length equal to the number of nodes
         """
-        if time_index < 0:
-            raise SerafinRequestError('Impossible to read a negative time index!')
         logger.debug('Reading variable %s at frame %i' % (var_ID, time_index))
         pos_var = self._get_var_index(var_ID)
+        self._check_time_index(time_index)
+        values = self.get_values_view()
+        if values is not None:
+            return values[time_index, pos_var].astype(self.header.np_float_type)  # native copy
         self._seek_to_frame(time_index, pos_var)
         self.file.read(4)
         return self.unpack_array(self.header.float_size * self.header.nb_nodes, self.header.np_type)
@@ -983,11 +1182,14 @@ class Read(Serafin):
         """
         if var_IDs is None:
             var_IDs = self.header.var_IDs
-        if time_index < 0:
-            raise SerafinRequestError('Impossible to read a negative time index!')
+        self._check_time_index(time_index)
         logger.debug('Reading variables %s at frame %i' % (var_IDs, time_index))
 
         res = np.empty((len(var_IDs), self.header.nb_nodes), dtype=self.header.np_float_type)
+        values = self.get_values_view()
+        if values is not None:
+            res[:] = values[time_index, [self._get_var_index(var_ID) for var_ID in var_IDs]]
+            return res
         for i, var_ID in enumerate(var_IDs):
             pos_var = self._get_var_index(var_ID)
             self._seek_to_frame(time_index, pos_var)
@@ -995,15 +1197,144 @@ class Read(Serafin):
             res[i, :] = self.unpack_array(self.header.float_size * self.header.nb_nodes, self.header.np_type)
         return res
 
+    def _get_time_indices(self, time_indices):
+        """!
+        @brief Check and convert requested time indices
+        @param time_indices <[int]>: indices of the frames (0-based) or None for all frames
+        @return <numpy 1D-array>: time indices
+        """
+        if time_indices is None:
+            return np.arange(self.header.nb_frames)
+        time_indices = np.asarray(time_indices, dtype=np.int64).reshape(-1)
+        if time_indices.size > 0:
+            self._check_time_index(time_indices.min())
+            self._check_time_index(time_indices.max())
+        return time_indices
+
+    def _get_node_cache(self):
+        """!
+        @return <slf.transposed.TransposedCache>: node cache or None if not available
+        """
+        if not self.use_node_cache:
+            return None
+        if self._node_cache is None:
+            self._node_cache = TransposedCache.load(self.filename)
+            if self._node_cache is None or self._node_cache.nb_frames != self.header.nb_frames \
+                    or self._node_cache.nb_nodes != self.header.nb_nodes:
+                self.use_node_cache = False  # avoid checking again
+                self._node_cache = None
+        return self._node_cache
+
+    def read_var_at_nodes(self, var_ID, node_indices, time_indices=None):
+        """!
+        @brief Read the time series of a single variable at some nodes (only the requested values are read)
+        @param var_ID <str>: variable ID
+        @param node_indices <[int]>: indices of the nodes (0-based)
+        @param time_indices <[int]>: indices of the frames (0-based), all frames are considered if not present
+        @return <numpy 2D-array>: values of the variable with shape (number of frames, number of nodes)
+        """
+        pos_var = self._get_var_index(var_ID)
+        time_indices = self._get_time_indices(time_indices)
+        node_indices = np.asarray(node_indices, dtype=np.int64).reshape(-1)
+        if node_indices.size > 0 and (node_indices.min() < 0 or node_indices.max() >= self.header.nb_nodes):
+            raise SerafinRequestError('Node indices should be inside [0, %i]' % (self.header.nb_nodes - 1))
+        logger.debug('Reading variable %s at %i nodes for %i frames' % (var_ID, len(node_indices), len(time_indices)))
+
+        res = np.empty((len(time_indices), len(node_indices)), dtype=self.header.np_float_type)
+        if res.size == 0:
+            return res
+        node_cache = self._get_node_cache()
+        if node_cache is not None and node_cache.has_variable(var_ID):
+            res[:] = node_cache.read_var_at_nodes(var_ID, node_indices, time_indices)
+            return res
+        values = self.get_values_view()
+        if values is not None:
+            # Strided gather: only the pages holding requested values are touched
+            res[:] = values[:, pos_var, :][np.ix_(time_indices, node_indices)]
+            return res
+
+        # Buffered fallback: read only the range of values between the first and last requested nodes
+        first_node = node_indices.min()
+        nb_values = node_indices.max() - first_node + 1
+        for i, time_index in enumerate(time_indices):
+            self._seek_to_frame(time_index, pos_var)
+            self.file.seek(4 + first_node * self.header.float_size, 1)
+            res[i, :] = self.unpack_array(self.header.float_size * nb_values,
+                                          self.header.np_type)[node_indices - first_node]
+        return res
+
+    def _get_block_size(self, nb_var):
+        """!
+        @brief Number of frames per block so that a block of values fits in the memory budget
+        @param nb_var <int>: number of variables in a block
+        @return <int>: number of frames
+        """
+        frame_memory = max(1, nb_var * self.header.nb_nodes * np.dtype(self.header.np_float_type).itemsize)
+        return max(1, settings.SERAFIN_BLOCK_MEMORY // frame_memory)
+
+    def iter_frame_blocks(self, var_IDs=None, time_indices=None, block_size=None):
+        """!
+        @brief Iterate over blocks of frames (to vectorize computations along the time axis)
+        @param var_IDs <[str]>: list of variable IDs (if not present, all variables are considered)
+        @param time_indices <[int]>: indices of the frames (0-based), all frames are considered if not present
+        @param block_size <int>: maximum number of frames per block (if not present, it is computed
+            from `settings.SERAFIN_BLOCK_MEMORY`)
+        @return <(numpy 1D-array, numpy 3D-array)>: tuple with times and values of the variables with shape
+            (number of frames in block, number of variables, number of nodes)
+        """
+        if var_IDs is None:
+            var_IDs = self.header.var_IDs
+        pos_vars = [self._get_var_index(var_ID) for var_ID in var_IDs]
+        time_indices = self._get_time_indices(time_indices)
+        values = self.get_values_view()
+        if block_size is None:
+            # without memory mapping, whole frames are read at once
+            block_size = self._get_block_size(len(var_IDs) if values is not None else self.header.nb_var)
+        elif block_size < 1:
+            raise SerafinRequestError('Block size should be strictly positive')
+        if len(self.time) != self.header.nb_frames:
+            self.get_time()
+        time = np.asarray(self.time, dtype=np.float64)
+        logger.debug('Reading variables %s for %i frames by blocks of %i frames'
+                     % (var_IDs, len(time_indices), block_size))
+
+        for start_index in range(0, len(time_indices), block_size):
+            block_indices = time_indices[start_index:start_index + block_size]
+            res = np.empty((len(block_indices), len(var_IDs), self.header.nb_nodes),
+                           dtype=self.header.np_float_type)
+            if values is not None:
+                res[:] = values[np.ix_(block_indices, pos_vars)]
+            elif np.all(np.diff(block_indices) == 1):
+                # Consecutive frames: a single read of the whole block
+                self.file.seek(self.header.header_size + block_indices[0] * self.header.frame_size, 0)
+                frames = np.frombuffer(self.file.read(len(block_indices) * self.header.frame_size),
+                                       dtype=self.header.np_frame_type)
+                res[:] = frames['vars']['values'][:, pos_vars]
+            else:
+                for i, time_index in enumerate(block_indices):
+                    for j, pos_var in enumerate(pos_vars):
+                        self._seek_to_frame(time_index, pos_var)
+                        self.file.read(4)
+                        res[i, j, :] = self.unpack_array(self.header.float_size * self.header.nb_nodes,
+                                                         self.header.np_type)
+            yield time[block_indices], res
+
     def iter_on_all_frames(self):
         """!
         @brief iterate over all frames with time and values
         @return <(float, numpy 2D-array)>: tuple with time and values of the variables with shape
             (number of variables, number of 2D nodes)
         """
+        res = np.empty((self.header.nb_var, self.header.nb_nodes), dtype=self.header.np_float_type)
+        values = self.get_values_view()
+        if values is not None:
+            for time_index in range(self.header.nb_frames):
+                res[:] = values[time_index]
+                yield float(self._time_values[time_index]), res
+            return
+
         self.file.seek(self.header.header_size, 0)
 
-        res = np.empty((self.header.nb_var, self.header.nb_nodes), dtype=self.header.np_float_type)
         for time_index in range(self.header.nb_frames):
             self.file.read(4)
             time = self.header.unpack_float(self.file.read(self.header.float_size), 1)[0]
@@ -1062,7 +1393,7 @@ class Write(Serafin):
     """!
     @brief Serafin file output stream
 
-    (No additional attributes)
+    (No additional public attributes)
     """
     def __init__(self, filename, language, overwrite=False):
         """!
@@ -1072,6 +1403,7 @@ class Write(Serafin):
         """
         mode = 'wb' if overwrite else 'xb'
         super().__init__(filename, mode, language)
+        self._frames = None  # buffer reused to write frames (set by `_get_frame_buffer`)
         logger.info('Writing the output file: "%s"' % filename)
 
     def __enter__(self):
@@ -1156,11 +1488,39 @@ class Write(Serafin):
         if values.shape != (header.nb_var, header.nb_nodes):
             raise SerafinValidationError("Shape of values %s is not consistant with SerafinHeader (%i, %i)"
                                          % (str(values.shape), header.nb_var, header.nb_nodes))
-        self.file.write(header.pack_int(header.float_size))
-        self.file.write(header.pack_float(time_to_write))
-        self.file.write(header.pack_int(header.float_size))
-
-        for i in range(header.nb_var):
-            self.file.write(header.pack_int(header.float_size * header.nb_nodes))
-            self.file.write(np.array(values[i, :], dtype=header.np_type))
-            self.file.write(header.pack_int(header.float_size * header.nb_nodes))
+        frames = self._get_frame_buffer(header, 1)
+        frames['time'] = time_to_write
+        frames['vars']['values'][0] = values
+        self.file.write(frames)
+
+    def write_frames(self, header, times, values):
+        """!
+        @brief write a block of frames (all variables/nodes values) in a single call
+        @param header <SerafinHeader>: output header
+        @param times <[float]>: output times (in seconds)
+        @param values <numpy 3D-array>: values to write, of dimension (number of frames, nb_var, nb_nodes)
+        """
+        values = np.asarray(values)
+        if values.shape != (len(times), header.nb_var, header.nb_nodes):
+            raise SerafinValidationError("Shape of values %s is not consistant with SerafinHeader (%i, %i, %i)"
+                                         % (str(values.shape), len(times), header.nb_var, header.nb_nodes))
+        frames = self._get_frame_buffer(header, len(times))
+        frames['time'] = times
+        frames['vars']['values'] = values  # precision and endianness conversion at once
+        self.file.write(frames)
+
+    def _get_frame_buffer(self, header, nb_frames):
+        """!
+        @brief Get a contiguous buffer for frames with record markers already in place (reused between calls)
+        @param header <SerafinHeader>: output header
+        @param nb_frames <int>: number of frames
+        @return <numpy 1D-array>: structured array of frames (see `SerafinHeader.np_frame_type`)
+        """
+        frame_type = header.np_frame_type
+        if self._frames is None or self._frames.dtype != frame_type or len(self._frames) != nb_frames:
+            self._frames = np.empty(nb_frames, dtype=frame_type)
+            self._frames['time_marker_start'] = header.float_size
+            self._frames['time_marker_end'] = header.float_size
+            self._frames['vars']['marker_start'] = header.float_size * header.nb_nodes
+            self._frames['vars']['marker_end'] = header.float_size * header.nb_nodes
+        return self._frames
@@ -0,0 +1,259 @@
+"""!
+Chunked and compressed container for Serafin results
+
+The container is a zip archive (like NPZ files) with:
+- the raw Serafin header (`header.bin`), so that conversions are lossless,
+- the time series (`time.npy`) and the container description (`meta.json`),
+- for each variable, the values split in chunks of (time_chunk frames x node_chunk nodes),
+  stored as `.npy` members (optionally deflate-compressed).
+
+Values are stored with the same precision and endianness as in the Serafin file.
+Reading a variable, a time window or a few nodes only decompresses the chunks which are touched.
+`ChunkedRead` has the interface of `Serafin.Read` so that calculators can be used unchanged.
+"""
+
+from collections import OrderedDict
+import io
+import json
+import numpy as np
+import zipfile
+
+from pyteltools.conf import settings
+
+from .Serafin import Read, SerafinHeader, SerafinRequestError, SerafinValidationError, Write
+from .util import logger
+
+
+CHUNKED_EXT = '.slfz'
+FORMAT_VERSION = 1
+
+# Default chunk shape (number of frames, number of nodes)
+DEFAULT_TIME_CHUNK = 32
+DEFAULT_NODE_CHUNK = 65536
+
+
+def _chunk_name(pos_var, time_chunk_index, node_chunk_index):
+    return 'values/%i/%i_%i.npy' % (pos_var, time_chunk_index, node_chunk_index)
+
+
+def _write_array(archive, name, array, compress_type):
+    buffer = io.BytesIO()
+    np.lib.format.write_array(buffer, np.ascontiguousarray(array), allow_pickle=False)
+    archive.writestr(zipfile.ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0)), buffer.getvalue(),
+                     compress_type=compress_type)
+
+
+def slf_to_chunked(slf_name, chunked_name, language, time_chunk=DEFAULT_TIME_CHUNK, node_chunk=DEFAULT_NODE_CHUNK,
+                   compress=True, overwrite=False):
+    """!
+    @brief Convert a Serafin file to a chunked container
+    @param slf_name <str>: path to input Serafin file
+    @param chunked_name <str>: path to output container
+    @param language <str>: language for variables detection
+    @param time_chunk <int>: number of frames per chunk
+    @param node_chunk <int>: number of nodes per chunk
+    @param compress <bool>: compress chunks (lossless deflate)
+    @param overwrite <bool>: overwrite output container if it exists
+    """
+    if time_chunk < 1 or node_chunk < 1:
+        raise SerafinRequestError('Chunk sizes should be strictly positive')
+    compress_type = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    with Read(slf_name, language) as resin:
+        resin.read_header()
+        resin.get_time()
+        header = resin.header
+        resin.file.seek(0)
+        header_bytes = resin.file.read(header.header_size)
+        resin.file.seek(header.header_size + header.nb_frames * header.frame_size)
+        tail_bytes = resin.file.read()
+
+        meta = {'version': FORMAT_VERSION, 'file_size': resin.file_size, 'nb_frames': header.nb_frames,
+                'time_chunk': time_chunk, 'node_chunk': node_chunk, 'tail': tail_bytes.hex()}
+        logger.info('Writing the chunked container: "%s"' % chunked_name)
+        with zipfile.ZipFile(chunked_name, 'w' if overwrite else 'x', allowZip64=True) as archive:
+            archive.writestr('meta.json', json.dumps(meta))
+            archive.writestr('header.bin', header_bytes)
+            _write_array(archive, 'time.npy', resin.time.astype(header.np_type), compress_type)
+
+            for time_chunk_index, (_, block) in enumerate(resin.iter_frame_blocks(block_size=time_chunk)):
+                block = block.astype(header.np_type)
+                for pos_var in range(header.nb_var):
+                    for node_chunk_index, start_node in enumerate(range(0, header.nb_nodes, node_chunk)):
+                        _write_array(archive, _chunk_name(pos_var, time_chunk_index, node_chunk_index),
+                                     block[:, pos_var, start_node:start_node + node_chunk], compress_type)
+
+
+def chunked_to_slf(chunked_name, slf_name, language, overwrite=False):
+    """!
+    @brief Convert a chunked container back to the original Serafin file
+    @param chunked_name <str>: path to input container
+    @param slf_name <str>: path to output Serafin file
+    @param language <str>: language for variables detection
+    @param overwrite <bool>: overwrite output Serafin file if it exists
+    """
+    with ChunkedRead(chunked_name, language) as resin:
+        resin.read_header()
+        resin.get_time()
+        with Write(slf_name, language, overwrite) as resout:
+            resout.file.write(resin.header_bytes)  # raw header, identical to the original one
+            for time, values in resin.iter_frame_blocks(block_size=resin.time_chunk):
+                resout.write_frames(resin.header, time, values)
+            resout.file.write(resin.tail_bytes)
+
+
+class ChunkedRead(Read):
+    """!
+    @brief Input stream of a chunked container, with the same interface as `Serafin.Read`
+
+    # Additional attributes:
+    - time_chunk <int>: number of frames per chunk
+    - node_chunk <int>: number of nodes per chunk
+    - header_bytes <bytes>: raw Serafin header
+    - tail_bytes <bytes>: bytes after the last frame in the original Serafin file (usually empty)
+    - archive <zipfile.ZipFile>: input container (opened on `file`)
+    - nb_decompressed_chunks <int>: number of chunks decompressed since the stream was opened
+    """
+    def __init__(self, filename, language):
+        super().__init__(filename, language, use_mmap=False, use_node_cache=False)
+        self.time_chunk = None
+        self.node_chunk = None
+        self.header_bytes = None
+        self.tail_bytes = None
+        self.archive = None
+        self.nb_decompressed_chunks = 0
+        self._meta = None
+        self._chunks = OrderedDict()  # decompressed chunks (least recently used first)
+        self._chunks_size = 0  # size of the decompressed chunks in bytes
+
+    def __enter__(self):
+        super().__enter__()
+        try:
+            self.archive = zipfile.ZipFile(self.file, 'r')
+            self._meta = json.loads(self.archive.read('meta.json').decode('utf-8'))
+        except (zipfile.BadZipFile, KeyError, ValueError):
+            self.file.close()
+            raise SerafinValidationError('File is not a valid chunked container')
+        if self._meta['version'] > FORMAT_VERSION:
+            raise SerafinValidationError('Chunked container version %i is not supported' % self._meta['version'])
+        self.time_chunk = self._meta['time_chunk']
+        self.node_chunk = self._meta['node_chunk']
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._chunks.clear()
+        self._chunks_size = 0
+        self.archive.close()
+        return super().__exit__(exc_type, exc_val, exc_tb)
+
+    def _read_array(self, name):
+        with self.archive.open(name) as f:
+            return np.lib.format.read_array(f, allow_pickle=False)
+
+    def read_header(self, lazy=False):
+        """!
+        @brief Read the Serafin header stored in the container
+        @param lazy <bool>: ignored, the mesh arrays are always read (the raw header is already in memory)
+        """
+        self.header_bytes = self.archive.read('header.bin')
+        self.tail_bytes = bytes.fromhex(self._meta['tail'])
+        self.header = SerafinHeader(lang=self.language)
+        self.header.from_file(io.BytesIO(self.header_bytes), self._meta['file_size'], lazy)
+
+    def get_time(self):
+        """!
+        @brief Read the time series stored in the container
+        """
+        if self.header is None:
+            raise SerafinRequestError('Cannot read time without any header (forgot read_header ?)')
+        self.time = self._read_array('time.npy').astype(np.float64)
+
+    def get_values_view(self):
+        return None
+
+    def _get_chunk(self, pos_var, time_chunk_index, node_chunk_index):
+        key = pos_var, time_chunk_index, node_chunk_index
+        if key in self._chunks:
+            self._chunks.move_to_end(key)
+        else:
+            chunk = self._read_array(_chunk_name(*key))
+            self.nb_decompressed_chunks += 1
+            self._chunks[key] = chunk
+            self._chunks_size += chunk.nbytes
+            # at least the chunks of all variables in a time window are kept
+            min_nb_chunks = self.header.nb_var * (-(-self.header.nb_nodes // self.node_chunk))
+            while self._chunks_size > settings.SERAFIN_CHUNK_CACHE_MEMORY and len(self._chunks) > min_nb_chunks:
+                _, evicted_chunk = self._chunks.popitem(last=False)
+                self._chunks_size -= evicted_chunk.nbytes
+        return self._chunks[key]
+
+    def _gather(self, pos_var, time_indices, node_indices=None):
+        """!
+        @brief Read the values of a variable from the chunks touched by the requested frames and nodes
+        @param pos_var <int>: position of the variable
+        @param time_indices <numpy 1D-array>: indices of the frames (0-based)
+        @param node_indices <numpy 1D-array>: indices of the nodes (0-based), all nodes are considered if None
+        @return <numpy 2D-array>: values with shape (number of frames, number of nodes)
+        """
+        all_nodes = node_indices is None
+        if all_nodes:
+            node_indices = np.arange(self.header.nb_nodes)
+        res = np.empty((len(time_indices), len(node_indices)), dtype=self.header.np_float_type)
+        time_chunk_indices = time_indices // self.time_chunk
+        node_chunk_indices = node_indices // self.node_chunk
+        for time_chunk_index in np.unique(time_chunk_indices):
+            rows = np.flatnonzero(time_chunk_indices == time_chunk_index)
+            local_times = time_indices[rows] - time_chunk_index * self.time_chunk
+            for node_chunk_index in np.unique(node_chunk_indices):
+                chunk = self._get_chunk(pos_var, time_chunk_index, node_chunk_index)
+                if all_nodes:
+                    start_node = node_chunk_index * self.node_chunk
+                    res[rows, start_node:start_node + chunk.shape[1]] = chunk[local_times]
+                else:
+                    columns = np.flatnonzero(node_chunk_indices == node_chunk_index)
+                    local_nodes = node_indices[columns] - node_chunk_index * self.node_chunk
+                    res[np.ix_(rows, columns)] = chunk[np.ix_(local_times, local_nodes)]
+        return res
+
+    def read_var_in_frame(self, time_index, var_ID):
+        pos_var = self._get_var_index(var_ID)
+        self._check_time_index(time_index)
+        return self._gather(pos_var, np.array([time_index]))[0]
+
+    def read_vars_in_frame(self, time_index, var_IDs=None):
+        if var_IDs is None:
+            var_IDs = self.header.var_IDs
+        self._check_time_index(time_index)
+        res = np.empty((len(var_IDs), self.header.nb_nodes), dtype=self.header.np_float_type)
+        for i, var_ID in enumerate(var_IDs):
+            res[i, :] = self._gather(self._get_var_index(var_ID), np.array([time_index]))[0]
+        return res
+
+    def read_var_at_nodes(self, var_ID, node_indices, time_indices=None):
+        pos_var = self._get_var_index(var_ID)
+        time_indices = self._get_time_indices(time_indices)
+        node_indices = np.asarray(node_indices, dtype=np.int64).reshape(-1)
+        if node_indices.size > 0 and (node_indices.min() < 0 or node_indices.max() >= self.header.nb_nodes):
+            raise SerafinRequestError('Node indices should be inside [0, %i]' % (self.header.nb_nodes - 1))
+        return self._gather(pos_var, time_indices, node_indices)
+
+    def iter_frame_blocks(self, var_IDs=None, time_indices=None, block_size=None):
+        if var_IDs is None:
+            var_IDs = self.header.var_IDs
+        pos_vars = [self._get_var_index(var_ID) for var_ID in var_IDs]
+        time_indices = self._get_time_indices(time_indices)
+        if block_size is None:
+            block_size = self._get_block_size(len(var_IDs))
+        elif block_size < 1:
+            raise SerafinRequestError('Block size should be strictly positive')
+        if len(self.time) != self.header.nb_frames:
+            self.get_time()
+        for start_index in range(0, len(time_indices), block_size):
+            block_indices = time_indices[start_index:start_index + block_size]
+            res = np.empty((len(block_indices), len(var_IDs), self.header.nb_nodes), dtype=self.header.np_float_type)
+            for j, pos_var in enumerate(pos_vars):
+                res[:, j, :] = self._gather(pos_var, block_indices)
+            yield self.time[block_indices], res
+
+    def iter_on_all_frames(self):
+        for time_index in range(self.header.nb_frames):
+            yield self.time[time_index], self.read_vars_in_frame(time_index)
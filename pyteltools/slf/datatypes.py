@@ -2,6 +2,7 @@ from copy import deepcopy
 import datetime
 
 from . import Serafin
+from .header_cache import read_header_and_time
 from .util import logger
 
 
@@ -13,7 +14,7 @@ class SerafinData:
         self.index = None
         self.triangles = {}
         self.header = None
-        self.time = []  # <[float]>
+        self.time = []  # <numpy 1D-array>
         self.time_second = []  # <[datetime.timedelta]>  FIXME: should be renamed differently!
         self.start_time = None
 
@@ -30,14 +31,13 @@ class SerafinData:
         # * SynchMax: 'var': a string (variable identifier)
         # * Vertical aggregation: 'vertical_operator': 'Min', 'Max' or 'Mean'
 
-    def read(self):
+    def read(self, use_cache=None):
+        """!
+        @param use_cache <bool>: use the header cache (`settings.SERAFIN_HEADER_CACHE` by default)
+        @return <bool>: True if the file is 2D
+        """
         try:
-            with Serafin.Read(self.filename, self.language) as input_stream:
-                input_stream.read_header()
-                input_stream.get_time()
-
-                self.header = input_stream.header.copy()
-                self.time = input_stream.time[:]
+            self.header, self.time = read_header_and_time(self.filename, self.language, use_cache)
         except PermissionError:
             raise Serafin.SerafinRequestError('Permission denied (Is the file opened by another application?).')
 
@@ -1,6 +1,6 @@
 import numpy as np
-from shapely.geometry import Point
 
+from pyteltools.geom.geometry import points_in_polygons
 from pyteltools.slf.misc import infix_to_postfix, is_valid_expression, is_valid_postfix, to_infix
 from pyteltools.slf.Serafin import SLF_EIT
 
@@ -24,10 +24,6 @@ class ComplexExpressionPool:
         self.id_pool = self.vars[:]
         self.dependency_graph = {var: set() for var in self.vars}  # a DAG
 
-    def points(self):
-        for i, (x, y) in enumerate(zip(self.x, self.y)):
-            yield i, Point(x, y)
-
     def add_simple_expression(self, literal_expression):
         infix = to_infix(literal_expression)
         postfix = infix_to_postfix(infix)
@@ -176,15 +172,12 @@ class ComplexExpressionPool:
         new_id = 'POLY%d' % self.nb_masks
         self.id_pool.append(new_id)
         self.dependency_graph[new_id] = set()
-        mask = np.zeros_like(self.x)
-        for index, poly in enumerate(polygons):
-            for i, point in self.points():
-                if poly.contains(point):
-                    mask[i] = index+1
+        polygon_indices = points_in_polygons(self.x, self.y, polygons, keep_last=True)
+        is_inside = polygon_indices >= 0
         masked_values = np.zeros_like(self.x)
-        for index, poly in enumerate(polygons):
-            masked_values[mask == index+1] = poly.attributes()[attribute_index]
-        self.masks[self.nb_masks] = PolygonalMask(self.nb_masks, mask > 0, masked_values)
+        masked_values[is_inside] = np.array([poly.attributes()[attribute_index]
+                                             for poly in polygons])[polygon_indices[is_inside]]
+        self.masks[self.nb_masks] = PolygonalMask(self.nb_masks, is_inside, masked_values)
 
     def get_expression(self, str_expression):
         index = int(str_expression.split(':')[0][1:])
@@ -3,10 +3,11 @@ Flux calculations across sections
 """
 
 import numpy as np
+from scipy import sparse
 
 from pyteltools.conf import settings
 
-from .interpolation import Interpolator
+from .mapreduce import map_chunks, split_time_indices
 from .mesh2D import Mesh2D
 from .Serafin import SLF_EIT
 from .util import logger
@@ -117,167 +118,36 @@ class TriangularVectorField(Mesh2D):
         @param section <geom.geometry.Polyline>: An open polyline
         @return <dict>: The list of tuples (normal vector, interpolator) of every intersected segments in triangles
         """
+        # Parts of the section inside every crossed element, by walking along the section
+        pieces = []  # list of (element index, list of points)
+        for segment_points in self.trace_polyline(list(section.coords())):
+            for (x, y, _, element), (next_x, next_y, __, ___) in zip(segment_points[:-1], segment_points[1:]):
+                if element < 0 or (x == next_x and y == next_y):
+                    continue
+                if pieces and pieces[-1][0] == element and pieces[-1][1][-1] == (x, y):
+                    pieces[-1][1].append((next_x, next_y))
+                else:
+                    pieces.append((element, [(x, y), (next_x, next_y)]))
+
+        lines = {}
+        for element, points in pieces:
+            interpolators = self.barycentric_coordinates(np.full(len(points), element), np.array(points))
+            line = []  # the list of tuple (normal_vector, interpolator) for all start/end/turning points
+            prev_x, prev_y = None, None
+            for (x, y), interpolator in zip(points, interpolators):
+                if prev_x is None:  # the first point doesn't have a normal vector
+                    line.append(([0, 0], interpolator))
+                else:
+                    line.append(([prev_y-y, x-prev_x], interpolator))
+                prev_x, prev_y = x, y
+            lines.setdefault(element, []).append(line)
+
         intersections = {}
-        potential_elements = self.get_intersecting_elements(section.bounds())
-        for i, j, k in potential_elements:
-            t = self.triangles[i, j, k]
-            is_intersected, t_intersections = section.linestring_intersection(t)
-            if is_intersected:
-                interpolator = Interpolator(t)
-                intersections[i, j, k] = []
-                for intersection in t_intersections:
-                    line = []   # the list of tuple (normal_vector, interpolator) for all start/end/turning points
-                    prev_x, prev_y = None, None
-                    for x, y in intersection.coords:
-                        if prev_x is None:  # the first point doesn't have a normal vector
-                            line.append(([0, 0], interpolator.get_interpolator_at(x, y)))
-                        else:
-                            line.append(([prev_y-y, x-prev_x],
-                                         interpolator.get_interpolator_at(x, y)))
-                        prev_x, prev_y = x, y
-                    intersections[i, j, k].append(line)
+        for element in sorted(lines):  # sorted as the connectivity table
+            i, j, k = self.ikle[element]
+            intersections[i, j, k] = lines[element]
         return intersections
 
-    @staticmethod
-    def line_integral(intersections, scalar_flux_values):
-        """!
-        @brief The line integral of a scalar field along a line (not really a flux)
-        """
-        flux = 0
-        for i, j, k in intersections:  # iterating through triangles in the intersection
-            f_vals = scalar_flux_values[[i, j, k]]
-
-            for endpoints in intersections[i, j, k]:
-                endpoints_f = []
-
-                for normal, interpolator in endpoints:  # pre-compute the values on each start/turning/end points
-                    endpoints_f.append(interpolator.dot(f_vals))
-
-                for p in range(len(endpoints)-1):  # iterating through intersecting segments inside the triangle
-                    flux += (endpoints_f[p] + endpoints_f[p+1]) * np.linalg.norm(endpoints[p+1][0])
-        return flux / 2
-
-    @staticmethod
-    def line_double_integral(intersections, height_values, scalar_flux_values):
-        """!
-        @brief The line integral of a scalar field (product of two scalars) across a section (not really a flux)
-        """
-        flux = 0
-        for i, j, k in intersections:  # iterating through triangles in the intersection
-            h_vals = height_values[[i, j, k]]
-            f_vals = scalar_flux_values[[i, j, k]]
-
-            for endpoints in intersections[i, j, k]:
-                endpoints_h, endpoints_f = [], []
-
-                for normal, interpolator in endpoints:  # pre-compute the values on each start/turning/end points
-                    endpoints_h.append(interpolator.dot(h_vals))
-                    endpoints_f.append(interpolator.dot(f_vals))
-
-                for p in range(len(endpoints)-1):  # iterating through intersecting segments inside the triangle
-                    first_h, second_h = endpoints_h[p], endpoints_h[p+1]
-                    first_f, second_f = endpoints_f[p], endpoints_f[p+1]
-
-                    flux += (2 * (first_f * first_h + second_f * second_h)
-                             + (first_f * second_h + second_f * first_h)) * np.linalg.norm(endpoints[p+1][0])
-
-        return flux / 6
-
-    @staticmethod
-    def line_flux(intersections, x_vector_values, y_vector_values):
-        """!
-        @brief The flux of a vector field across a line
-        """
-        flux = 0
-        for i, j, k in intersections:  # iterating through triangles in the intersection
-            x_vals = x_vector_values[[i, j, k]]
-            y_vals = y_vector_values[[i, j, k]]
-
-            for endpoints in intersections[i, j, k]:
-                endpoints_x, endpoints_y = [], []
-
-                for normal, interpolator in endpoints:  # pre-compute the values on each start/turning/end points
-                    endpoints_x.append(interpolator.dot(x_vals))
-                    endpoints_y.append(interpolator.dot(y_vals))
-
-                for p in range(len(endpoints)-1):  # iterating through intersecting segments inside the triangle
-                    normal = endpoints[p+1][0]
-
-                    first_normal = np.dot([endpoints_x[p], endpoints_y[p]], normal)
-                    second_normal = np.dot([endpoints_x[p+1], endpoints_y[p+1]], normal)
-
-                    flux += first_normal + second_normal
-
-        return flux / 2
-
-    @staticmethod
-    def area_flux(intersections, x_vector_values, y_vector_values, height_values):
-        """!
-        @brief The flux of a vector field across a section (the surface height is a scalar field)
-        """
-        flux = 0
-        for i, j, k in intersections:  # iterating through triangles in the intersection
-            x_vals = x_vector_values[[i, j, k]]
-            y_vals = y_vector_values[[i, j, k]]
-            h_vals = height_values[[i, j, k]]
-
-            for endpoints in intersections[i, j, k]:
-                endpoints_x, endpoints_y, endpoints_h = [], [], []
-
-                for normal, interpolator in endpoints:  # pre-compute the values on each start/turning/end points
-                    endpoints_x.append(interpolator.dot(x_vals))
-                    endpoints_y.append(interpolator.dot(y_vals))
-                    endpoints_h.append(interpolator.dot(h_vals))
-
-                for p in range(len(endpoints)-1):  # iterating through intersecting segments inside the triangle
-                    normal = endpoints[p+1][0]
-
-                    first_normal = np.dot([endpoints_x[p], endpoints_y[p]], normal)
-                    second_normal = np.dot([endpoints_x[p+1], endpoints_y[p+1]], normal)
-
-                    first_h, second_h = endpoints_h[p], endpoints_h[p+1]
-
-                    flux += 2 * (first_normal * first_h + second_normal * second_h) \
-                              + (first_normal * second_h + second_normal * first_h)
-
-        return flux / 6
-
-    @staticmethod
-    def mass_flux(intersections, x_vector_values, y_vector_values, height_values, density_values):
-        """!
-        @brief The mass-flux of a vector field across a section (with surface height and density, two scalars fields)
-        """
-        flux = 0
-        for i, j, k in intersections:  # iterating through triangles in the intersection
-            x_vals = x_vector_values[[i, j, k]]
-            y_vals = y_vector_values[[i, j, k]]
-            h_vals = height_values[[i, j, k]]
-            d_vals = density_values[[i, j, k]]
-
-            for endpoints in intersections[i, j, k]:
-                endpoints_x, endpoints_y, endpoints_h, endpoints_d = [], [], [], []
-
-                for normal, interpolator in endpoints:  # pre-compute the values on each start/turning/end points
-                    endpoints_x.append(interpolator.dot(x_vals))
-                    endpoints_y.append(interpolator.dot(y_vals))
-                    endpoints_h.append(interpolator.dot(h_vals))
-                    endpoints_d.append(interpolator.dot(d_vals))
-
-                for p in range(len(endpoints)-1):  # iterating through intersecting segments inside the triangle
-                    normal = endpoints[p+1][0]
-
-                    first_normal = np.dot([endpoints_x[p], endpoints_y[p]], normal)
-                    second_normal = np.dot([endpoints_x[p+1], endpoints_y[p+1]], normal)
-
-                    first_h, second_h = endpoints_h[p], endpoints_h[p+1]
-                    first_d, second_d = endpoints_d[p], endpoints_d[p+1]
-
-                    flux += 9 * (first_normal * first_h * first_d + second_normal * second_h * second_d) + \
-                            (2*first_normal+second_normal) * (2*first_h+second_h) * (2*first_d+second_d) + \
-                            (first_normal+2*second_normal) * (first_h+2*second_h) * (first_d+2*second_d)
-
-        return flux / 72
-
 
 class FluxCalculator:
     """!
@@ -299,6 +169,13 @@ class FluxCalculator:
         self.mesh = None
         self.intersections = []
 
+        # Compiled intersections of all sections (see `construct_operators`)
+        self.first_operator = None
+        self.second_operator = None
+        self.normals = None
+        self.lengths = None
+        self.section_operator = None
+
     def construct_triangles(self, iter_pbar=lambda x, unit: x):
         """!
         Construct triangular elements (index construction)
@@ -312,39 +189,122 @@ class FluxCalculator:
         """
         for section in self.sections:
             self.intersections.append(self.mesh.section_intersection(section))
+        self.construct_operators()
 
-    def flux_in_frame(self, intersections, values):
+    def construct_operators(self):
         """!
-        @brief Do the flux computation in a single frame, depending on the flux type
-        @param values <[numpy.1D-array]>: list of the values of the scalar/vector fields
-        @return <float>: The value of the flux
+        Compile the intersections of all sections into flat arrays: for every intersected segment,
+        the interpolation operators at its first and second points, its normal vector and its length
         """
+        nodes, first_interpolators, second_interpolators, normals, section_indices = [], [], [], [], []
+        for index_section, intersections in enumerate(self.intersections):
+            for (i, j, k), lines in intersections.items():
+                for endpoints in lines:
+                    for p in range(len(endpoints)-1):  # iterating through intersecting segments inside the triangle
+                        nodes.append((i, j, k))
+                        first_interpolators.append(endpoints[p][1])
+                        second_interpolators.append(endpoints[p+1][1])
+                        normals.append(endpoints[p+1][0])
+                        section_indices.append(index_section)
+
+        nb_segments = len(nodes)
+        nodes = np.array(nodes, dtype=np.int64).reshape(-1, 3)
+        indptr = np.arange(0, 3 * nb_segments + 1, 3)
+        shape = (nb_segments, self.mesh.nb_points)
+        self.first_operator = sparse.csr_matrix((np.array(first_interpolators, dtype=np.float64).reshape(-1),
+                                                 nodes.reshape(-1), indptr), shape=shape)
+        self.second_operator = sparse.csr_matrix((np.array(second_interpolators, dtype=np.float64).reshape(-1),
+                                                  nodes.reshape(-1), indptr), shape=shape)
+        self.normals = np.array(normals, dtype=np.float64).reshape(-1, 2)
+        self.lengths = np.sqrt(self.normals[:, 0] ** 2 + self.normals[:, 1] ** 2)
+        self.section_operator = sparse.csr_matrix((np.ones(nb_segments), (np.array(section_indices, dtype=np.int64),
+                                                                          np.arange(nb_segments))),
+                                                  shape=(len(self.sections), nb_segments))
+
+    def fluxes_in_frames(self, values):
+        """!
+        @brief Do the flux computation in a block of frames for all sections, depending on the flux type
+        @param values <numpy.3D-array>: values of the scalar/vector fields with shape
+            (number of frames, number of variables, number of nodes)
+        @return <numpy.2D-array>: The fluxes with shape (number of frames, number of sections)
+        """
+        # values at the first and second points of every segment, with shape (number of segments, number of frames)
+        first = [self.first_operator.dot(values[:, i, :].T) for i in range(values.shape[1])]
+        second = [self.second_operator.dot(values[:, i, :].T) for i in range(values.shape[1])]
+        lengths = self.lengths[:, np.newaxis]
+
         if self.flux_type == FluxCalculator.LINE_INTEGRAL:
-            return TriangularVectorField.line_integral(intersections, values[0])
+            segment_flux = (first[0] + second[0]) * lengths / 2
         elif self.flux_type == FluxCalculator.DOUBLE_LINE_INTEGRAL:
-            return TriangularVectorField.line_double_integral(intersections, values[0], values[1])
-        elif self.flux_type == FluxCalculator.LINE_FLUX:
-            return TriangularVectorField.line_flux(intersections, values[0], values[1])
-        elif self.flux_type == FluxCalculator.AREA_FLUX:
-            return TriangularVectorField.area_flux(intersections, values[0], values[1], values[2])
+            (first_f, first_h), (second_f, second_h) = first, second
+            segment_flux = (2 * (first_f * first_h + second_f * second_h)
+                            + (first_f * second_h + second_f * first_h)) * lengths / 6
         else:
-            return TriangularVectorField.mass_flux(intersections, values[0], values[1], values[2], values[3])
+            normal_x, normal_y = self.normals[:, [0]], self.normals[:, [1]]
+            first_normal = first[0] * normal_x + first[1] * normal_y
+            second_normal = second[0] * normal_x + second[1] * normal_y
+            if self.flux_type == FluxCalculator.LINE_FLUX:
+                segment_flux = (first_normal + second_normal) / 2
+            elif self.flux_type == FluxCalculator.AREA_FLUX:
+                first_h, second_h = first[2], second[2]
+                segment_flux = (2 * (first_normal * first_h + second_normal * second_h)
+                                + (first_normal * second_h + second_normal * first_h)) / 6
+            else:
+                first_h, second_h = first[2], second[2]
+                first_d, second_d = first[3], second[3]
+                segment_flux = (9 * (first_normal * first_h * first_d + second_normal * second_h * second_d)
+                                + (2*first_normal+second_normal) * (2*first_h+second_h) * (2*first_d+second_d)
+                                + (first_normal+2*second_normal) * (first_h+2*second_h) * (first_d+2*second_d)) / 72
+        return self.section_operator.dot(segment_flux).T
+
+    def fluxes_in_frame(self, values):
+        """!
+        @brief Do the flux computation in a single frame for all sections, depending on the flux type
+        @param values <[numpy.1D-array]>: list of the values of the scalar/vector fields
+        @return <[float]>: The value of the flux across every section
+        """
+        return self.fluxes_in_frames(np.array(values)[np.newaxis, :, :])[0].tolist()
+
+    def iter_fluxes(self, block_size=None, time_indices=None):
+        """!
+        @brief Iterate over the fluxes of every frame, computed by blocks of frames
+        @param block_size <int>: maximum number of frames per block (see `Serafin.Read.iter_frame_blocks`)
+        @param time_indices <[int]>: indices of the frames (0-based), `self.time_indices` by default
+        @return <(float, numpy.1D-array)>: time and fluxes across every section for every frame
+        """
+        if time_indices is None:
+            time_indices = self.time_indices
+        for times, values in self.input_stream.iter_frame_blocks(self.var_IDs, time_indices, block_size):
+            yield from zip(times, self.fluxes_in_frames(values))
+
+    def fluxes_in_time_indices(self, time_indices, block_size=None):
+        """!
+        @brief Do the flux computation in a chunk of frames for all sections
+        @param time_indices <[int]>: indices of the frames (0-based)
+        @param block_size <int>: maximum number of frames read and computed at once
+        @return <numpy.2D-array>: The fluxes with shape (number of frames, number of sections)
+        """
+        fluxes = [flux for _, flux in self.iter_fluxes(block_size, time_indices)]
+        return np.array(fluxes).reshape(len(time_indices), len(self.sections))
 
-    def run(self, iter_pbar=lambda x, unit: x, fmt_float=settings.FMT_FLOAT):
+    def run(self, iter_pbar=lambda x, unit: x, fmt_float=settings.FMT_FLOAT, block_size=None, nb_processes=1):
         """!
         Separate the major part of the computation, allowing a GUI override
         @param iter_pbar: iterable progress bar
+        @param block_size <int>: maximum number of frames read and computed at once
+        @param nb_processes <int>: number of processes (frames are split in chunks computed in parallel if > 1)
         """
+        if nb_processes > 1:
+            chunks = split_time_indices(self.time_indices, nb_processes)
+            all_fluxes = np.concatenate(map_chunks(self, 'fluxes_in_time_indices', chunks, nb_processes,
+                                                   (block_size,)))
+        else:
+            all_fluxes = (fluxes for _, fluxes in self.iter_fluxes(block_size))
+
         result = []
-        for time_index in iter_pbar(self.time_indices, unit='frames'):
+        for time_index, fluxes in zip(iter_pbar(self.time_indices, unit='frames'), all_fluxes):
             i_result = [str(self.input_stream.time[time_index])]
-            values = []
-            for var_ID in self.var_IDs:
-                values.append(self.input_stream.read_var_in_frame(time_index, var_ID))
-
-            for j in range(len(self.sections)):
-                intersections = self.intersections[j]
-                flux = self.flux_in_frame(intersections, values)
+            for flux in fluxes:
                 i_result.append(fmt_float.format(flux))
             result.append(i_result)
         return result
@@ -0,0 +1,171 @@
+"""!
+Persistent cache of parsed Serafin headers and time series
+
+Loading a Serafin file requires to parse its header and to read the time of every frame.
+For large collections of result files (e.g. multi-folder workflow), the parsed headers and times are stored
+in a central folder (`settings.SERAFIN_HEADER_CACHE_FOLDER`).
+Headers are lazy (see `Serafin.Read.read_header`): entries only contain the metadata and the time series,
+the mesh arrays are read from the Serafin file on first access.
+
+Entries are keyed by the absolute path of the file and the language, and are only considered as valid
+if the size and the modification time of the Serafin file are unchanged.
+The least recently used entries are removed when the total size exceeds `settings.SERAFIN_HEADER_CACHE_MAX_SIZE`.
+"""
+
+import hashlib
+from multiprocessing import Pool
+import os
+import pickle
+import tempfile
+from time import time_ns
+
+from pyteltools.conf import settings
+
+from . import Serafin
+from .util import file_signature, logger
+
+
+ENTRY_EXT = '.pkl'
+
+
+def _entry_path(filename, language):
+    """!
+    @param filename <str>: path to Serafin file
+    @param language <str>: language for variables detection
+    @return <str>: path to the cache entry
+    """
+    key = hashlib.sha1(('%s|%s' % (os.path.abspath(filename), language)).encode('utf-8')).hexdigest()
+    return os.path.join(settings.SERAFIN_HEADER_CACHE_FOLDER, key + ENTRY_EXT)
+
+
+def load_entry(filename, language):
+    """!
+    @brief Get the cached header and time of a Serafin file if available and up to date
+    @param filename <str>: path to Serafin file
+    @param language <str>: language for variables detection
+    @return <(slf.Serafin.SerafinHeader, numpy 1D-array)>: header and time, or None if not available
+    """
+    path = _entry_path(filename, language)
+    try:
+        with open(path, 'rb') as f:
+            signature, header, time = pickle.load(f)
+        if signature != file_signature(filename):
+            return None
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        return None
+    try:
+        now = time_ns()
+        os.utime(path, ns=(now, now))  # mark as recently used
+    except OSError:
+        pass
+    return header, time
+
+
+def store_entry(filename, language, header, time):
+    """!
+    @brief Add (or replace) the cache entry of a Serafin file
+    @param filename <str>: path to Serafin file
+    @param language <str>: language for variables detection
+    @param header <slf.Serafin.SerafinHeader>: Serafin header
+    @param time <numpy 1D-array>: time series in seconds
+    """
+    path = _entry_path(filename, language)
+    try:
+        os.makedirs(settings.SERAFIN_HEADER_CACHE_FOLDER, exist_ok=True)
+        # Write in a temporary file first: entries can be written concurrently by several processes
+        fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=settings.SERAFIN_HEADER_CACHE_FOLDER)
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((file_signature(filename), header, time), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug('Header cache entry could not be written (%s)' % e)
+        return
+    evict()
+
+
+def evict(max_size=None):
+    """!
+    @brief Remove the least recently used entries until the cache size is below the limit
+    @param max_size <int>: maximum size of the cache (in bytes), `settings.SERAFIN_HEADER_CACHE_MAX_SIZE` by default
+    """
+    if max_size is None:
+        max_size = settings.SERAFIN_HEADER_CACHE_MAX_SIZE
+    entries = []
+    try:
+        with os.scandir(settings.SERAFIN_HEADER_CACHE_FOLDER) as it:
+            for entry in it:
+                if entry.name.endswith(ENTRY_EXT):
+                    try:
+                        stat = entry.stat()
+                    except OSError:  # removed by another process
+                        continue
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+    except OSError:
+        return
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_size <= max_size:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        total_size -= size
+
+
+def read_header_and_time(filename, language, use_cache=None):
+    """!
+    @brief Read the header and the time series of a Serafin file (from the cache if possible)
+        The header is lazy: the mesh arrays are read on first access (see `Serafin.Read.read_header`)
+    @param filename <str>: path to Serafin file
+    @param language <str>: language for variables detection
+    @param use_cache <bool>: read from and write to the cache (`settings.SERAFIN_HEADER_CACHE` by default)
+    @return <(slf.Serafin.SerafinHeader, numpy 1D-array)>: header and time
+    """
+    if use_cache is None:
+        use_cache = settings.SERAFIN_HEADER_CACHE
+    if use_cache:
+        entry = load_entry(filename, language)
+        if entry is not None:
+            logger.debug('Header of "%s" read from cache' % filename)
+            return entry
+
+    with Serafin.Read(filename, language) as input_stream:
+        input_stream.read_header(lazy=True)
+        input_stream.get_time()
+        header = input_stream.header.copy()
+        time = input_stream.time.copy()
+
+    if use_cache:
+        store_entry(filename, language, header, time)
+    return header, time
+
+
+def _preload_file(filename, language):
+    try:
+        read_header_and_time(filename, language, use_cache=True)
+    except (Serafin.SerafinRequestError, Serafin.SerafinValidationError, OSError):
+        pass  # errors are reported when the file is actually loaded
+
+
+def preload(filenames, language, nb_processes=None):
+    """!
+    @brief Fill the cache for files which are not cached yet, reading them in parallel
+        (the cache is used whatever `settings.SERAFIN_HEADER_CACHE` is)
+    @param filenames <[str]>: paths to Serafin files
+    @param language <str>: language for variables detection
+    @param nb_processes <int>: number of processes (`settings.NCSIZE` by default)
+    @return <int>: number of files which were not cached
+    """
+    cold_filenames = [filename for filename in filenames
+                      if os.path.exists(filename) and load_entry(filename, language) is None]
+    if nb_processes is None:
+        nb_processes = settings.NCSIZE
+    nb_processes = min(nb_processes, len(cold_filenames))
+    if nb_processes > 1:
+        with Pool(nb_processes) as pool:
+            pool.starmap(_preload_file, [(filename, language) for filename in cold_filenames])
+    else:
+        for filename in cold_filenames:
+            _preload_file(filename, language)
+    return len(cold_filenames)
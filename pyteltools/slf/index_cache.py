@@ -0,0 +1,127 @@
+"""!
+Persistent cache of mesh spatial indexes
+
+Building the spatial index of a 2D mesh (see `slf.mesh2D.Mesh2D`) is repeated by every tool working on the same mesh.
+The bulk-loaded rtree is stored with the file-based storage of rtree (`.idx` and `.dat` files) and the bounding boxes
+of the triangles in a `.npy` file, in a central folder (`settings.SERAFIN_INDEX_CACHE_FOLDER`).
+
+Entries are keyed by the fingerprint of the mesh (content hash of coordinates and connectivity table), so that the cache is shared
+between all the files having the same mesh.
+The least recently used entries are removed when the total size exceeds `settings.SERAFIN_INDEX_CACHE_MAX_SIZE`.
+"""
+
+from collections import defaultdict
+import numpy as np
+import os
+from rtree.exceptions import RTreeError
+from rtree.index import Index, Property
+import tempfile
+from time import time_ns
+import uuid
+
+from pyteltools.conf import settings
+
+from .util import logger
+
+
+INDEX_EXTS = ('.idx', '.dat')
+BOXES_EXT = '.npy'
+
+
+def _entry_basename(key):
+    return os.path.join(settings.SERAFIN_INDEX_CACHE_FOLDER, key)
+
+
+def load_entry(key):
+    """!
+    @brief Open the cached index of a mesh if available
+    @param key <str>: mesh fingerprint (see `Serafin.SerafinHeader.mesh_fingerprint`)
+    @return <(rtree.index.Index, numpy 2D-array)>: index (identifiers are element indices) and bounding boxes
+        (xmin, ymin, xmax, ymax) of the triangles (memory-mapped), or None if not available
+    """
+    basename = _entry_basename(key)
+    if not all(os.path.exists(basename + ext) for ext in INDEX_EXTS + (BOXES_EXT,)):
+        return None
+    try:
+        bounding_boxes = np.load(basename + BOXES_EXT, mmap_mode='r')
+        index = Index(basename)
+    except (OSError, ValueError, RTreeError):
+        return None
+    try:
+        now = time_ns()
+        os.utime(basename + BOXES_EXT, ns=(now, now))  # mark as recently used
+    except OSError:
+        pass
+    return index, bounding_boxes
+
+
+def store_entry(key, mins, maxs):
+    """!
+    @brief Build the index of a mesh from the bounding boxes of its triangles and add it to the cache
+    @param key <str>: mesh fingerprint (see `Serafin.SerafinHeader.mesh_fingerprint`)
+    @param mins <numpy 2D-array>: lower-left corners (xmin, ymin) of the triangles
+    @param maxs <numpy 2D-array>: upper-right corners (xmax, ymax) of the triangles
+    @return <bool>: True if the entry was written
+    """
+    basename = _entry_basename(key)
+    # Write in temporary files first: entries can be written concurrently by several processes
+    tmp_basename = _entry_basename('%s.%s.tmp' % (key, uuid.uuid4().hex))
+    tmp_path = None
+    try:
+        os.makedirs(settings.SERAFIN_INDEX_CACHE_FOLDER, exist_ok=True)
+        properties = Property()
+        properties.overwrite = True
+        index = Index(tmp_basename, (np.arange(len(mins), dtype=np.int64), mins, maxs), properties=properties)
+        index.close()
+        fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=settings.SERAFIN_INDEX_CACHE_FOLDER)
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, np.hstack((mins, maxs)))
+        for ext in INDEX_EXTS:
+            os.replace(tmp_basename + ext, basename + ext)
+        os.replace(tmp_path, basename + BOXES_EXT)  # written last: marks the entry as complete
+    except (OSError, RTreeError) as e:
+        logger.debug('Index cache entry could not be written (%s)' % e)
+        for ext in INDEX_EXTS:
+            if os.path.exists(tmp_basename + ext):
+                os.remove(tmp_basename + ext)
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+    evict()
+    return True
+
+
+def evict(max_size=None):
+    """!
+    @brief Remove the least recently used entries until the cache size is below the limit
+    @param max_size <int>: maximum size of the cache (in bytes), `settings.SERAFIN_INDEX_CACHE_MAX_SIZE` by default
+    """
+    if max_size is None:
+        max_size = settings.SERAFIN_INDEX_CACHE_MAX_SIZE
+    sizes = defaultdict(int)
+    last_uses = {}
+    try:
+        with os.scandir(settings.SERAFIN_INDEX_CACHE_FOLDER) as it:
+            for entry in it:
+                key, ext = os.path.splitext(entry.name)
+                if ext not in INDEX_EXTS + (BOXES_EXT,) or key.endswith('.tmp'):  # skip entries being written
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:  # removed by another process
+                    continue
+                sizes[key] += stat.st_size
+                if ext == BOXES_EXT:
+                    last_uses[key] = stat.st_mtime_ns
+    except OSError:
+        return
+    total_size = sum(sizes.values())
+    for _, key in sorted((last_uses.get(key, 0), key) for key in sizes):
+        if total_size <= max_size:
+            break
+        for ext in (BOXES_EXT,) + INDEX_EXTS:
+            try:
+                os.remove(_entry_basename(key) + ext)
+            except OSError:
+                pass
+        total_size -= sizes[key]
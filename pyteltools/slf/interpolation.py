@@ -3,10 +3,17 @@ Barycentric interpolation in triangles
 """
 
 import numpy as np
+from scipy import sparse
+
+from pyteltools.conf import settings
 
 from .mesh2D import Mesh2D
 
 
+# Number of points located at once by `MeshInterpolator.locate_points`
+POINT_BLOCK_SIZE = 65536
+
+
 class Interpolator:
     """!
     Wrapper for calculating the barycentric coordinates of 2d points in a 2d triangle
@@ -40,25 +47,128 @@ class MeshInterpolator(Mesh2D):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-    def get_point_interpolators(self, points):
-        nb_points = len(points)
-        is_inside = [False] * nb_points
-        point_interpolators = [None] * nb_points
-
-        for index, (x, y) in enumerate(points):
-            potential_elements = self.get_intersecting_elements((x, y, x, y))
-            if not potential_elements:
+    def locate_points(self, points, block_size=POINT_BLOCK_SIZE):
+        """!
+        @brief Find the triangle containing each point and the barycentric coordinates of the points
+        @param points <numpy 2D-array>: coordinates of the points (shape: (N, 2))
+        @param block_size <int>: number of points processed at once
+        @return <numpy 1D-array, numpy 2D-array>: index of the triangle containing each point (-1 if outside the mesh)
+            and barycentric coordinates (shape: (N, 3), zeros if outside the mesh)
+           If a point is on the boundary of several triangles, the triangle with the lowest index is selected.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        nb_points = points.shape[0]
+        element_indices = np.full(nb_points, -1, dtype=np.int64)
+        weights = np.zeros((nb_points, 3), dtype=np.float64)
+        if self.nb_triangles == 0:
+            return element_indices, weights
+
+        index = self.get_element_index()
+        for start_index in range(0, nb_points, block_size):
+            block = points[start_index:start_index + block_size]
+            candidates, counts = index.intersection_v(block, block)
+            if candidates.size == 0:
                 continue
-            for i, j, k in potential_elements:
-                t = self.triangles[i, j, k]
-                is_in, point_interpolator = Interpolator(t).is_in_triangle(x, y)
-                if is_in:
-                    is_inside[index] = True
-                    point_interpolators[index] = ((i, j, k), point_interpolator)
-                    break
+            point_indices = np.repeat(np.arange(block.shape[0]), counts.astype(np.int64))
+            coords = self.barycentric_coordinates(candidates, block[point_indices])
+            is_in = np.all((coords >= 0) & (coords <= 1), axis=1)
+            candidates, point_indices, coords = candidates[is_in], point_indices[is_in], coords[is_in]
+
+            # keep the first containing triangle for every point
+            order = np.lexsort((candidates, point_indices))
+            candidates, point_indices, coords = candidates[order], point_indices[order], coords[order]
+            is_first = np.ones(point_indices.shape, dtype=bool)
+            is_first[1:] = point_indices[1:] != point_indices[:-1]
+            element_indices[start_index + point_indices[is_first]] = candidates[is_first]
+            weights[start_index + point_indices[is_first]] = coords[is_first]
+        return element_indices, weights
 
+    def get_point_interpolators(self, points):
+        element_indices, weights = self.locate_points(points)
+        is_inside = (element_indices >= 0).tolist()
+        point_interpolators = [None] * len(is_inside)
+        for index in np.flatnonzero(element_indices >= 0):
+            i, j, k = self.ikle[element_indices[index]]
+            point_interpolators[index] = ((i, j, k), weights[index])
         return is_inside, point_interpolators
 
+    def get_projection_matrix(self, points, nb_nodes=None):
+        """!
+        @brief Build the interpolation operator from the mesh nodes to arbitrary points
+        @param points <numpy 2D-array>: coordinates of the points (shape: (N, 2))
+        @param nb_nodes <int>: number of columns (number of 2D nodes by default)
+        @return <numpy 1D-array, scipy.sparse.csr_matrix>: boolean mask of the points inside the mesh,
+            and sparse matrix (N x nb_nodes) of the barycentric coordinates
+        """
+        if nb_nodes is None:
+            nb_nodes = self.nb_points
+        element_indices, weights = self.locate_points(points)
+        is_inside = element_indices >= 0
+        indptr = np.zeros(len(element_indices) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum(3 * is_inside)
+        indices = self.ikle[element_indices[is_inside]].reshape(-1)
+        matrix = sparse.csr_matrix((weights[is_inside].reshape(-1), indices, indptr),
+                                   shape=(len(element_indices), nb_nodes))
+        return is_inside, matrix
+
+    @staticmethod
+    def point_interpolators_to_matrix(point_interpolators, nb_nodes):
+        """!
+        @brief Assemble the interpolation operator from point interpolators (see `get_point_interpolators`)
+        @param point_interpolators <[tuple]>: ((i, j, k), barycentric coordinates) for every point, None if outside
+        @param nb_nodes <int>: number of columns (number of nodes of the interpolated mesh)
+        @return <scipy.sparse.csr_matrix>: sparse matrix (number of points x nb_nodes) of the barycentric coordinates
+        """
+        inside = [interpolator for interpolator in point_interpolators if interpolator is not None]
+        indptr = np.zeros(len(point_interpolators) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([0 if interpolator is None else 3 for interpolator in point_interpolators])
+        indices = np.array([ijk for ijk, _ in inside], dtype=np.int64).reshape(-1)
+        weights = np.array([coord for _, coord in inside], dtype=np.float64).reshape(-1)
+        return sparse.csr_matrix((weights, indices, indptr), shape=(len(point_interpolators), nb_nodes))
+
+    @staticmethod
+    def interpolate_on_points(input_stream, var_ID, time_indices, point_interpolators):
+        """!
+        @brief Interpolate a variable on points for multiple frames (only the triangle vertices are read)
+        @param input_stream <slf.Serafin.Read>: input Serafin stream
+        @param var_ID <str>: variable ID
+        @param time_indices <[int]>: indices of the frames (0-based)
+        @param point_interpolators <[tuple]>: list of ((i, j, k), barycentric coordinates) for points inside the mesh
+        @return <numpy 2D-array>: interpolated values with shape (number of frames, number of points)
+        """
+        if not point_interpolators:
+            return np.empty((len(time_indices), 0))
+        vertices = np.array([ijk for ijk, _ in point_interpolators], dtype=np.int64)
+        weights = np.array([interpolator for _, interpolator in point_interpolators], dtype=np.float64)
+        nodes, vertices_index = np.unique(vertices, return_inverse=True)
+        # interpolation operator restricted to the read nodes (no temporary array of the values at the vertices)
+        matrix = sparse.csr_matrix((weights.reshape(-1), vertices_index.reshape(-1),
+                                    np.arange(0, 3 * len(vertices) + 1, 3)), shape=(len(vertices), len(nodes)))
+        values = input_stream.read_var_at_nodes(var_ID, nodes, time_indices)
+        return matrix.dot(values.T).T
+
+    @staticmethod
+    def iter_interpolate_on_points(input_stream, var_IDs, time_indices, point_interpolators):
+        """!
+        @brief Interpolate variables on points frame by frame, the frames being read by blocks
+            (the read and interpolated values of a block fit in `settings.SERAFIN_BLOCK_MEMORY`)
+        @param input_stream <slf.Serafin.Read>: input Serafin stream
+        @param var_IDs <[str]>: variable IDs
+        @param time_indices <[int]>: indices of the frames (0-based)
+        @param point_interpolators <[tuple]>: list of ((i, j, k), barycentric coordinates) for points inside the mesh
+        @return <generator>: interpolated values of every frame with shape (number of variables, number of points)
+        """
+        nb_read_nodes = len(np.unique([ijk for ijk, _ in point_interpolators]))
+        frame_size = 8 * len(var_IDs) * (nb_read_nodes + len(point_interpolators))  # read and interpolated values
+        block_size = max(1, settings.SERAFIN_BLOCK_MEMORY // max(1, frame_size))
+        for start in range(0, len(time_indices), block_size):
+            block_indices = time_indices[start:start + block_size]
+            values = np.empty((len(block_indices), len(var_IDs), len(point_interpolators)))
+            for index_var, var_ID in enumerate(var_IDs):
+                values[:, index_var, :] = MeshInterpolator.interpolate_on_points(input_stream, var_ID, block_indices,
+                                                                                 point_interpolators)
+            yield from values
+
     def _get_line_interpolators(self, line):
         intersections = []
         internal_points = []  # line interpolators without intersections
@@ -67,64 +177,37 @@ class MeshInterpolator(Mesh2D):
         offset = 0
         found_intersection = False
 
-        for right, up, segment in line.segments():  # for every segment, sort intersection points
-            segment_intersections = []
-            potential_elements = self.get_intersecting_elements(segment.bounds())
-            for i, j, k in potential_elements:
-                t = self.triangles[i, j, k]
-                is_intersected, t_intersections = segment.linestring_intersection(t)
-                if is_intersected:
-                    interpolator = Interpolator(t)
-                    for intersection in t_intersections:
-                        for x, y in intersection.coords:
-                            segment_intersections.append((x, y, (i, j, k), interpolator.get_interpolator_at(x, y)))
-
-            # first sort by y, then sort by x
-            if up:
-                segment_intersections.sort(key=lambda x: x[1])
-            else:
-                segment_intersections.sort(key=lambda x: x[1], reverse=True)
-            if right:
-                segment_intersections.sort()
-            else:
-                segment_intersections.sort(reverse=True)
-
-            intersections.extend(segment_intersections)
-            if not segment_intersections:
+        # walk along every segment and interpolate at the crossing points (in the order of the line)
+        coords = list(line.coords())
+        for first_point, segment_points in zip(coords[:-1], self.trace_polyline(coords)):
+            if not segment_points:
                 continue
+            elements = np.array([after if after >= 0 else before for _, __, before, after in segment_points])
+            points = np.array([(x, y) for x, y, _, __ in segment_points])
+            interpolators = self.barycentric_coordinates(elements, points)
+            segment_intersections = [(x, y, tuple(self.ikle[element]), interpolator, after)
+                                     for (x, y, _, after), element, interpolator
+                                     in zip(segment_points, elements, interpolators)]
+            intersections.extend(segment_intersections)
 
-            internal_points.append(segment_intersections[0])
-            internal_points.append(segment_intersections[-1])
+            internal_points.append(segment_intersections[0][:4])
+            internal_points.append(segment_intersections[-1][:4])
 
             if not found_intersection:
-                first_point, second_point = list(segment.coords())
-                if not segment_intersections:
-                    offset += np.linalg.norm(np.array(second_point) - np.array(first_point))
-                else:
-                    found_intersection = True
-                    first_intersection = np.array(segment_intersections[0][:2])
-                    offset += np.linalg.norm(first_intersection - np.array(first_point))
-
-        # if the intersection is continuous, every internal point or turning point has at least two duplicates
-        prev_x, prev_y = None, None
-        duplicates = 0
-        to_remove = [False] * len(intersections)
-        for i, (x, y, _, __) in enumerate(intersections):
-            if i == 0:  # the start and end points are not duplicated
-                continue
-            if prev_x is None:
-                prev_x, prev_y = x, y
+                found_intersection = True
+                offset += np.linalg.norm(np.array(segment_intersections[0][:2]) - np.array(first_point[:2]))
+
+        # merge the points shared by consecutive segments,
+        # the intersection is discontinuous if the line leaves the mesh before its last point
+        merged = []
+        for x, y, ijk, interpolator, after in intersections:
+            if merged and x == merged[-1][0] and y == merged[-1][1]:
+                merged[-1][4] = after
                 continue
-            if x == prev_x and y == prev_y:
-                to_remove[i] = True
-                duplicates += 1
-            else:
-                if duplicates == 0:  # no duplicate found, the intersection is discontinuous
-                    return [], [], [], []
-                duplicates = 0
-                prev_x, prev_y = x, y
-
-        intersections = [intersections[i] for i in range(len(intersections)) if not to_remove[i]]
+            merged.append([x, y, ijk, interpolator, after])
+        if any(after < 0 for _, __, ___, ____, after in merged[:-1]):
+            return [], [], [], []
+        intersections = [tuple(point[:4]) for point in merged]
 
         # trim internal points from 2n+2 to n+1
         if internal_points:
@@ -0,0 +1,87 @@
+"""!
+Time-chunked parallel execution of per-frame calculators
+
+Calculators iterating over the frames of a single Serafin file (volumes, fluxes, max/min/mean, arrival/duration)
+split their time indices in contiguous chunks which are processed by a pool of processes.
+Every worker opens its own input stream on the Serafin file and computes the partial result of a chunk,
+the partial results are returned in the order of the chunks so that the calculator can combine them.
+"""
+
+import copy
+from multiprocessing import Pool
+import numpy as np
+
+
+# Attributes of the calculators which are not sent to the workers
+# (the input stream is opened again by every worker, the mesh is only needed to construct the calculator)
+DETACHED_ATTRIBUTES = ('input_stream', 'mesh')
+
+_calculator = None  # calculator of the worker process (set by `_init_worker`)
+_stream_args = None  # class, filename and language of the input stream (set by `_init_worker`)
+
+
+def split_time_indices(time_indices, nb_chunks):
+    """!
+    @brief Split time indices in contiguous chunks of (almost) equal sizes
+    @param time_indices <[int]>: indices of the frames (0-based)
+    @param nb_chunks <int>: maximum number of chunks
+    @return <[[int]]>: non-empty chunks of time indices
+    """
+    time_indices = np.array(time_indices, dtype=np.int64)
+    if len(time_indices) == 0:
+        return []
+    nb_chunks = max(1, min(nb_chunks, len(time_indices)))
+    return [chunk.tolist() for chunk in np.array_split(time_indices, nb_chunks)]
+
+
+def detach(calculator):
+    """!
+    @brief Copy a calculator without its input stream (and mesh) to be sent to worker processes
+    @param calculator: calculator with an `input_stream` attribute
+    @return: shallow copy of the calculator
+    """
+    calculator = copy.copy(calculator)
+    for attribute in DETACHED_ATTRIBUTES:
+        if hasattr(calculator, attribute):
+            setattr(calculator, attribute, None)
+    return calculator
+
+
+def _init_worker(calculator, stream_class, filename, language):
+    global _calculator, _stream_args
+    _calculator = calculator
+    _stream_args = stream_class, filename, language
+
+
+def _map_chunk(task):
+    map_function, chunk, args = task
+    stream_class, filename, language = _stream_args
+    with stream_class(filename, language) as input_stream:
+        input_stream.read_header()
+        input_stream.get_time()
+        _calculator.input_stream = input_stream
+        try:
+            return getattr(_calculator, map_function)(chunk, *args)
+        finally:
+            _calculator.input_stream = None
+
+
+def map_chunks(calculator, map_function, chunks, nb_processes=1, args=()):
+    """!
+    @brief Compute the partial results of a calculator on chunks of frames, in parallel if nb_processes > 1
+    @param calculator: calculator with an `input_stream` attribute (opened input Serafin stream)
+    @param map_function <str>: name of the calculator method computing the partial result of a chunk
+        (called with the chunk and the additional arguments, it should not modify the calculator)
+    @param chunks <[[int]]>: chunks of time indices (see `split_time_indices`)
+    @param nb_processes <int>: number of processes
+    @param args <tuple>: additional arguments of the map function
+    @return <list>: partial results in the order of the chunks
+    """
+    if nb_processes <= 1 or len(chunks) <= 1:
+        method = getattr(calculator, map_function)
+        return [method(chunk, *args) for chunk in chunks]
+
+    input_stream = calculator.input_stream
+    initargs = (detach(calculator), type(input_stream), input_stream.filename, input_stream.language)
+    with Pool(min(nb_processes, len(chunks)), initializer=_init_worker, initargs=initargs) as pool:
+        return pool.map(_map_chunk, [(map_function, chunk, args) for chunk in chunks], chunksize=1)
@@ -2,10 +2,51 @@
 Representation of the 2D mesh in a 2D Serafin file.
 """
 
+from collections.abc import Mapping
 import numpy as np
 from rtree.index import Index
 from shapely.geometry import Polygon
 
+from pyteltools.conf import settings
+
+from . import index_cache
+
+
+# Tolerance on the position along a segment (relative to the segment length) used to trace polylines
+TRACE_EPS = 1e-9
+
+
+class LazyTriangles(Mapping):
+    """!
+    @brief Triangles of the mesh as shapely polygons (keyed by (i,j,k)), built only on first access
+
+    Iteration follows the connectivity table. Polygons can also be assigned explicitly (like in a dict).
+    """
+    def __init__(self, points, ikle):
+        """!
+        @param points <numpy 2D-array>: coordinates of the nodes (shape: (nb_points, 2))
+        @param ikle <numpy 2D-array>: connectivity table (0-based, shape: (nb_triangles, 3))
+        """
+        self.points = points
+        self.ikle = ikle
+        self._polygons = {}
+
+    def __getitem__(self, key):
+        if key not in self._polygons:
+            i, j, k = key
+            self._polygons[key] = Polygon([self.points[i], self.points[j], self.points[k]])
+        return self._polygons[key]
+
+    def __setitem__(self, key, polygon):
+        self._polygons[key] = polygon
+
+    def __iter__(self):
+        for i, j, k in self.ikle:
+            yield i, j, k
+
+    def __len__(self):
+        return self.ikle.shape[0]
+
 
 class Mesh2D:
     """!
@@ -18,33 +59,246 @@ class Mesh2D:
         @param construct_index <bool>: perform the index construction
         @param iter_pbar: iterable progress bar
         """
+        self.input_header = input_header
         self.x, self.y = input_header.x[:input_header.nb_nodes_2d], input_header.y[:input_header.nb_nodes_2d]
         self.ikle = input_header.ikle_2d - 1  # back to 0-based indexing
         self.triangles = {}
         self.nb_points = self.x.shape[0]
         self.nb_triangles = self.ikle.shape[0]
         self.points = np.stack([self.x, self.y], axis=1)
+        self._element_index = None
+        self._bounding_boxes = None  # (xmin, ymin, xmax, ymax) of every triangle (set if the index is cached)
+        self._neighbors = None
         if not construct_index:
             self.index = Index()
         else:
             self._construct_index(iter_pbar)
 
-    def _construct_index(self, iter_pbar):
+    def get_bounding_boxes(self):
+        """!
+        @brief Compute the bounding boxes of all triangles
+        @return <numpy 2D-array, numpy 2D-array>: lower-left (xmin, ymin) and upper-right (xmax, ymax) corners
+            of every triangle (shape: (nb_triangles, 2))
+        """
+        if self._bounding_boxes is not None:
+            return self._bounding_boxes[:, :2], self._bounding_boxes[:, 2:]
+        coords = self.points[self.ikle]  # shape: (nb_triangles, 3, 2)
+        return coords.min(axis=1), coords.max(axis=1)
+
+    def _construct_index(self, iter_pbar, use_cache=None):
         """!
         Separate the index construction from the constructor, allowing a GUI override
-        @param iter_pbar: iterable progress bar
+        The rtree is bulk-loaded from the bounding boxes (with element indices as identifiers)
+        and the triangle polygons are only built when they are accessed.
+        The index of large meshes is stored in (and read from) the index cache (see `slf.index_cache`).
+        @param iter_pbar: iterable progress bar (advanced after the bounding boxes and after the bulk load)
+        @param use_cache <bool>: use the index cache (`settings.SERAFIN_INDEX_CACHE` by default)
+        """
+        self.triangles = LazyTriangles(self.points, self.ikle)
+        if self.nb_triangles == 0:
+            self.index = Index()
+            return
+        if use_cache is None:
+            use_cache = settings.SERAFIN_INDEX_CACHE
+        key = None
+        if use_cache and self.nb_triangles >= settings.SERAFIN_INDEX_CACHE_MIN_ELEMENTS:
+            key = self.input_header.mesh_fingerprint
+            entry = index_cache.load_entry(key)
+            if entry is not None:
+                self.index, self._bounding_boxes = entry
+                return
+        mins, maxs = None, None
+        for step in iter_pbar(range(2), unit='steps'):
+            if step == 0:
+                mins, maxs = self.get_bounding_boxes()
+            else:  # bulk load (stored in the index cache if the mesh is large enough)
+                entry = None
+                if key is not None and index_cache.store_entry(key, mins, maxs):
+                    entry = index_cache.load_entry(key)
+                if entry is not None:
+                    self.index, self._bounding_boxes = entry
+                else:
+                    self.index = Index((np.arange(self.nb_triangles, dtype=np.int64), mins, maxs))
+
+    def get_neighbors(self):
+        """!
+        @brief Return the element adjacency (computed on first call)
+        @return <numpy 2D-array>: index of the element sharing the edge between the local nodes l and (l+1)%3
+            of every element (-1 for boundary edges), shape: (nb_triangles, 3)
+        """
+        if self._neighbors is None:
+            edges = np.sort(self.ikle[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2).astype(np.int64), axis=1)
+            edges_key = edges[:, 0] * (self.nb_points + 1) + edges[:, 1]
+            order = np.argsort(edges_key, kind='stable')
+            is_shared = edges_key[order[1:]] == edges_key[order[:-1]]
+            first, second = order[:-1][is_shared], order[1:][is_shared]
+            neighbors = np.full(3 * self.nb_triangles, -1, dtype=np.int64)
+            neighbors[first] = second // 3
+            neighbors[second] = first // 3
+            self._neighbors = neighbors.reshape(-1, 3)
+        return self._neighbors
+
+    def barycentric_coordinates(self, element_indices, points):
+        """!
+        @brief Compute the barycentric coordinates of points in triangles (same formula as `Interpolator`)
+        @param element_indices <numpy 1D-array>: index of the triangle for every point
+        @param points <numpy 2D-array>: coordinates of the points (shape: (N, 2))
+        @return <numpy 2D-array>: barycentric coordinates (shape: (N, 3))
+        """
+        coords = self.points[self.ikle[element_indices]].astype(np.float64)  # shape: (N, 3, 2)
+        x1, x2, x3 = coords[:, 0, 0], coords[:, 1, 0], coords[:, 2, 0]
+        y1, y2, y3 = coords[:, 0, 1], coords[:, 1, 1], coords[:, 2, 1]
+        vec_x = np.stack([x2-x3, x3-x1, x1-x2], axis=1)
+        vec_y = np.stack([y2-y3, y3-y1, y1-y2], axis=1)
+        vec_norm_z = np.zeros_like(vec_x)
+        vec_norm_z[:, 0] = (x2-x1) * (y3-y1) - (y2-y1) * (x3-x1)
+        with np.errstate(divide='ignore', invalid='ignore'):  # degenerated triangles never contain any point
+            inv_norm_z = 1 / vec_norm_z[:, [0]]
+            return (vec_norm_z + (points[:, [0]]-x1[:, np.newaxis]) * vec_y
+                    - (points[:, [1]]-y1[:, np.newaxis]) * vec_x) * inv_norm_z
+
+    def _clip_line(self, element_indices, start, direction):
+        """!
+        @brief Clip the line start + t * direction with triangles
+        @param element_indices <numpy 1D-array>: indices of the triangles
+        @param start <numpy 1D-array>: a point of the line
+        @param direction <numpy 1D-array>: direction of the line
+        @return <numpy 1D-array, numpy 1D-array, numpy 1D-array>: line parameters where the line enters and exits
+            every triangle (empty if enter > exit) and local index of the exit edge
+        """
+        coords = self.points[self.ikle[element_indices]].astype(np.float64)  # shape: (N, 3, 2)
+        edges = np.roll(coords, -1, axis=1) - coords  # edge l from local node l to local node (l+1)%3
+        orientation = np.sign(edges[:, 0, 0] * edges[:, 1, 1] - edges[:, 0, 1] * edges[:, 1, 0])[:, np.newaxis]
+        # Inside the half-plane of an edge when c0 + t * c1 >= 0
+        to_start = start - coords
+        c0 = orientation * (edges[:, :, 0] * to_start[:, :, 1] - edges[:, :, 1] * to_start[:, :, 0])
+        c1 = orientation * (edges[:, :, 0] * direction[1] - edges[:, :, 1] * direction[0])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = -c0 / c1
+        t_enter = np.where(c1 > 0, t, -np.inf).max(axis=1)
+        t_exit_edges = np.where(c1 < 0, t, np.inf)
+        exit_edge = t_exit_edges.argmin(axis=1)
+        t_exit = t_exit_edges[np.arange(len(element_indices)), exit_edge]
+        t_enter[np.any((c1 == 0) & (c0 < 0), axis=1)] = np.inf  # parallel to an edge and outside
+        return t_enter, t_exit, exit_edge
+
+    def _find_element_on_segment(self, start, end, t):
+        """!
+        @brief Find the first triangle crossed by the segment [start, end] after the parameter t
+        @return <int, float>: element index and line parameter where the segment enters it (-1 and None if not found)
+        """
+        direction = end - start
+        point = start + t * direction
+        # Look first for the elements containing the current point, then for all elements along the segment
+        for mins, maxs, t_max in ((point, point, t + TRACE_EPS),
+                                  (np.minimum(point, end), np.maximum(point, end), 1 - TRACE_EPS)):
+            candidates, _ = self.get_element_index().intersection_v(mins[np.newaxis, :], maxs[np.newaxis, :])
+            if candidates.size == 0:
+                continue
+            candidates = np.sort(candidates)
+            t_enter, t_exit, _ = self._clip_line(candidates, start, direction)
+            t_enter = np.maximum(t_enter, t)
+            is_crossed = (t_exit > t_enter + TRACE_EPS) & (t_enter <= t_max)
+            if np.any(is_crossed):
+                candidates, t_enter, t_exit = candidates[is_crossed], t_enter[is_crossed], t_exit[is_crossed]
+                best = np.lexsort((-t_exit, t_enter))[0]  # first entered, then longest crossing
+                return candidates[best], t_enter[best]
+        return -1, None
+
+    def _trace_segment(self, start, end, element):
+        """!
+        @brief Follow a segment from element to element
+        @param start <numpy 1D-array>: first point of the segment
+        @param end <numpy 1D-array>: last point of the segment
+        @param element <int>: element containing the first point (-1 if unknown)
+        @return <[tuple], int>: list of tuples (t, element before, element after) for every crossing point,
+            and element containing the last point (-1 if outside)
+        """
+        direction = end - start
+        neighbors = self.get_neighbors()
+        crossings = []
+
+        t = 0.0
+        if element >= 0:
+            t_enter, t_exit, _ = self._clip_line(np.array([element]), start, direction)
+            if not (t_enter[0] <= TRACE_EPS and t_exit[0] > TRACE_EPS):
+                element = -1
+        if element < 0:
+            element, t = self._find_element_on_segment(start, end, 0.0)
+            if element < 0:
+                return crossings, -1
+        crossings.append((t, -1, element))
+
+        while True:
+            _, t_exit, exit_edge = self._clip_line(np.array([element]), start, direction)
+            if t_exit[0] >= 1 - TRACE_EPS:
+                crossings.append((1.0, element, -1))
+                return crossings, element
+            t = t_exit[0]
+            next_element = neighbors[element, exit_edge[0]]
+            if next_element >= 0:
+                t_enter, t_exit, _ = self._clip_line(np.array([next_element]), start, direction)
+                if t_enter[0] <= t + TRACE_EPS and t_exit[0] > t + TRACE_EPS:
+                    crossings.append((t, element, next_element))
+                    element = next_element
+                    continue
+            # Outside the mesh or through a node: look for the next crossed element
+            next_element, t_next = self._find_element_on_segment(start, end, t)
+            if next_element < 0:
+                crossings.append((t, element, -1))
+                return crossings, -1
+            if t_next <= t + TRACE_EPS:
+                crossings.append((t, element, next_element))
+            else:
+                crossings.append((t, element, -1))
+                crossings.append((t_next, -1, next_element))
+            element = next_element
+
+    def trace_polyline(self, coords):
+        """!
+        @brief Follow a polyline through the mesh by walking from element to element
+        @param coords <[tuple]>: coordinates of the polyline vertices (only x and y are considered)
+        @return <[[tuple]]>: for every segment of the polyline, the list of crossing points in the order of the
+            polyline, as tuples (x, y, element before, element after). The elements before/after are the triangles
+            containing the segment before/after the point (-1 outside the mesh). The first and last points of
+            a segment are included if they are inside the mesh.
+        """
+        vertices = np.array([coord[:2] for coord in coords], dtype=np.float64)
+        segments = []
+        element = -1
+        for start, end in zip(vertices[:-1], vertices[1:]):
+            if np.array_equal(start, end):
+                segments.append([])
+                continue
+            crossings, element = self._trace_segment(start, end, element)
+            points = []
+            for t, before, after in crossings:
+                x, y = start if t == 0 else (end if t == 1 else start + t * (end - start))
+                points.append((x, y, before, after))
+            segments.append(points)
+        return segments
+
+    def get_element_index(self):
+        """!
+        @brief Return a spatial index of the triangles with element indices as identifiers (for vectorized queries)
+        @return <rtree.index.Index>: the mesh index if it was bulk-loaded, otherwise a bulk-loaded copy
         """
-        self.index = Index()
-        for i, j, k in iter_pbar(self.ikle, unit='elements'):
-            t = Polygon([self.points[i], self.points[j], self.points[k]])
-            self.triangles[i, j, k] = t
-            self.index.insert(i, t.bounds, obj=(i, j, k))
+        if isinstance(self.triangles, LazyTriangles):
+            return self.index
+        if self._element_index is None:
+            mins, maxs = self.get_bounding_boxes()
+            self._element_index = Index((np.arange(self.nb_triangles, dtype=np.int64), mins, maxs))
+        return self._element_index
 
     def get_intersecting_elements(self, bounding_box):
         """!
         @brief Return the triangles in the mesh intersecting the bounding box
         @param bounding_box <tuple>: (left, bottom, right, top) of a 2d geometrical object
         @return <[tuple]>: The list of triangles (i,j,k) intersecting the bounding box
-           Beware: The returned list is not sorted
+           Beware: The returned list is not sorted, except for a bulk-loaded index (sorted by element index)
         """
+        if isinstance(self.triangles, LazyTriangles):  # bulk-loaded index: identifiers are element indices
+            # Elements are sorted to keep the order of the connectivity table (as with incremental insertions)
+            element_indices = np.sort(np.fromiter(self.index.intersection(bounding_box), dtype=np.int64))
+            return [(i, j, k) for i, j, k in self.ikle[element_indices]]
         return list(self.index.intersection(bounding_box, objects='raw'))
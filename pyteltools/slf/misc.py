@@ -2,6 +2,7 @@
 Simple computation/evaluation of variable values in Serafin
 """
 
+import copy
 import numpy as np
 import re
 import shapefile
@@ -9,8 +10,11 @@ import shapefile
 from pyteltools.conf import settings
 
 from . import Serafin
+from .interpolation import MeshInterpolator
+from .mapreduce import map_chunks, split_time_indices
 from .util import logger
-from .variables import do_calculations_in_frame, get_available_variables, get_necessary_equations
+from .variables import do_calculations_in_frame, get_available_variables, get_necessary_equations, \
+    get_read_var_IDs
 from .variable.variables_utils import do_calculation
 
 
@@ -578,12 +582,31 @@ class ScalarMaxMinMeanCalculator:
         self.nb_nodes = input_stream.header.nb_nodes
         self.additional_equations = additional_equations
 
+        self.current_values = self.initial_values()
+
+    def initial_values(self):
+        """!
+        @return <numpy 2D-array>: neutral values of the operation with shape (number of variables, number of nodes)
+        """
         if self.maxmin == MAX:
-            self.current_values = np.ones((self.nb_var, self.nb_nodes)) * (-float('Inf'))
+            return np.ones((self.nb_var, self.nb_nodes)) * (-float('Inf'))
         elif self.maxmin == MIN:
-            self.current_values = np.ones((self.nb_var, self.nb_nodes)) * float('Inf')
-        else:
-            self.current_values = np.zeros((self.nb_var, self.nb_nodes))
+            return np.ones((self.nb_var, self.nb_nodes)) * float('Inf')
+        return np.zeros((self.nb_var, self.nb_nodes))
+
+    def combine(self, first_values, second_values):
+        """!
+        @brief Combine two partial results (max, min or sum of frames)
+        @param first_values <numpy 2D-array>: first partial result
+        @param second_values <numpy 2D-array>: second partial result
+        @return <numpy 2D-array>: combined result
+        """
+        with np.errstate(invalid='ignore'):
+            if self.maxmin == MAX:
+                return np.maximum(first_values, second_values)
+            elif self.maxmin == MIN:
+                return np.minimum(first_values, second_values)
+            return first_values + second_values
 
     def additional_computation_in_frame(self, time_index):
         computed_values = {}
@@ -619,14 +642,70 @@ class ScalarMaxMinMeanCalculator:
             else:
                 self.current_values += values
 
+    def reduce_block(self, read_var_IDs, block_values):
+        """!
+        @brief Compute the max/min/sum of a block of frames
+        @param read_var_IDs <[str]>: variables read in the input stream
+        @param block_values <numpy 3D-array>: values with shape (number of frames, number of variables, number of nodes)
+        @return <numpy 2D-array>: values with shape (number of selected variables, number of nodes)
+        """
+        computed_values = {var_ID: block_values[:, i, :] for i, var_ID in enumerate(read_var_IDs)}
+        if self.additional_equations is not None:
+            for equation in self.additional_equations:
+                input_values = [computed_values[input_var.ID()] for input_var in equation.input]
+                computed_values[equation.output.ID()] = do_calculation(equation, input_values)
+
+        values = np.empty((len(block_values), self.nb_var, self.nb_nodes))
+        for i, (var, _, _) in enumerate(self.selected_scalars):
+            values[:, i, :] = computed_values[var]
+
+        with np.errstate(invalid='ignore'):
+            if self.maxmin == MAX:
+                return values.max(axis=0)
+            elif self.maxmin == MIN:
+                return values.min(axis=0)
+            return values.sum(axis=0)
+
+    def max_min_mean_in_block(self, read_var_IDs, block_values):
+        """!
+        @brief Update the current values with a block of frames
+        @param read_var_IDs <[str]>: variables read in the input stream
+        @param block_values <numpy 3D-array>: values with shape (number of frames, number of variables, number of nodes)
+        """
+        self.current_values = self.combine(self.current_values, self.reduce_block(read_var_IDs, block_values))
+
+    def get_read_var_IDs(self):
+        """!
+        @return <[str]>: variables read in every frame
+        """
+        equations = [] if self.additional_equations is None else self.additional_equations
+        return get_read_var_IDs(self.input_stream.header.var_IDs, equations,
+                                [var for var, _, _ in self.selected_scalars])
+
+    def max_min_mean_in_time_indices(self, time_indices):
+        """!
+        @brief Compute the max/min/sum of a chunk of frames (the current values are not modified)
+        @param time_indices <[int]>: indices of the frames (0-based)
+        @return <numpy 2D-array>: values with shape (number of selected variables, number of nodes)
+        """
+        read_var_IDs = self.get_read_var_IDs()
+        values = self.initial_values()
+        for _, block_values in self.input_stream.iter_frame_blocks(read_var_IDs, time_indices):
+            values = self.combine(values, self.reduce_block(read_var_IDs, block_values))
+        return values
+
     def finishing_up(self):
         if self.maxmin == MEAN:
             self.current_values /= len(self.time_indices)
         return self.current_values
 
-    def run(self):
-        for time_index in self.time_indices:
-            self.max_min_mean_in_frame(time_index)
+    def run(self, nb_processes=1):
+        """!
+        @param nb_processes <int>: number of processes (frames are split in chunks computed in parallel if > 1)
+        """
+        chunks = split_time_indices(self.time_indices, nb_processes)
+        for values in map_chunks(self, 'max_min_mean_in_time_indices', chunks, nb_processes):
+            self.current_values = self.combine(self.current_values, values)
 
 
 class VerticalMaxMinMeanCalculator:
@@ -854,9 +933,55 @@ class ArrivalDurationCalculator:
         self.previous_value = current_value
         self.previous_time = current_time
 
-    def run(self):
-        for index in self.time_indices[1:]:
-            self.arrival_duration_in_frame(index)
+    def arrival_duration_in_chunk(self, time_indices):
+        """!
+        @brief Compute the arrival/duration in a chunk of frames independently of the previous frames
+            (the state of the calculator is not modified)
+            The duration is computed as if the last forward flip before the chunk occurred at time 0.
+            For the nodes which satisfy the condition at the beginning of the chunk, this flip is used
+            by the first backward flip in the chunk (or at the end of the last frame), its time has then to be
+            subtracted to the duration.
+        @param time_indices <[int]>: indices of the frames (0-based), starting with the frame preceding the chunk
+        @return <tuple>: duration, arrival, time of the last forward flip, nodes flipping forward in the chunk
+            and nodes using the last forward flip before the chunk
+        """
+        chunk = copy.copy(self)
+        nb_nodes = self.input_stream.header.nb_nodes
+        chunk.previous_time = self.input_stream.time[time_indices[0]]
+        chunk.previous_value = evaluate_expression(self.input_stream, time_indices[0], self.expression)
+        chunk.previous_flag = self.test_condition(chunk.previous_value)
+        chunk.duration = np.zeros((nb_nodes,))
+        chunk.arrival = np.ones((nb_nodes,)) * float('Inf')
+        chunk.previous_flip = np.zeros((nb_nodes,))
+
+        initial_flag = chunk.previous_flag
+        flip_forward = np.zeros((nb_nodes,), dtype=bool)
+        for index in time_indices[1:]:
+            previous_flag = chunk.previous_flag
+            chunk.arrival_duration_in_frame(index)
+            flip_forward |= np.logical_and(chunk.previous_flag, np.logical_not(previous_flag))
+
+        is_last = time_indices[-1] == self.time_indices[-1]
+        uses_previous_flip = np.logical_and(initial_flag, is_last | np.logical_not(chunk.previous_flag) | flip_forward)
+        return chunk.duration, chunk.arrival, chunk.previous_flip, flip_forward, uses_previous_flip
+
+    def run(self, nb_processes=1):
+        """!
+        @param nb_processes <int>: number of processes (frames are split in chunks computed in parallel if > 1)
+        """
+        if nb_processes <= 1:
+            for index in self.time_indices[1:]:
+                self.arrival_duration_in_frame(index)
+            return
+
+        # every chunk starts with the frame preceding it, the states of the chunks are then handed off in order
+        chunks = [list(self.time_indices[positions[0] - 1:positions[-1] + 1])
+                  for positions in split_time_indices(range(1, len(self.time_indices)), nb_processes)]
+        for duration, arrival, flip, flip_forward, uses_previous_flip in \
+                map_chunks(self, 'arrival_duration_in_chunk', chunks, nb_processes):
+            self.duration = self.duration + duration - np.where(uses_previous_flip, self.previous_flip, 0)
+            self.arrival = np.minimum(self.arrival, arrival)
+            self.previous_flip = np.where(flip_forward, flip, self.previous_flip)
 
 
 class Condition:
@@ -869,14 +994,14 @@ class Condition:
         self.comparator = comparator
         self.threshold = threshold
 
+    def test_condition(self, value):
         if self.comparator == '>':
-            self.test_condition = lambda value: value > self.threshold
+            return value > self.threshold
         elif self.comparator == '<':
-            self.test_condition = lambda value: value < self.threshold
+            return value < self.threshold
         elif self.comparator == '>=':
-            self.test_condition = lambda value: value >= self.threshold
-        else:
-            self.test_condition = lambda value: value <= self.threshold
+            return value >= self.threshold
+        return value <= self.threshold
 
     def __repr__(self):
         return ' '.join(self.expression) + ' %s %s' % (self.comparator, str(self.threshold))
@@ -893,12 +1018,16 @@ class ProjectMeshCalculator:
                  time_indices, operation_type, use_reference=False):
         self.first_in = first_in
         self.second_in = second_in
-        self.is_inside = is_inside
+        self.is_inside = np.array(is_inside, dtype=bool)
         self.point_interpolators = point_interpolators
         self.time_indices = time_indices
         self.operation_type = operation_type
         self.selected_vars = selected_vars
 
+        # Interpolation operator (first mesh nodes x second mesh nodes)
+        self.projection = MeshInterpolator.point_interpolators_to_matrix(point_interpolators,
+                                                                         self.second_in.header.nb_nodes)
+
         self.use_reference = use_reference
         if self.use_reference:
             self.first_values = self.read_values_in_frame(0, False)
@@ -909,47 +1038,38 @@ class ProjectMeshCalculator:
         self.nb_nodes = self.first_in.header.nb_nodes
 
     def read_values_in_frame(self, time_index, read_second):
-        values = []
-        for var_ID in self.selected_vars:
-            if read_second:
-                values.append(self.second_in.read_var_in_frame(time_index, var_ID))
-            else:
-                values.append(self.first_in.read_var_in_frame(time_index, var_ID))
-        return values
+        input_stream = self.second_in if read_second else self.first_in
+        return input_stream.read_vars_in_frame(time_index, self.selected_vars)
 
     def interpolate(self, values):
-        interpolated_values = []
-        for index_node in range(self.nb_nodes):
-            if not self.is_inside[index_node]:
-                interpolated_values.append(np.nan)
-            else:
-                (i, j, k), interpolator = self.point_interpolators[index_node]
-                interpolated_values.append(interpolator.dot(values[[i, j, k]]))
+        """!
+        @brief Interpolate values of the second mesh on the nodes of the first mesh
+        @param values <numpy array>: values on the second mesh, shape (nb_nodes_second,) or (nb_var, nb_nodes_second)
+        @return <numpy array>: interpolated values (NaN outside the second mesh),
+            shape (nb_nodes,) or (nb_var, nb_nodes)
+        """
+        interpolated_values = self.projection.dot(np.asarray(values, dtype=np.float64).T).T
+        interpolated_values[..., ~self.is_inside] = np.nan
         return interpolated_values
 
     def operation_in_frame(self, first_time_index, second_time_index):
+        second_values = self.interpolate(self.read_values_in_frame(second_time_index, True))
         if self.operation_type == PROJECT:  # projection
-            second_values = self.read_values_in_frame(second_time_index, True)
-            return np.array([self.interpolate(second_values[i]) for i in range(self.nb_var)])
+            return second_values
 
         if self.use_reference:
             first_values = self.first_values
         else:
-            first_values = np.array(self.read_values_in_frame(first_time_index, False))
-        second_values = self.read_values_in_frame(second_time_index, True)
+            first_values = self.read_values_in_frame(first_time_index, False)
 
         if self.operation_type == DIFF:
-            return np.array([first_values[i] - np.array(self.interpolate(second_values[i]))
-                             for i in range(self.nb_var)])
+            return first_values - second_values
         elif self.operation_type == REV_DIFF:
-            return np.array([np.array(self.interpolate(second_values[i])) - first_values[i]
-                             for i in range(self.nb_var)])
+            return second_values - first_values
         elif self.operation_type == MAX_BETWEEN:
-            return np.array([np.maximum(self.interpolate(second_values[i]), first_values[i])
-                             for i in range(self.nb_var)])
+            return np.maximum(second_values, first_values)
         else:
-            return np.array([np.minimum(self.interpolate(second_values[i]), first_values[i])
-                             for i in range(self.nb_var)])
+            return np.minimum(second_values, first_values)
 
     def run(self, out_stream, out_header):
         for first_time_index, second_time_index in self.time_indices:
@@ -0,0 +1,135 @@
+"""!
+Read-ahead of Serafin frames in a background thread
+
+Calculators alternate between reading a frame and computing on it. `PrefetchReader` wraps a `Serafin.Read` stream
+and reads the upcoming frames of a declared access pattern (time indices and variables) in a background thread,
+so that disk accesses overlap with computations.
+The wrapper exposes the reading methods used by the calculators (`read_var_in_frame` and `read_vars_in_frame`),
+requests which do not follow the access pattern are simply forwarded to the wrapped stream.
+"""
+
+import numpy as np
+import queue
+import threading
+
+from pyteltools.conf import settings
+
+from .util import logger
+
+
+class PrefetchReader:
+    """!
+    @brief Serafin input stream wrapper reading frames ahead in a background thread
+
+    # Attributes:
+    - input_stream <slf.Serafin.Read>: wrapped input stream (header has to be read)
+    - header <slf.Serafin.SerafinHeader>: Serafin header (from input stream)
+    - time <numpy 1D-array>: time series in seconds (from input stream)
+    - time_indices <[int]>: expected sequence of frame indices
+    - var_IDs <[str]>: variables read in every frame
+    - nb_buffers <int>: maximum number of frames read in advance (prefetching is disabled if 0)
+    """
+    def __init__(self, input_stream, time_indices, var_IDs=None, nb_buffers=None):
+        """!
+        @param input_stream <slf.Serafin.Read>: input Serafin stream
+        @param time_indices <[int]>: expected sequence of frame indices (0-based)
+        @param var_IDs <[str]>: variables to read (if not present, all variables are considered)
+        @param nb_buffers <int>: number of frames read in advance (`settings.SERAFIN_PREFETCH_FRAMES` by default)
+        """
+        self.input_stream = input_stream
+        self.header = input_stream.header
+        self.time = input_stream.time
+        self.time_indices = list(time_indices)
+        self.var_IDs = list(self.header.var_IDs if var_IDs is None else var_IDs)
+        self.nb_buffers = settings.SERAFIN_PREFETCH_FRAMES if nb_buffers is None else nb_buffers
+
+        self._pos_vars = {var_ID: pos_var for pos_var, var_ID in enumerate(self.var_IDs)}
+        self._positions = {}  # position of each frame in the access pattern
+        for position, time_index in enumerate(self.time_indices):
+            self._positions.setdefault(time_index, position)
+        self._position = -1  # position of the current frame
+        self._values = None  # values of the current frame
+
+        self._lock = threading.Lock()  # the wrapped stream is not thread-safe
+        self._queue = queue.Queue(maxsize=max(1, self.nb_buffers))
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        if self.nb_buffers > 0 and self.time_indices:
+            self._thread = threading.Thread(target=self._read_ahead, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._thread is not None:
+            self._stop.set()
+            while self._thread.is_alive():
+                try:  # unblock the reading thread if the buffers are full
+                    self._queue.get(timeout=0.01)
+                except queue.Empty:
+                    pass
+            self._thread = None
+        return False
+
+    def _read_ahead(self):
+        try:
+            for time_index in self.time_indices:
+                with self._lock:
+                    values = self.input_stream.read_vars_in_frame(time_index, self.var_IDs)
+                values.flags.writeable = False  # as memory-mapped or buffered reads
+                while not self._stop.is_set():
+                    try:
+                        self._queue.put((time_index, values), timeout=0.1)
+                        break
+                    except queue.Full:
+                        pass
+                else:
+                    return
+        except Exception as e:
+            # Re-raised in the consumer thread
+            self._queue.put((None, e))
+
+    def _get_frame(self, time_index):
+        """!
+        @brief Get the prefetched values of a frame if it is the current frame or an upcoming frame
+        @param time_index <int>: the index of the frame (0-based)
+        @return <numpy 2D-array>: values of the prefetched variables or None if the frame is not prefetched
+        """
+        if self._thread is None or time_index not in self._positions:
+            return None
+        position = self._positions[time_index]
+        if position == self._position:
+            return self._values
+        if position < self._position:
+            return None
+        while self._position < position:
+            frame_index, values = self._queue.get()
+            if frame_index is None:
+                raise values
+            self._position += 1
+        self._values = values
+        return values
+
+    def read_var_in_frame(self, time_index, var_ID):
+        """!
+        @brief Read a single variable in a frame (see `Serafin.Read.read_var_in_frame`)
+        """
+        if var_ID in self._pos_vars:
+            values = self._get_frame(time_index)
+            if values is not None:
+                return values[self._pos_vars[var_ID]]
+        logger.debug('Frame %i of variable %s is not prefetched' % (time_index, var_ID))
+        with self._lock:
+            return self.input_stream.read_var_in_frame(time_index, var_ID)
+
+    def read_vars_in_frame(self, time_index, var_IDs=None):
+        """!
+        @brief Read multiple variables in a frame (see `Serafin.Read.read_vars_in_frame`)
+        """
+        if var_IDs is None:
+            var_IDs = self.header.var_IDs
+        res = np.empty((len(var_IDs), self.header.nb_nodes), dtype=self.header.np_float_type)
+        for i, var_ID in enumerate(var_IDs):
+            res[i, :] = self.read_var_in_frame(time_index, var_ID)
+        return res
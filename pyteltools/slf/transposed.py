@@ -0,0 +1,187 @@
+"""!
+Node-major (transposed) cache of Serafin values for fast time series queries
+
+Serafin files are frame-major: reading the whole history of a single node requires a pass over the whole file.
+The cache is a sidecar folder (next to the Serafin file) which stores, for each variable, node-major `.npy` chunks
+of shape (number of nodes in chunk, number of frames in chunk), so that node time series are contiguous on disk
+and that a query only maps the chunks holding the requested nodes and frames.
+
+The cache is built once with a streaming pass over blocks of frames (the memory usage is bounded
+by `settings.SERAFIN_BLOCK_MEMORY`)
+and is only considered as valid if the size and the modification time of the Serafin file are unchanged.
+"""
+
+import json
+import numpy as np
+import os
+import shutil
+
+from .util import file_signature, logger
+
+
+# Suffix of the cache folder (appended to the Serafin filename)
+CACHE_SUFFIX = '.nodes'
+
+# File describing the cache content (written last, its presence indicates a complete cache)
+META_FILENAME = 'meta.json'
+FORMAT_VERSION = 1
+
+# Default chunk shape (number of nodes, number of frames)
+DEFAULT_NODE_CHUNK = 16384
+DEFAULT_TIME_CHUNK = 8192
+
+
+def cache_folder(filename):
+    """!
+    @param filename <str>: path to Serafin file
+    @return <str>: path to the cache folder
+    """
+    return filename + CACHE_SUFFIX
+
+
+def _chunk_filename(pos_var, node_chunk_index, time_chunk_index):
+    return '%i_%i_%i.npy' % (pos_var, node_chunk_index, time_chunk_index)
+
+
+class TransposedCache:
+    """!
+    @brief Read access to a node-major cache of a Serafin file
+
+    # Attributes:
+    - folder <str>: path to the cache folder
+    - var_IDs <[str]>: cached variable identifiers
+    - nb_frames <int>: number of frames
+    - nb_nodes <int>: number of nodes
+    - node_chunk <int>: number of nodes per chunk
+    - time_chunk <int>: number of frames per chunk
+    - dtype <numpy.dtype>: type of the cached values
+    """
+    def __init__(self, folder, meta):
+        self.folder = folder
+        self.var_IDs = meta['var_IDs']
+        self.nb_frames = meta['nb_frames']
+        self.nb_nodes = meta['nb_nodes']
+        self.node_chunk = meta['node_chunk']
+        self.time_chunk = meta['time_chunk']
+        self.dtype = np.dtype(meta['dtype'])
+        self._arrays = {}  # memory-mapped chunks
+
+    @staticmethod
+    def load(filename):
+        """!
+        @brief Open the cache of a Serafin file if it exists and is up to date
+        @param filename <str>: path to Serafin file
+        @return <TransposedCache>: cache or None if not available
+        """
+        folder = cache_folder(filename)
+        try:
+            with open(os.path.join(folder, META_FILENAME), 'r') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get('version') != FORMAT_VERSION:
+            logger.debug('The node cache of "%s" has an unsupported format and is ignored' % filename)
+            return None
+        if tuple(meta['signature']) != file_signature(filename):
+            logger.debug('The node cache of "%s" is outdated and is ignored' % filename)
+            return None
+        logger.debug('Using node cache of "%s"' % filename)
+        return TransposedCache(folder, meta)
+
+    def has_variable(self, var_ID):
+        return var_ID in self.var_IDs
+
+    def _get_array(self, pos_var, node_chunk_index, time_chunk_index):
+        key = pos_var, node_chunk_index, time_chunk_index
+        if key not in self._arrays:
+            path = os.path.join(self.folder, _chunk_filename(*key))
+            self._arrays[key] = np.load(path, mmap_mode='r')
+        return self._arrays[key]
+
+    def read_var_at_nodes(self, var_ID, node_indices, time_indices):
+        """!
+        @brief Read the time series of a single variable at some nodes
+        @param var_ID <str>: variable ID
+        @param node_indices <numpy 1D-array>: indices of the nodes (0-based)
+        @param time_indices <numpy 1D-array>: indices of the frames (0-based)
+        @return <numpy 2D-array>: values of the variable with shape (number of frames, number of nodes)
+        """
+        pos_var = self.var_IDs.index(var_ID)
+        node_indices = np.asarray(node_indices, dtype=np.int64)
+        time_indices = np.asarray(time_indices, dtype=np.int64)
+        res = np.empty((len(time_indices), len(node_indices)), dtype=self.dtype)
+        node_chunk_indices = node_indices // self.node_chunk
+        time_chunk_indices = time_indices // self.time_chunk
+        for time_chunk_index in np.unique(time_chunk_indices):
+            rows = np.flatnonzero(time_chunk_indices == time_chunk_index)
+            local_times = time_indices[rows] - time_chunk_index * self.time_chunk
+            for node_chunk_index in np.unique(node_chunk_indices):
+                columns = np.flatnonzero(node_chunk_indices == node_chunk_index)
+                local_nodes = node_indices[columns] - node_chunk_index * self.node_chunk
+                chunk = self._get_array(pos_var, node_chunk_index, time_chunk_index)
+                res[np.ix_(rows, columns)] = chunk[np.ix_(local_nodes, local_times)].T
+        return res
+
+
+def build_transposed_cache(input_stream, var_IDs=None, iter_pbar=lambda x, unit: x,
+                           node_chunk=DEFAULT_NODE_CHUNK, time_chunk=DEFAULT_TIME_CHUNK):
+    """!
+    @brief Build (or rebuild) the node-major cache of a Serafin file with a streaming pass over blocks of frames
+    @param input_stream <slf.Serafin.Read>: input Serafin stream (header has to be read)
+    @param var_IDs <[str]>: variables to cache (all variables are considered if not present)
+    @param iter_pbar: iterable progress bar
+    @param node_chunk <int>: number of nodes per chunk
+    @param time_chunk <int>: number of frames per chunk
+    @return <TransposedCache>: built cache
+    """
+    header = input_stream.header
+    if var_IDs is None:
+        var_IDs = header.var_IDs
+    folder = cache_folder(input_stream.filename)
+    if os.path.exists(folder):
+        shutil.rmtree(folder)
+    os.makedirs(folder)
+
+    signature = file_signature(input_stream.filename)
+    node_starts = range(0, header.nb_nodes, node_chunk)
+
+    def open_chunks(time_chunk_index):
+        # chunks of all variables and nodes for a time window
+        nb_frames = min(time_chunk, header.nb_frames - time_chunk_index * time_chunk)
+        return {(pos_var, node_chunk_index): np.lib.format.open_memmap(
+                    os.path.join(folder, _chunk_filename(pos_var, node_chunk_index, time_chunk_index)), mode='w+',
+                    dtype=header.np_float_type, shape=(min(node_chunk, header.nb_nodes - node_start), nb_frames))
+                for pos_var in range(len(var_IDs)) for node_chunk_index, node_start in enumerate(node_starts)}
+
+    logger.debug('Building node cache in "%s"' % folder)
+    arrays, current_time_chunk_index = {}, None
+    start_index = 0
+    for _, block in iter_pbar(input_stream.iter_frame_blocks(var_IDs), unit='blocks'):
+        end_index = start_index + len(block)
+        index = start_index
+        while index < end_index:  # a block can span several time chunks
+            time_chunk_index = index // time_chunk
+            if time_chunk_index != current_time_chunk_index:
+                for array in arrays.values():
+                    array.flush()
+                arrays, current_time_chunk_index = open_chunks(time_chunk_index), time_chunk_index
+            chunk_start = time_chunk_index * time_chunk
+            chunk_end = min(end_index, chunk_start + time_chunk)
+            frames = block[index - start_index:chunk_end - start_index]
+            # Each node row receives a contiguous segment of the block
+            for (pos_var, node_chunk_index), array in arrays.items():
+                node_start = node_starts[node_chunk_index]
+                array[:, index - chunk_start:chunk_end - chunk_start] = \
+                    frames[:, pos_var, node_start:node_start + array.shape[0]].T
+            index = chunk_end
+        start_index = end_index
+    for array in arrays.values():
+        array.flush()
+    del arrays
+
+    meta = {'version': FORMAT_VERSION, 'signature': list(signature), 'var_IDs': list(var_IDs),
+            'nb_frames': header.nb_frames, 'nb_nodes': header.nb_nodes, 'node_chunk': node_chunk,
+            'time_chunk': time_chunk, 'dtype': np.dtype(header.np_float_type).str}
+    with open(os.path.join(folder, META_FILENAME), 'w') as f:
+        json.dump(meta, f)
+    return TransposedCache(folder, meta)
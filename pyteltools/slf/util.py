@@ -1,3 +1,31 @@
+import hashlib
+import numpy as np
+import os
+
 from pyteltools.utils.log import new_logger
 
 logger = new_logger(__name__)
+
+
+def file_signature(filename):
+    """!
+    @param filename <str>: path to Serafin file
+    @return <(int, int)>: file size (in bytes) and modification time (in nanoseconds)
+    """
+    stat = os.stat(filename)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def mesh_fingerprint(x, y, ikle):
+    """!
+    @brief Compute a content hash of a 2D mesh
+    @param x <numpy 1D-array>: east coordinates of the nodes
+    @param y <numpy 1D-array>: north coordinates of the nodes
+    @param ikle <numpy 2D-array>: connectivity table
+    @return <str>: hexadecimal digest
+    """
+    sha = hashlib.sha1()
+    sha.update(np.ascontiguousarray(x, dtype=np.float64).tobytes())
+    sha.update(np.ascontiguousarray(y, dtype=np.float64).tobytes())
+    sha.update(np.ascontiguousarray(ikle, dtype=np.int64).tobytes())
+    return sha.hexdigest()
@@ -23,12 +23,26 @@ def get_necessary_equations(known_var_IDs, needed_var_IDs, is_2d, us_equation=No
     return get_necessary_3d_equations(known_var_IDs, needed_var_IDs)
 
 
+def get_read_var_IDs(input_var_IDs, equations, selected_output_IDs):
+    """!
+    @brief Get the variables which are read in the input stream by `do_calculations_in_frame`
+    @param input_var_IDs <[str]>: the short names of the variables of the input stream
+    @param equations <[slf.variables_utils.Equation]>: list of all equations necessary to compute selected variables
+    @param selected_output_IDs <[str]>: the short names of the selected output variables
+    @return <[str]>: the short names of the variables to read (in the order of the input stream)
+    """
+    needed_var_IDs = set(selected_output_IDs)
+    for equation in equations:
+        needed_var_IDs.update(map(lambda x: x.ID(), equation.input))
+    return [var_ID for var_ID in input_var_IDs if var_ID in needed_var_IDs]
+
+
 def do_calculations_in_frame(equations, input_serafin, time_index, selected_output_IDs,
                              output_float_type, is_2d, us_equation, ori_values={}):
     """!
     @brief Return the selected 2D variables values in a single time frame
     @param equations <[slf.variables_utils.Equation]>: list of all equations necessary to compute selected variables
-    @param input_serafin <Serafin.Read>: input stream for reading necessary variables
+    @param input_serafin <Serafin.Read>: input stream for reading necessary variables (or a `PrefetchReader`)
     @param time_index <int>: the index of the frame (0-based)
     @param selected_output_IDs <[str]>: the short names of the selected output variables
     @param output_float_type <numpy.dtype>: float32 or float64 according to the output file type
@@ -2,14 +2,18 @@
 Volume calculations in polygons
 """
 
+from itertools import chain
 import numpy as np
+from scipy import sparse
 import shapely.geometry as geom
 
 from pyteltools.conf import settings
 from pyteltools.geom import geometry
 
 from .interpolation import Interpolator
+from .mapreduce import map_chunks, split_time_indices
 from .mesh2D import Mesh2D
+from .prefetch import PrefetchReader
 
 
 class TruncatedTriangularPrisms(Mesh2D):
@@ -114,31 +118,42 @@ class TruncatedTriangularPrisms(Mesh2D):
         return volume
 
     @staticmethod
-    def superior_prism_volume(vertices, area, values):
+    def boundary_weights(triangle_polygon_intersection):
         """!
-        @brief Return the volume in the half-space z > 0 of the prism with the given base triangle and values
-        @param vertices <list>: The coordinates of the three vertices defining the base triangle
-        @param area <float>: The area of the base triangle
-        @param values <numpy.1D-array>: The values of the variable on the three nodes of the triangle
-        @return <float>: The volume of the prism in the half-space z > 0
+        @brief Return the weights carried by the nodes of the boundary triangles (see `boundary_volume_in_polygon`)
+        @param triangle_polygon_intersection <dict>: All triangle-polygon intersections defined by boundary triangles
+        @return <numpy.2D-array, numpy.2D-array>: The nodes of the boundary triangles (shape: (N, 3))
+            and their weights (area of the intersection times the interpolator of its centroid)
         """
-        # eliminate special cases
-        if min(values) >= 0:
-            return area * sum(values) / 3.0
-        elif max(values) <= 0:
-            return 0
+        if not triangle_polygon_intersection:
+            return np.empty((0, 3), dtype=np.int64), np.empty((0, 3), dtype=np.float64)
+        nodes = np.array(list(triangle_polygon_intersection.keys()), dtype=np.int64)
+        weights = np.array([area * interpolator for area, interpolator in triangle_polygon_intersection.values()],
+                           dtype=np.float64)
+        return nodes, weights
+
+    @staticmethod
+    def superior_prism_volumes(areas, values):
+        """!
+        @brief Return the volumes in the half-space z > 0 of prisms with the given base areas and values
+        @param areas <numpy.1D-array>: The areas of the base triangles
+        @param values <numpy.2D-array>: The values of the variable on the three nodes of every triangle (shape: (N, 3))
+        @return <numpy.1D-array>: The volumes of the prisms in the half-space z > 0
+        """
+        volumes = areas * (values[:, 0] + values[:, 1] + values[:, 2]) / 3.0  # special case: all values >= 0
+        sorted_values = np.sort(values, axis=1)
+        z_bottom, z_middle, z_top = sorted_values.T
+        volumes[z_top <= 0] = 0  # special case: all values <= 0
 
-        p1, p2, p3 = vertices
         # remaining cases: triangle crosses the plane z = 0
-        nb_points_superior = sum(values > 0)
-        if nb_points_superior == 1:  # positive tetrahedron
-            (z_bottom, _, _), (z_middle, _, _), (z_top, _, _) = sorted(zip(values, [1, 2, 3], [p1, p2, p3]))
-            return area * z_top ** 3 / 3 / (z_top - z_middle) / (z_top - z_bottom)
-        else:  # negative tetrahedron
-            (z_bottom, _, bottom), (z_middle, _, middle), (z_top, _, top) = sorted(zip(values, [1, 2, 3], [p1, p2, p3]))
-            volume_total = area * sum(values) / 3.0
-            volume_negative = area * z_bottom ** 3 / 3 / (z_top - z_bottom) / (z_middle - z_bottom)
-            return volume_total - volume_negative
+        is_crossing = (z_bottom < 0) & (z_top > 0)
+        is_positive = is_crossing & (z_middle <= 0)  # positive tetrahedron
+        is_negative = is_crossing & (z_middle > 0)  # negative tetrahedron
+        z_bottom, z_middle, z_top = sorted_values[is_positive].T
+        volumes[is_positive] = areas[is_positive] * z_top ** 3 / 3 / (z_top - z_middle) / (z_top - z_bottom)
+        z_bottom, z_middle, z_top = sorted_values[is_negative].T
+        volumes[is_negative] -= areas[is_negative] * z_bottom ** 3 / 3 / (z_top - z_bottom) / (z_middle - z_bottom)
+        return volumes
 
     @staticmethod
     def superior_prism_volume_in_intersection(polygon, vertices, area, intersection, values):
@@ -223,6 +238,8 @@ class VolumeCalculator:
 
         self.mesh = None
         self.weights = []
+        self.weight_matrix = None  # sparse matrix (polygons x nodes) of the node weights for net volumes
+        self.prisms = None  # triangles of all polygons as arrays for the POSITIVE volume type
 
         self.init_values = None
         if self.second_var_ID == VolumeCalculator.INIT_VALUE:
@@ -245,70 +262,156 @@ class VolumeCalculator:
         elif self.volume_type == VolumeCalculator.POSITIVE:
             for poly in iter_pbar(self.polygons, unit='polygons'):
                 self.weights.append(self.mesh.polygon_intersection_all(poly))
+        self.weight_matrix = self.assemble_weight_matrix()
+        if self.volume_type == VolumeCalculator.POSITIVE:
+            self.prisms = self.assemble_prisms()
 
-    def volume_in_frame_in_polygon(self, weight, values, polygon):
+    def assemble_weight_matrix(self):
+        """!
+        @brief Assemble the weights of all polygons in a sparse matrix
+            The weights of the boundary triangle-polygon intersections are added to the strict weights of their nodes.
+        @return <scipy.sparse.csr_matrix>: The matrix (number of polygons x number of nodes) of the node weights
+        """
+        rows, columns, data = [], [], []
+        for index_poly, weight in enumerate(self.weights):
+            if self.volume_type != VolumeCalculator.NET_STRICT:
+                weight, triangle_polygon_intersection = weight[:2]
+                nodes, boundary_weights = TruncatedTriangularPrisms.boundary_weights(triangle_polygon_intersection)
+                rows.append(np.full(nodes.size, index_poly, dtype=np.int64))
+                columns.append(nodes.reshape(-1))
+                data.append(boundary_weights.reshape(-1))
+            nodes = np.flatnonzero(weight)
+            rows.append(np.full(nodes.size, index_poly, dtype=np.int64))
+            columns.append(nodes)
+            data.append(weight[nodes])
+        if not rows:
+            return sparse.csr_matrix((0, self.mesh.nb_points), dtype=np.float64)
+        return sparse.csr_matrix((np.concatenate(data), (np.concatenate(rows), np.concatenate(columns))),
+                                 shape=(len(self.weights), self.mesh.nb_points))
+
+    def assemble_prisms(self):
         """!
-        @brief Do the volume computation in a single frame, depending on the volume type
-        @param weight <tuple>: the point weights/intersections etc. depending on the polygon and on the volume type
+        @brief Gather the triangles of all polygons in arrays (POSITIVE volume type)
+        @return <dict>: The nodes, areas and polygon indices of the triangles entirely contained in polygons ('inside')
+            and of the boundary triangles ('boundary'), and the tuples (vertices, intersection)
+            of the boundary triangles ('intersections')
+        """
+        prisms = {'inside': ([], [], []), 'boundary': ([], [], []), 'intersections': []}
+        for index_poly, (_, __, triangles, triangle_polygon_intersection) in enumerate(self.weights):
+            for key, triangle_dict in (('inside', triangles), ('boundary', triangle_polygon_intersection)):
+                nodes, areas, polygon_indices = prisms[key]
+                for (i, j, k), triangle_info in triangle_dict.items():
+                    nodes.append((i, j, k))
+                    areas.append(triangle_info[1])
+                    polygon_indices.append(index_poly)
+            for vertices, _, intersection in triangle_polygon_intersection.values():
+                prisms['intersections'].append((vertices, intersection))
+        for key in ('inside', 'boundary'):
+            nodes, areas, polygon_indices = prisms[key]
+            prisms[key] = (np.array(nodes, dtype=np.int64).reshape(-1, 3), np.array(areas, dtype=np.float64),
+                           np.array(polygon_indices, dtype=np.int64))
+        return prisms
+
+    def positive_volumes_in_frame(self, values):
+        """!
+        @brief Compute the volumes in the half-space z > 0 in all polygons (POSITIVE volume type)
         @param values <numpy.1D-array>: the values of the variable for which the volume will be computed
-        @param polygon <geom.geometry.Polygon>: the polygon in which the volume will be computed
-        @return <float>: The value of the volume
+        @return <numpy.1D-array>: The positive volume in every polygon
         """
-        if self.volume_type == VolumeCalculator.NET_STRICT:
-            return weight.dot(values)
-        elif self.volume_type == VolumeCalculator.NET:
-            strict_weight, triangle_polygon_intersection = weight
-            volume_inside = strict_weight.dot(values)
-            volume_boundary = TruncatedTriangularPrisms.boundary_volume_in_polygon(triangle_polygon_intersection, values)
-            return volume_inside + volume_boundary
-        else:
-            strict_weight, triangle_polygon_net_intersection, triangles, triangle_polygon_intersection = weight
-            volume_net = strict_weight.dot(values)
-            volume_net += TruncatedTriangularPrisms.boundary_volume_in_polygon(triangle_polygon_net_intersection, values)
-
-            volume_positive = 0
-            for a, b, c in triangles:
-                vertices, area = triangles[a, b, c]
-                volume_positive += TruncatedTriangularPrisms.superior_prism_volume(vertices, area, values[[a, b, c]])
-            for a, b, c in triangle_polygon_intersection:
-                vertices, area, intersection = triangle_polygon_intersection[a, b, c]
-                volume_positive += TruncatedTriangularPrisms.superior_prism_volume_in_intersection(polygon, vertices,
-                                                                                                   area, intersection,
-                                                                                                   values[[a, b, c]])
-            return volume_net, volume_positive, volume_net - volume_positive
-
-    def read_values_in_frame(self, time_index):
+        nodes, areas, polygon_indices = self.prisms['inside']
+        volumes_inside = TruncatedTriangularPrisms.superior_prism_volumes(areas, values[nodes])
+
+        nodes, areas, boundary_polygon_indices = self.prisms['boundary']
+        boundary_values = values[nodes]
+        volumes_boundary = TruncatedTriangularPrisms.superior_prism_volumes(areas, boundary_values)
+        # boundary triangles crossing the plane z = 0 are intersected with the polygon
+        is_crossing = (boundary_values.min(axis=1) < 0) & (boundary_values.max(axis=1) > 0)
+        for index in np.flatnonzero(is_crossing):
+            vertices, intersection = self.prisms['intersections'][index]
+            volumes_boundary[index] = TruncatedTriangularPrisms.superior_prism_volume_in_intersection(
+                self.polygons[boundary_polygon_indices[index]], vertices, areas[index], intersection,
+                boundary_values[index])
+
+        return np.bincount(np.concatenate((polygon_indices, boundary_polygon_indices)),
+                           weights=np.concatenate((volumes_inside, volumes_boundary)), minlength=len(self.polygons))
+
+    def volumes_in_frame(self, values):
+        """!
+        @brief Do the volume computation in a single frame for all polygons
+        @param values <numpy.1D-array>: the values of the variable for which the volume will be computed
+        @return <[float] or [tuple]>: The value of the volume (or the tuple of net, positive and negative volumes
+            for the POSITIVE volume type) for every polygon
+        """
+        volumes_net = self.weight_matrix.dot(values)
+        if self.volume_type == VolumeCalculator.POSITIVE:
+            volumes_positive = self.positive_volumes_in_frame(values)
+            return list(zip(volumes_net, volumes_positive, volumes_net - volumes_positive))
+        return volumes_net.tolist()
+
+    def format_volumes(self, time_index, volumes, fmt_float=settings.FMT_FLOAT):
+        """!
+        @brief Build the result row of a frame
+        @param time_index <int>: the index of the frame (0-based)
+        @param volumes <[float] or [tuple]>: The volumes in every polygon (see `volumes_in_frame`)
+        @param fmt_float <str>: format of the volumes
+        @return <[str]>: The time and the formatted volumes
+        """
+        i_result = [str(self.input_stream.time[time_index])]
+        for volume in volumes:
+            if self.volume_type == VolumeCalculator.POSITIVE:
+                for v in volume:
+                    i_result.append(fmt_float.format(v))
+            else:
+                i_result.append(fmt_float.format(volume))
+        return i_result
+
+    def read_values_in_frame(self, time_index, input_stream=None):
         """!
         Read variable values in a single frame, depending on the first/second variable choice
+        @param time_index <int>: the index of the frame (0-based)
+        @param input_stream <slf.prefetch.PrefetchReader>: stream to read from (`self.input_stream` by default)
         """
-        values = self.input_stream.read_var_in_frame(time_index, self.var_ID)
+        if input_stream is None:
+            input_stream = self.input_stream
+        values = input_stream.read_var_in_frame(time_index, self.var_ID)
         if self.second_var_ID is not None:
+            # read values are not writable
             if self.second_var_ID == VolumeCalculator.INIT_VALUE:
-                values -= self.init_values
+                values = values - self.init_values
             else:
-                second_values = self.input_stream.read_var_in_frame(time_index, self.second_var_ID)
-                values -= second_values
+                second_values = input_stream.read_var_in_frame(time_index, self.second_var_ID)
+                values = values - second_values
         return values
 
-    def run(self, fmt_float=settings.FMT_FLOAT):
+    def get_read_var_IDs(self):
+        """!
+        @return <[str]>: variables read in every frame
+        """
+        if self.second_var_ID is None or self.second_var_ID == VolumeCalculator.INIT_VALUE:
+            return [self.var_ID]
+        return [self.var_ID, self.second_var_ID]
+
+    def volumes_in_time_indices(self, time_indices):
+        """!
+        @brief Do the volume computation in a chunk of frames for all polygons
+        @param time_indices <[int]>: the indices of the frames (0-based)
+        @return <[list]>: The volumes in every polygon (see `volumes_in_frame`) for every frame
+        """
+        volumes = []
+        with PrefetchReader(self.input_stream, time_indices, self.get_read_var_IDs()) as input_stream:
+            for time_index in time_indices:
+                volumes.append(self.volumes_in_frame(self.read_values_in_frame(time_index, input_stream)))
+        return volumes
+
+    def run(self, fmt_float=settings.FMT_FLOAT, nb_processes=1):
         """!
         Separate the major part of the computation, allowing a GUI override
+        @param nb_processes <int>: number of processes (frames are split in chunks computed in parallel if > 1)
         """
-        result = []
-        for time_index in self.time_indices:
-            i_result = [str(self.input_stream.time[time_index])]
-            values = self.read_values_in_frame(time_index)
-
-            for j in range(len(self.polygons)):
-                weight = self.weights[j]
-                volume = self.volume_in_frame_in_polygon(weight, values, self.polygons[j])
-                if self.volume_type == VolumeCalculator.POSITIVE:
-                    for v in volume:
-                        i_result.append(fmt_float.format(v))
-                else:
-                    i_result.append(fmt_float.format(volume))
-            result.append(i_result)
-        return result
+        chunks = split_time_indices(self.time_indices, nb_processes)
+        volumes = chain.from_iterable(map_chunks(self, 'volumes_in_time_indices', chunks, nb_processes))
+        return [self.format_volumes(time_index, frame_volumes, fmt_float)
+                for time_index, frame_volumes in zip(self.time_indices, volumes)]
 
     def get_csv_header(self):
         header = ['time']
@@ -0,0 +1,78 @@
+"""!
+Unittest for slf.chunked module
+"""
+
+import numpy as np
+import os
+import unittest
+
+from pyteltools.conf import settings
+from pyteltools.slf import Serafin
+from pyteltools.slf.chunked import chunked_to_slf, ChunkedRead, slf_to_chunked
+from pyteltools.slf.misc import MAX, ScalarMaxMinMeanCalculator
+from . import TestHeader
+
+
+HOME = os.path.expanduser('~')
+
+
+class ChunkedTestCase(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(HOME, 'dummy_chunked.slf')
+        self.chunked_path = os.path.join(HOME, 'dummy_chunked.slfz')
+        self.back_path = os.path.join(HOME, 'dummy_chunked_back.slf')
+        header = TestHeader()
+        for var_ID in ('U', 'V', 'H'):
+            header.add_variable_from_ID(var_ID)
+        self.values = np.random.RandomState(2).rand(5, header.nb_var, header.nb_nodes)
+        with Serafin.Write(self.path, 'fr', overwrite=True) as f:
+            f.write_header(header)
+            f.write_frames(header, np.arange(5) * 10.0, self.values)
+        slf_to_chunked(self.path, self.chunked_path, 'fr', time_chunk=2, node_chunk=3, overwrite=True)
+
+    def tearDown(self):
+        for path in (self.path, self.chunked_path, self.back_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_lossless_conversion(self):
+        chunked_to_slf(self.chunked_path, self.back_path, 'fr', overwrite=True)
+        with open(self.path, 'rb') as f1, open(self.back_path, 'rb') as f2:
+            self.assertEqual(f1.read(), f2.read())
+
+    def test_read(self):
+        with ChunkedRead(self.chunked_path, 'fr') as f:
+            f.read_header()
+            f.get_time()
+            self.assertEqual(f.header.var_IDs, ['U', 'V', 'H'])
+            self.assertTrue(np.array_equal(f.time, np.arange(5) * 10.0))
+            self.assertTrue(np.array_equal(f.read_var_in_frame(3, 'V'), self.values[3, 1]))
+            self.assertTrue(np.array_equal(f.read_vars_in_frame(4, ['H', 'U']), self.values[4, [2, 0]]))
+            self.assertTrue(np.array_equal(f.read_var_at_nodes('H', [3, 0], [4, 1]), self.values[[4, 1], 2][:, [3, 0]]))
+            blocks = [values for _, values in f.iter_frame_blocks(['V'], block_size=3)]
+            self.assertTrue(np.array_equal(np.concatenate(blocks), self.values[:, [1]]))
+            with self.assertRaises(Serafin.SerafinRequestError):
+                f.read_var_in_frame(5, 'U')
+
+    def test_calculator(self):
+        with ChunkedRead(self.chunked_path, 'fr') as f:
+            f.read_header()
+            f.get_time()
+            calculator = ScalarMaxMinMeanCalculator(MAX, f, [('U', '', ''), ('H', '', '')], range(5))
+            calculator.run()
+            self.assertTrue(np.array_equal(calculator.finishing_up(), self.values[:, [0, 2]].max(axis=0)))
+
+    def test_chunk_cache(self):
+        memory = settings.SERAFIN_CHUNK_CACHE_MEMORY
+        settings.configure(SERAFIN_CHUNK_CACHE_MEMORY=0)  # only a time window of all variables is kept
+        try:
+            with ChunkedRead(self.chunked_path, 'fr') as f:
+                f.read_header(lazy=True)
+                f.get_time()
+                for time_index in range(5):
+                    for var_ID in f.header.var_IDs:
+                        f.read_var_in_frame(time_index, var_ID)
+                # every chunk is decompressed once: 3 variables x 3 time windows x 2 node chunks
+                self.assertEqual(f.nb_decompressed_chunks, 3 * 3 * 2)
+        finally:
+            settings.configure(SERAFIN_CHUNK_CACHE_MEMORY=memory)
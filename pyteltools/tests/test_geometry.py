@@ -0,0 +1,46 @@
+"""!
+Unittest for geom.geometry module
+"""
+
+import numpy as np
+from shapely.geometry import Point, Polygon
+import unittest
+
+from pyteltools.geom.geometry import points_in_polygons, Polyline
+
+
+class PointsInPolygonsTestCase(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.x, self.y = rng.uniform(-1, 11, (2, 2000))
+        self.polygons = [Polyline([(0, 0), (6, 0), (6, 6), (0, 6), (0, 0)]),
+                         Polyline([(4, 4), (10, 4), (7, 10), (4, 4)]),
+                         Polygon([(0, 7), (3, 7), (3, 10), (0, 10)], holes=[[(1, 8), (2, 8), (2, 9), (1, 9)]])]
+
+    def expected(self, keep_last):
+        polygons = [poly.polyline() if isinstance(poly, Polyline) else poly for poly in self.polygons]
+        expected = np.full(len(self.x), -1)
+        for i, (x, y) in enumerate(zip(self.x, self.y)):
+            for index, polygon in enumerate(polygons):
+                if polygon.contains(Point(x, y)):
+                    expected[i] = index
+                    if not keep_last:
+                        break
+        return expected
+
+    def test_first_polygon(self):
+        polygon_indices = points_in_polygons(self.x, self.y, self.polygons)
+        self.assertTrue(np.array_equal(polygon_indices, self.expected(False)))
+        self.assertTrue(np.any(polygon_indices == 2))
+
+    def test_last_polygon(self):
+        self.assertTrue(np.array_equal(points_in_polygons(self.x, self.y, self.polygons, keep_last=True),
+                                       self.expected(True)))
+
+    def test_boundary_and_hole(self):
+        polygon_indices = points_in_polygons([0, 3, 1.5, 6, 2.5], [3, 3, 8.5, 1, 8.5], self.polygons)
+        self.assertEqual(polygon_indices.tolist(), [-1, 0, -1, -1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
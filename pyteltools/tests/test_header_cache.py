@@ -0,0 +1,81 @@
+"""!
+Unittest for slf.header_cache module
+"""
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from pyteltools.conf import settings
+from pyteltools.slf import header_cache, Serafin
+from pyteltools.slf.datatypes import SerafinData
+from . import TestHeader
+
+
+class HeaderCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.previous_settings = settings.SERAFIN_HEADER_CACHE, settings.SERAFIN_HEADER_CACHE_FOLDER
+        settings.configure(SERAFIN_HEADER_CACHE=True, SERAFIN_HEADER_CACHE_FOLDER=os.path.join(self.folder, 'cache'))
+
+        self.paths = [os.path.join(self.folder, 'res_%i.slf' % i) for i in range(3)]
+        header = TestHeader()
+        header.add_variable_from_ID('H')
+        for i, path in enumerate(self.paths):
+            with Serafin.Write(path, 'fr') as f:
+                f.write_header(header)
+                f.write_frames(header, [0.0, 10.0 * (i + 1)], np.zeros((2, 1, header.nb_nodes)))
+
+    def tearDown(self):
+        cache, folder = self.previous_settings
+        settings.configure(SERAFIN_HEADER_CACHE=cache, SERAFIN_HEADER_CACHE_FOLDER=folder)
+        shutil.rmtree(self.folder)
+
+    def test_read_from_cache(self):
+        self.assertIsNone(header_cache.load_entry(self.paths[0], 'fr'))
+        data = SerafinData('job', self.paths[0], 'fr')
+        self.assertTrue(data.read())
+        header, time = header_cache.load_entry(self.paths[0], 'fr')
+        self.assertTrue(header.same_2d_mesh(data.header))
+        self.assertTrue(np.array_equal(time, [0.0, 10.0]))
+        self.assertIsNone(header_cache.load_entry(self.paths[0], 'en'))
+
+    def test_outdated_entry(self):
+        header_cache.read_header_and_time(self.paths[0], 'fr')
+        with open(self.paths[0], 'ab') as f:
+            f.write(b'\0')
+        self.assertIsNone(header_cache.load_entry(self.paths[0], 'fr'))
+
+    def test_lazy_header(self):
+        for _ in range(2):  # cache miss and cache hit
+            header, time = header_cache.read_header_and_time(self.paths[0], 'fr')
+            self.assertNotIn('ikle', header.__dict__)
+            self.assertIsNotNone(header._lazy_mesh)
+            self.assertTrue(np.array_equal(time, [0.0, 10.0]))
+        cached_header, _ = header_cache.load_entry(self.paths[0], 'fr')
+        self.assertNotIn('ikle', cached_header.__dict__)  # mesh arrays are not stored in the entry
+        self.assertTrue(cached_header.same_2d_mesh(TestHeader()))  # mesh arrays loaded on first access
+
+    def test_lazy_header_without_cache(self):
+        settings.configure(SERAFIN_HEADER_CACHE=False)
+        header, time = header_cache.read_header_and_time(self.paths[0], 'fr')
+        self.assertNotIn('ikle', header.__dict__)
+        self.assertEqual(header.var_IDs, ['H'])
+        self.assertTrue(np.array_equal(time, [0.0, 10.0]))
+        self.assertTrue(header.same_2d_mesh(TestHeader()))  # mesh arrays loaded on first access
+        self.assertFalse(os.path.exists(settings.SERAFIN_HEADER_CACHE_FOLDER))
+
+        # explicitly enabled (e.g. multi-folder workflow)
+        header_cache.read_header_and_time(self.paths[0], 'fr', use_cache=True)
+        self.assertIsNotNone(header_cache.load_entry(self.paths[0], 'fr'))
+
+    def test_preload_and_evict(self):
+        self.assertEqual(header_cache.preload(self.paths, 'fr', nb_processes=1), 3)
+        self.assertEqual(header_cache.preload(self.paths, 'fr', nb_processes=1), 0)
+        header_cache.load_entry(self.paths[0], 'fr')  # most recently used
+        entry_size = os.path.getsize(header_cache._entry_path(self.paths[0], 'fr'))
+        header_cache.evict(max_size=entry_size)
+        self.assertIsNotNone(header_cache.load_entry(self.paths[0], 'fr'))
+        self.assertEqual(len(os.listdir(settings.SERAFIN_HEADER_CACHE_FOLDER)), 1)
@@ -0,0 +1,123 @@
+"""!
+Unittest for slf.interpolation module
+"""
+
+import numpy as np
+from types import SimpleNamespace
+import unittest
+
+from pyteltools.conf import settings
+from pyteltools.geom.geometry import Polyline
+from pyteltools.slf.interpolation import Interpolator, MeshInterpolator
+from pyteltools.slf.misc import PROJECT, ProjectMeshCalculator
+from . import TestHeader
+
+
+class LocatePointsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.mesh = MeshInterpolator(TestHeader(), True)
+        rng = np.random.RandomState(0)
+        self.points = np.vstack([rng.uniform(-1, 7, (200, 2)),
+                                 self.mesh.points,  # nodes are shared by several triangles
+                                 [[1.5, 1.0], [10.0, 10.0]]])
+
+    def test_locate_points(self):
+        element_indices, weights = self.mesh.locate_points(self.points, block_size=32)
+        for (x, y), element_index, coord in zip(self.points, element_indices, weights):
+            expected_index, expected_coord = -1, np.zeros(3)
+            for index, (i, j, k) in enumerate(self.mesh.ikle):  # brute force
+                is_in, point_interpolator = Interpolator(self.mesh.triangles[i, j, k]).is_in_triangle(x, y)
+                if is_in:
+                    expected_index, expected_coord = index, point_interpolator
+                    break
+            self.assertEqual(element_index, expected_index)
+            self.assertTrue(np.array_equal(coord, expected_coord))
+        self.assertEqual(element_indices[-1], -1)
+
+    def test_point_interpolators(self):
+        is_inside, point_interpolators = self.mesh.get_point_interpolators([(3.0, 1.0), (3.0, 7.0)])
+        self.assertEqual(is_inside, [True, False])
+        (i, j, k), coord = point_interpolators[0]
+        self.assertEqual((i, j, k), (1, 2, 3))
+        self.assertAlmostEqual(coord.dot(self.mesh.x[[i, j, k]]), 3.0)
+        self.assertAlmostEqual(coord.dot(self.mesh.y[[i, j, k]]), 1.0)
+        self.assertIsNone(point_interpolators[1])
+
+    def test_interpolate_on_points_by_blocks(self):
+        is_inside, point_interpolators = self.mesh.get_point_interpolators(self.points)
+        point_interpolators = [p for p, inside in zip(point_interpolators, is_inside) if inside]
+        rng = np.random.RandomState(1)
+        values = {'A': rng.uniform(-1, 1, (5, self.mesh.nb_points)), 'B': rng.uniform(-1, 1, (5, self.mesh.nb_points))}
+        read_blocks = []
+
+        def read_var_at_nodes(var_ID, node_indices, time_indices):
+            read_blocks.append(list(time_indices))
+            return values[var_ID][np.ix_(list(time_indices), node_indices)]
+
+        # blocks of 2 frames
+        frame_size = 8 * 2 * (self.mesh.nb_points + len(point_interpolators))
+        previous_memory = settings.SERAFIN_BLOCK_MEMORY
+        settings.configure(SERAFIN_BLOCK_MEMORY=2 * frame_size + 1)
+        try:
+            time_indices = [4, 0, 3, 1, 2]
+            frame_values = list(MeshInterpolator.iter_interpolate_on_points(
+                SimpleNamespace(read_var_at_nodes=read_var_at_nodes), ['A', 'B'], time_indices, point_interpolators))
+        finally:
+            settings.configure(SERAFIN_BLOCK_MEMORY=previous_memory)
+        self.assertEqual(read_blocks, [[4, 0], [4, 0], [3, 1], [3, 1], [2], [2]])
+        for time_index, interpolated_values in zip(time_indices, frame_values):
+            for var_values, interpolated_var in zip((values['A'][time_index], values['B'][time_index]),
+                                                    interpolated_values):
+                for ((i, j, k), interpolator), interpolated_value in zip(point_interpolators, interpolated_var):
+                    self.assertAlmostEqual(interpolated_value, interpolator.dot(var_values[[i, j, k]]))
+
+    def test_projection_matrix(self):
+        is_inside, point_interpolators = self.mesh.get_point_interpolators(self.points)
+        mask, matrix = self.mesh.get_projection_matrix(self.points)
+        self.assertEqual(mask.tolist(), is_inside)
+        self.assertEqual((matrix != MeshInterpolator.point_interpolators_to_matrix(
+            point_interpolators, self.mesh.nb_points)).nnz, 0)
+
+        values = np.array([[1.0, 2.0, 3.0, 4.0], [-1.0, 0.5, 2.0, 0.0]])
+        first_in = SimpleNamespace(header=SimpleNamespace(nb_nodes=len(self.points)))
+        second_in = SimpleNamespace(header=SimpleNamespace(nb_nodes=self.mesh.nb_points))
+        calculator = ProjectMeshCalculator(first_in, second_in, ['A', 'B'], is_inside, point_interpolators,
+                                           [], PROJECT)
+        interpolated_values = calculator.interpolate(values)
+        for values_var, interpolated_var in zip(values, interpolated_values):
+            for index_node, interpolated_value in enumerate(interpolated_var):
+                if not is_inside[index_node]:
+                    self.assertTrue(np.isnan(interpolated_value))
+                else:
+                    (i, j, k), interpolator = point_interpolators[index_node]
+                    self.assertAlmostEqual(interpolated_value, interpolator.dot(values_var[[i, j, k]]))
+
+
+class LineInterpolatorsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.mesh = MeshInterpolator(TestHeader(), True)
+
+    def test_line_interpolators(self):
+        intersections, distances, internal_points, distances_internal = \
+            self.mesh._get_line_interpolators(Polyline([(-1, 1), (7, 1)]))
+        self.assertTrue(np.allclose([(x, y) for x, y, _, __ in intersections],
+                                    [(0.5, 1), (1.5, 1), (4.5, 1), (5.5, 1)]))
+        self.assertTrue(np.allclose(distances, [1.5, 2.5, 5.5, 6.5]))
+        self.assertEqual(len(internal_points), 2)
+        self.assertTrue(np.allclose(distances_internal, [1.5, 6.5]))
+        for x, y, (i, j, k), interpolator in intersections:
+            self.assertAlmostEqual(interpolator.dot(self.mesh.x[[i, j, k]]), x)
+
+    def test_line_through_nodes(self):
+        intersections, distances, internal_points, _ = \
+            self.mesh._get_line_interpolators(Polyline([(3, -1), (3, 2), (3, 4)]))
+        self.assertEqual([(x, y) for x, y, _, __ in intersections], [(3, 0), (3, 2), (3, 4)])
+        self.assertTrue(np.allclose(distances, [1, 3, 5]))
+        self.assertEqual(len(internal_points), 3)
+
+    def test_discontinuous_line(self):
+        self.assertEqual(self.mesh._get_line_interpolators(Polyline([(1, 1), (1, 5), (3, 5)])), ([], [], [], []))
+
+
+if __name__ == '__main__':
+    unittest.main()
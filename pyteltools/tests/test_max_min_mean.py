@@ -0,0 +1,71 @@
+"""!
+Unittest for max/min/mean calculators of slf.misc module
+"""
+
+import numpy as np
+import os
+import unittest
+
+from pyteltools.slf import Serafin
+from pyteltools.slf.mapreduce import split_time_indices
+from pyteltools.slf.misc import ArrivalDurationCalculator, Condition, MAX, MEAN, MIN, scalars_vectors, \
+    ScalarMaxMinMeanCalculator
+from . import TestHeader
+
+
+HOME = os.path.expanduser('~')
+
+
+class ScalarMaxMinMeanTestCase(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(HOME, 'dummy_max_min_mean.slf')
+        header = TestHeader()
+        for var_ID in ('U', 'V', 'H'):
+            header.add_variable_from_ID(var_ID)
+        self.values = np.random.RandomState(1).rand(5, header.nb_var, header.nb_nodes)
+        with Serafin.Write(self.path, 'fr', overwrite=True) as f:
+            f.write_header(header)
+            f.write_frames(header, np.arange(5) * 10.0, self.values)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_run_by_blocks(self):
+        with Serafin.Read(self.path, 'fr') as f:
+            f.read_header()
+            f.get_time()
+            scalars, _, additional_equations = scalars_vectors(f.header.var_IDs, [('H', '', ''), ('M', '', '')])
+            self.assertEqual(len(additional_equations), 1)  # M is computed from U and V
+            time_indices = [0, 1, 3, 4]
+            for max_min_type in (MAX, MIN, MEAN):
+                by_frame = ScalarMaxMinMeanCalculator(max_min_type, f, scalars, time_indices, additional_equations)
+                for time_index in time_indices:
+                    by_frame.max_min_mean_in_frame(time_index)
+                by_block = ScalarMaxMinMeanCalculator(max_min_type, f, scalars, time_indices, additional_equations)
+                by_block.run()
+                self.assertTrue(np.allclose(by_frame.finishing_up(), by_block.finishing_up()))
+
+    def test_run_in_parallel(self):
+        self.assertEqual(split_time_indices([0, 1, 3, 4], 3), [[0, 1], [3], [4]])
+        self.assertEqual(split_time_indices([], 3), [])
+        with Serafin.Read(self.path, 'fr') as f:
+            f.read_header()
+            f.get_time()
+            scalars, _, additional_equations = scalars_vectors(f.header.var_IDs, [('H', '', ''), ('M', '', '')])
+            time_indices = [0, 1, 3, 4]
+            for max_min_type in (MAX, MIN, MEAN):
+                serial = ScalarMaxMinMeanCalculator(max_min_type, f, scalars, time_indices, additional_equations)
+                serial.run()
+                parallel = ScalarMaxMinMeanCalculator(max_min_type, f, scalars, time_indices, additional_equations)
+                parallel.run(nb_processes=2)
+                self.assertTrue(np.allclose(serial.finishing_up(), parallel.finishing_up()))
+
+            for comparator in ('>', '<='):
+                condition = Condition(['[H]'], ['H'], comparator, 0.5)
+                serial = ArrivalDurationCalculator(f, list(range(5)), condition)
+                serial.run()
+                for nb_processes in (2, 4):
+                    parallel = ArrivalDurationCalculator(f, list(range(5)), condition)
+                    parallel.run(nb_processes=nb_processes)
+                    self.assertTrue(np.allclose(serial.arrival, parallel.arrival))
+                    self.assertTrue(np.allclose(serial.duration, parallel.duration))
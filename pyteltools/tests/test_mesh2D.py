@@ -0,0 +1,138 @@
+"""!
+Unittest for slf.mesh2D module
+"""
+
+import numpy as np
+import os
+from rtree.index import Index
+import shutil
+from shapely.geometry import Polygon
+import tempfile
+import unittest
+from unittest import mock
+
+from pyteltools.conf import settings
+from pyteltools.slf import index_cache
+from pyteltools.slf.mesh2D import LazyTriangles, Mesh2D
+from . import TestHeader
+
+
+class Mesh2DTestCase(unittest.TestCase):
+    def setUp(self):
+        self.header = TestHeader()
+
+    def test_bulk_index(self):
+        mesh = Mesh2D(self.header, True)
+        self.assertIsInstance(mesh.triangles, LazyTriangles)
+        self.assertEqual(len(mesh.triangles._polygons), 0)
+
+        # reference: incremental construction
+        reference = Mesh2D(self.header, False)
+        reference.index = Index()
+        for i, j, k in reference.ikle:
+            t = Polygon([reference.points[i], reference.points[j], reference.points[k]])
+            reference.triangles[i, j, k] = t
+            reference.index.insert(i, t.bounds, obj=(i, j, k))
+
+        for bounding_box in [(0, 0, 6, 6), (0.5, 0.5, 1, 1), (2.9, 1.9, 3.1, 2.1), (4.5, 4.5, 5, 5), (7, 7, 8, 8)]:
+            self.assertEqual(sorted(mesh.get_intersecting_elements(bounding_box)),
+                             sorted(reference.get_intersecting_elements(bounding_box)))
+
+    def test_index_progress(self):
+        progress = []
+
+        def iter_pbar(iterable, unit):
+            for value in iterable:
+                yield value
+                progress.append(unit)
+
+        mesh = Mesh2D(self.header, True, iter_pbar)
+        self.assertEqual(progress, ['steps', 'steps'])  # bounding boxes and bulk load
+        self.assertEqual(len(mesh.get_intersecting_elements((0, 0, 6, 6))), self.header.nb_elements)
+
+    def test_lazy_triangles(self):
+        mesh = Mesh2D(self.header, True)
+        self.assertEqual(list(mesh.triangles), [tuple(t) for t in mesh.ikle])
+        self.assertEqual(len(mesh.triangles), mesh.nb_triangles)
+        t = mesh.triangles[0, 1, 3]
+        self.assertAlmostEqual(t.area, 6.0)
+        self.assertIs(mesh.triangles[0, 1, 3], t)
+        self.assertEqual(len(mesh.triangles._polygons), 1)
+
+    def test_neighbors(self):
+        mesh = Mesh2D(self.header, True)
+        self.assertEqual(mesh.get_neighbors().tolist(), [[-1, 2, 1], [-1, 2, 0], [-1, 1, 0]])
+
+    def test_trace_polyline(self):
+        mesh = Mesh2D(self.header, True)
+        segments = mesh.trace_polyline([(-1, 1), (7, 1), (7, 3)])
+        self.assertEqual(segments[1], [])
+        self.assertEqual([(before, after) for _, __, before, after in segments[0]], [(-1, 0), (0, 2), (2, 1), (1, -1)])
+        self.assertTrue(np.allclose([(x, y) for x, y, _, __ in segments[0]], [(0.5, 1), (1.5, 1), (4.5, 1), (5.5, 1)]))
+
+        # through a node, then along an edge
+        segments = mesh.trace_polyline([(3, 0), (3, 2), (3, 4)])
+        self.assertEqual([(x, y) for x, y, _, __ in segments[0]], [(3, 0), (3, 2)])
+        self.assertIn(segments[0][0][3], (1, 2))
+        self.assertEqual([(x, y) for x, y, _, __ in segments[1]], [(3, 2), (3, 4)])
+        self.assertEqual(segments[1][-1][2:], (0, -1))
+
+
+class IndexCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.previous_settings = (settings.SERAFIN_INDEX_CACHE, settings.SERAFIN_INDEX_CACHE_FOLDER,
+                                  settings.SERAFIN_INDEX_CACHE_MIN_ELEMENTS)
+        settings.configure(SERAFIN_INDEX_CACHE=True, SERAFIN_INDEX_CACHE_FOLDER=self.folder,
+                           SERAFIN_INDEX_CACHE_MIN_ELEMENTS=0)
+        self.header = TestHeader()
+
+    def tearDown(self):
+        cache, folder, min_elements = self.previous_settings
+        settings.configure(SERAFIN_INDEX_CACHE=cache, SERAFIN_INDEX_CACHE_FOLDER=folder,
+                           SERAFIN_INDEX_CACHE_MIN_ELEMENTS=min_elements)
+        shutil.rmtree(self.folder)
+
+    def test_cached_index(self):
+        key = self.header.mesh_fingerprint
+        settings.configure(SERAFIN_INDEX_CACHE_MIN_ELEMENTS=self.header.nb_elements + 1)
+        mesh = Mesh2D(self.header, True)  # too small to be cached
+        self.assertIsNone(index_cache.load_entry(key))
+        settings.configure(SERAFIN_INDEX_CACHE_MIN_ELEMENTS=0)
+        Mesh2D(self.header, True)
+        self.assertIsNotNone(index_cache.load_entry(key))
+        self.assertEqual(sorted(os.listdir(self.folder)), [key + ext for ext in ('.dat', '.idx', '.npy')])
+
+        cached_mesh = Mesh2D(self.header, True)
+        for mins, cached_mins in zip(mesh.get_bounding_boxes(), cached_mesh.get_bounding_boxes()):
+            self.assertTrue(np.array_equal(mins, cached_mins))
+        for bounding_box in [(0, 0, 6, 6), (0.5, 0.5, 1, 1), (2.9, 1.9, 3.1, 2.1)]:
+            self.assertEqual(cached_mesh.get_intersecting_elements(bounding_box),
+                             mesh.get_intersecting_elements(bounding_box))
+
+    def test_disabled_cache(self):
+        key = self.header.mesh_fingerprint
+        settings.configure(SERAFIN_INDEX_CACHE=False)
+        mesh = Mesh2D(self.header, True)
+        self.assertIsNone(index_cache.load_entry(key))
+        mesh._construct_index(lambda x, unit: x, use_cache=True)  # explicitly enabled (e.g. multi-folder workflow)
+        self.assertIsNotNone(index_cache.load_entry(key))
+
+    def test_failed_store(self):
+        mins, maxs = Mesh2D(self.header, False).get_bounding_boxes()
+        with mock.patch.object(index_cache.np, 'save', side_effect=OSError('No space left on device')):
+            self.assertFalse(index_cache.store_entry(self.header.mesh_fingerprint, mins, maxs))
+        self.assertEqual(os.listdir(self.folder), [])  # no temporary file left
+
+    def test_evict(self):
+        Mesh2D(self.header, True)
+        self.header.x_stored = self.header.x_stored + 1.0
+        self.header._compute_mesh_coordinates()
+        Mesh2D(self.header, True)
+        self.assertEqual(len(os.listdir(self.folder)), 6)
+        index_cache.evict(max_size=0)
+        self.assertEqual(os.listdir(self.folder), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,290 @@
+"""!
+Unittest for slf.Serafin module
+"""
+
+import numpy as np
+import os
+import pickle
+import shutil
+import unittest
+
+from pyteltools.conf import settings
+from pyteltools.slf import Serafin
+from pyteltools.slf.prefetch import PrefetchReader
+from pyteltools.slf.transposed import build_transposed_cache, cache_folder
+from . import TestHeader
+
+
+HOME = os.path.expanduser('~')
+
+
+class SerafinReadTestCase(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(HOME, 'dummy_serafin.slf')
+        self.var_IDs = ['U', 'V', 'H']
+        self.nb_frames = 7
+
+        header = TestHeader()
+        for var_ID in self.var_IDs:
+            header.add_variable_from_ID(var_ID)
+        self.times = np.linspace(0.0, 60.0, self.nb_frames)
+        self.values = np.random.RandomState(0).rand(self.nb_frames, header.nb_var, header.nb_nodes)
+        with Serafin.Write(self.path, 'fr', overwrite=True) as f:
+            f.write_header(header)
+            for time, values in zip(self.times, self.values):
+                f.write_entire_frame(header, time, values)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_read_var_in_frame(self):
+        for use_mmap in (True, False):
+            with Serafin.Read(self.path, 'fr', use_mmap=use_mmap) as f:
+                f.read_header()
+                for time_index in range(self.nb_frames):
+                    for pos_var, var_ID in enumerate(self.var_IDs):
+                        values = f.read_var_in_frame(time_index, var_ID)
+                        self.assertTrue(np.array_equal(values, self.values[time_index, pos_var]))
+
+    def test_read_vars_in_frame(self):
+        for use_mmap in (True, False):
+            with Serafin.Read(self.path, 'fr', use_mmap=use_mmap) as f:
+                f.read_header()
+                values = f.read_vars_in_frame(3, ['H', 'U'])
+                self.assertTrue(np.array_equal(values, self.values[3, [2, 0]]))
+                values[0, 0] = -1.0  # result is writable
+
+    def test_mmap_view(self):
+        with Serafin.Read(self.path, 'fr', use_mmap=True) as f:
+            f.read_header()
+            view = f.get_values_view()
+            self.assertEqual(view.shape, (self.nb_frames, len(self.var_IDs), 4))
+            self.assertTrue(np.array_equal(view, self.values))
+            values = f.read_var_in_frame(2, 'V')
+            self.assertFalse(np.shares_memory(values, view))  # native copy
+            self.assertTrue(values.dtype.isnative)
+            del view
+        self.assertIsNone(f._mmap)  # closed on exit
+        values[0] = -1.0  # still usable (and writable) after the stream is closed
+
+    def test_iter_on_all_frames(self):
+        for use_mmap in (True, False):
+            with Serafin.Read(self.path, 'fr', use_mmap=use_mmap) as f:
+                f.read_header()
+                for time_index, (time, values) in enumerate(f.iter_on_all_frames()):
+                    self.assertIsInstance(time, float)
+                    self.assertEqual(time, self.times[time_index])
+                    self.assertTrue(np.array_equal(values, self.values[time_index]))
+                    self.assertTrue(values.flags.writeable and values.dtype.isnative)
+
+    def test_lazy_header(self):
+        with Serafin.Read(self.path, 'fr') as f:
+            f.read_header()
+            header = f.header
+        with Serafin.Read(self.path, 'fr') as f:
+            f.read_header(lazy=True)
+            self.assertNotIn('ikle', f.header.__dict__)
+            self.assertEqual(f.header.var_IDs, self.var_IDs)
+            self.assertTrue(np.array_equal(f.read_var_in_frame(1, 'U'), self.values[1, 0]))
+            lazy_header = f.header.copy()
+        self.assertTrue(np.array_equal(lazy_header.x, header.x))  # loaded on first access
+        self.assertTrue(np.array_equal(lazy_header.ikle_2d, header.ikle_2d))
+        self.assertTrue(lazy_header.same_2d_mesh(header))
+
+    def test_out_of_range_frame(self):
+        with Serafin.Read(self.path, 'fr') as f:
+            f.read_header()
+            with self.assertRaises(Serafin.SerafinRequestError):
+                f.read_var_in_frame(self.nb_frames, 'U')
+
+    def test_get_time(self):
+        for use_mmap in (True, False):
+            with Serafin.Read(self.path, 'fr', use_mmap=use_mmap) as f:
+                f.read_header()
+                f.get_time()
+                self.assertIsInstance(f.time, np.ndarray)
+                self.assertEqual(f.time.dtype, np.float64)
+                self.assertTrue(np.array_equal(f.time, self.times))
+        with Serafin.Read(self.path, 'fr', use_mmap=False) as f:
+            f.read_header()
+            previous_memory = settings.SERAFIN_BLOCK_MEMORY
+            settings.SERAFIN_BLOCK_MEMORY = 2 * f.header.frame_size  # blocks of 2 frames (last one is incomplete)
+            try:
+                f.get_time()
+            finally:
+                settings.SERAFIN_BLOCK_MEMORY = previous_memory
+            self.assertTrue(np.array_equal(f.time, self.times))
+
+    def test_subset_time(self):
+        with Serafin.Read(self.path, 'fr') as f:
+            f.read_header()
+            f.get_time()
+            self.assertEqual(f.subset_time(10.0, 50.0, 2), [(2, 20.0), (4, 40.0)])
+            self.assertEqual(f.subset_time(100.0, 200.0, 1), [])
+
+    def test_read_var_at_nodes(self):
+        for use_mmap in (True, False):
+            with Serafin.Read(self.path, 'fr', use_mmap=use_mmap) as f:
+                f.read_header()
+                values = f.read_var_at_nodes('V', [3, 1])
+                self.assertTrue(np.array_equal(values, self.values[:, 1, [3, 1]]))
+                values = f.read_var_at_nodes('H', [2], time_indices=[5, 0])
+                self.assertTrue(np.array_equal(values, self.values[[5, 0], 2][:, [2]]))
+
+    def test_iter_frame_blocks(self):
+        for use_mmap in (True, False):
+            with Serafin.Read(self.path, 'fr', use_mmap=use_mmap) as f:
+                f.read_header()
+                blocks = list(f.iter_frame_blocks(['H', 'U'], block_size=3))
+                self.assertEqual([len(values) for _, values in blocks], [3, 3, 1])
+                self.assertTrue(np.array_equal(np.concatenate([time for time, _ in blocks]), self.times))
+                self.assertTrue(np.array_equal(np.concatenate([values for _, values in blocks]),
+                                               self.values[:, [2, 0]]))
+                (time, values), = f.iter_frame_blocks(['V'], time_indices=[0, 2, 1, 3])
+                self.assertTrue(np.array_equal(time, self.times[[0, 2, 1, 3]]))
+                self.assertTrue(np.array_equal(values, self.values[[0, 2, 1, 3]][:, [1]]))
+
+    def test_iter_frame_blocks_memory(self):
+        for use_mmap, expected_sizes in ((True, [3, 3, 1]), (False, [1] * 7)):
+            with Serafin.Read(self.path, 'fr', use_mmap=use_mmap) as f:
+                f.read_header()
+                previous_memory = settings.SERAFIN_BLOCK_MEMORY
+                # memory of 3 frames of a single variable (or of a single frame with all the variables)
+                settings.SERAFIN_BLOCK_MEMORY = 3 * f.header.nb_nodes * np.dtype(f.header.np_float_type).itemsize
+                try:
+                    blocks = list(f.iter_frame_blocks(['V']))
+                finally:
+                    settings.SERAFIN_BLOCK_MEMORY = previous_memory
+                self.assertEqual([len(values) for _, values in blocks], expected_sizes)
+                self.assertTrue(np.array_equal(np.concatenate([values for _, values in blocks]),
+                                               self.values[:, [1]]))
+
+    def test_prefetch(self):
+        for use_mmap in (True, False):
+            with Serafin.Read(self.path, 'fr', use_mmap=use_mmap) as f:
+                f.read_header()
+                f.get_time()
+                with PrefetchReader(f, [1, 3, 5, 6], ['U', 'H'], nb_buffers=2) as reader:
+                    for time_index in (1, 3, 0, 5):  # frame 0 is not in access pattern
+                        self.assertTrue(np.array_equal(reader.read_var_in_frame(time_index, 'H'),
+                                                       self.values[time_index, 2]))
+                        self.assertTrue(np.array_equal(reader.read_vars_in_frame(time_index, ['V', 'U']),
+                                                       self.values[time_index, [1, 0]]))
+                    thread = reader._thread
+                # stopped before the end of the access pattern: the read-ahead thread is stopped on exit
+                self.assertFalse(thread.is_alive())
+                self.assertIsNone(reader._thread)
+
+    def test_node_cache(self):
+        with Serafin.Read(self.path, 'fr') as f:
+            f.read_header()
+            build_transposed_cache(f, ['V', 'H'])
+        try:
+            with Serafin.Read(self.path, 'fr') as f:
+                f.read_header()
+                self.assertIsNotNone(f._get_node_cache())
+                values = f.read_var_at_nodes('H', [0, 3], time_indices=[6, 2, 4])
+                self.assertTrue(np.array_equal(values, self.values[[6, 2, 4], 2][:, [0, 3]]))
+                values = f.read_var_at_nodes('U', [1])  # not cached
+                self.assertTrue(np.array_equal(values, self.values[:, 0, [1]]))
+
+            # chunks along nodes and frames
+            with Serafin.Read(self.path, 'fr') as f:
+                f.read_header()
+                build_transposed_cache(f, ['H'], node_chunk=3, time_chunk=4)
+            with Serafin.Read(self.path, 'fr') as f:
+                f.read_header()
+                self.assertEqual(len(os.listdir(cache_folder(self.path))), 1 + 2 * 2)  # meta and chunks
+                values = f.read_var_at_nodes('H', [3, 0, 2], time_indices=[6, 2, 4, 3])
+                self.assertTrue(np.array_equal(values, self.values[[6, 2, 4, 3], 2][:, [3, 0, 2]]))
+        finally:
+            shutil.rmtree(cache_folder(self.path))
+
+    def test_write_frames(self):
+        path = os.path.join(HOME, 'dummy_serafin_block.slf')
+        with Serafin.Read(self.path, 'fr') as f:
+            f.read_header()
+            header = f.header
+        try:
+            with Serafin.Write(path, 'fr', overwrite=True) as f:
+                f.write_header(header)
+                f.write_frames(header, self.times[:3], self.values[:3])
+                f.write_frames(header, self.times[3:], self.values[3:])
+            with open(self.path, 'rb') as f1, open(path, 'rb') as f2:
+                self.assertEqual(f1.read(), f2.read())
+            with Serafin.Write(path, 'fr', overwrite=True) as f:
+                with self.assertRaises(Serafin.SerafinValidationError):
+                    f.write_frames(header, self.times, self.values[:, :2])
+        finally:
+            os.remove(path)
+
+
+class BoundariesTestCase(unittest.TestCase):
+    def setUp(self):
+        # 4x4 nodes grid (node number = 1 + i + 4 * j for x = i and y = j) without its central cell
+        nodes = np.array([(i, j) for j in range(4) for i in range(4)], dtype=np.float64)
+        ikle = []
+        for j in range(3):
+            for i in range(3):
+                if (i, j) != (1, 1):
+                    n = 1 + i + 4 * j
+                    ikle += [(n, n + 1, n + 5), (n, n + 5, n + 4)]
+        self.header = Serafin.SerafinHeader()
+        self.header.from_triangulation(nodes, np.array(ikle, dtype=np.int64))
+
+    def test_external_edges(self):
+        edges = self.header.get_external_edges()
+        self.assertEqual(len(edges), 16)
+        self.assertEqual(len(self.header.get_all_edges()), 3 * 16)
+
+    def test_boundaries(self):
+        boundaries = list(self.header.iter_on_boundaries())
+        self.assertEqual(boundaries[0], [1, 2, 3, 4, 8, 12, 16, 15, 14, 13, 9, 5])  # counter-clockwise
+        self.assertEqual(boundaries[1], [6, 10, 11, 7])  # island, clockwise
+        self.assertEqual(self.header.ipobo.tolist(), [1, 2, 3, 4, 12, 13, 16, 5, 11, 14, 15, 6, 10, 9, 8, 7])
+
+
+class MeshFingerprintTestCase(unittest.TestCase):
+    def setUp(self):
+        self.header = TestHeader()
+
+    def test_same_2d_mesh(self):
+        other = TestHeader()
+        self.assertTrue(self.header.same_2d_mesh(other))
+        other.x_stored = other.x_stored.copy()
+        other.x_stored[0] += 1e-3
+        other._compute_mesh_coordinates()
+        self.assertFalse(self.header.same_2d_mesh(other))
+
+    def test_carried_fingerprint(self):
+        fingerprint = self.header.mesh_fingerprint
+        self.assertEqual(self.header.copy()._mesh_fingerprint, fingerprint)
+        self.assertEqual(pickle.loads(pickle.dumps(self.header))._mesh_fingerprint, fingerprint)
+        header_3d = self.header.copy_as_3d(3)
+        self.assertEqual(header_3d._mesh_fingerprint, fingerprint)
+        header_2d = header_3d.copy_as_2d()
+        self.assertEqual(header_2d._mesh_fingerprint, fingerprint)
+        header_2d._mesh_fingerprint = None
+        self.assertEqual(header_2d.mesh_fingerprint, fingerprint)  # recomputed
+
+
+class NearestNodesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.header = TestHeader()
+
+    def test_nearest_nodes(self):
+        rng = np.random.RandomState(0)
+        points = rng.uniform(-1, 7, (50, 2))
+        nodes, distances = self.header.nearest_nodes(points)
+        for (x, y), node, distance in zip(points, nodes, distances):
+            dist = np.sqrt(np.power(self.header.x - x, 2) + np.power(self.header.y - y, 2))
+            self.assertEqual(node, np.argmin(dist) + 1)
+            self.assertAlmostEqual(distance, dist.min())
+        self.assertEqual(self.header.nearest_node(2.9, 1.8), 4)
+
+    def test_nearest_nodes_options(self):
+        nodes, distances = self.header.nearest_nodes([[3.0, 1.0], [20.0, 20.0]], max_distance=2)
+        self.assertEqual(nodes.tolist(), [4, 0])
+        self.assertTrue(np.isinf(distances[1]))
+        nodes, _ = self.header.nearest_nodes([[2.0, 1.0]], k=2)
+        self.assertEqual(nodes.tolist(), [[4, 2]])
@@ -0,0 +1,133 @@
+"""!
+Unittest for cli/slf_to_raster.py script
+"""
+
+import importlib.util
+import matplotlib.tri as mtri
+import numpy as np
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+try:
+    from osgeo import gdal
+except ImportError:
+    gdal = None
+
+from pyteltools.conf import settings
+from pyteltools.slf import Serafin
+from . import TestHeader
+
+
+CLI_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'cli')
+RESOLUTION = 0.5
+
+
+def load_script(name):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(CLI_FOLDER, name + '.py'))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module  # functions of the script have to be pickled by the processes pool
+    spec.loader.exec_module(module)
+    return module
+
+
+@unittest.skipIf(gdal is None, 'GDAL (osgeo) is not available')
+class SlfToRasterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.in_slf = os.path.join(self.folder, 'in.slf')
+        self.header = TestHeader()
+        for var_ID in ('H', 'U'):
+            self.header.add_variable_from_ID(var_ID)
+        self.times = [0.0, 10.0, 20.0]
+        self.values = np.random.RandomState(0).uniform(-1, 1, (len(self.times), 2, self.header.nb_nodes))
+        with Serafin.Write(self.in_slf, 'fr') as f:
+            f.write_header(self.header)
+            f.write_frames(self.header, self.times, self.values)
+        self.script = load_script('slf_to_raster')
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def run_script(self, out_tif, *args):
+        self.script.slf_to_raster(self.script.parser.parse_args([self.in_slf, out_tif, str(RESOLUTION)] + list(args)))
+
+    def expected_arrays(self, time_index, Hmin_to_clip=None):
+        """Interpolation with matplotlib (as in previous versions of the script)"""
+        x, y = self.header.x, self.header.y
+        m_xi, m_yi = np.meshgrid(np.arange(x.min(), x.max(), RESOLUTION), np.arange(y.min(), y.max(), RESOLUTION))
+        triang = mtri.Triangulation(x, y, triangles=self.header.ikle_2d - 1)
+        arrays = [np.ma.filled(mtri.LinearTriInterpolator(triang, values)(m_xi, m_yi), np.nan)[::-1]
+                  for values in self.values[time_index]]
+        if Hmin_to_clip is not None:
+            with np.errstate(invalid='ignore'):
+                mask = arrays[0] <= Hmin_to_clip
+            arrays = [np.where(mask, np.nan, array) for array in arrays]
+        return arrays
+
+    @staticmethod
+    def read_bands(filename):
+        raster = gdal.Open(filename)
+        bands = [raster.GetRasterBand(i_band + 1).ReadAsArray() for i_band in range(raster.RasterCount)]
+        raster = None  # close file
+        return bands
+
+    def assertArraysEqual(self, arrays, expected_arrays):
+        self.assertEqual(len(arrays), len(expected_arrays))
+        for array, expected_array in zip(arrays, expected_arrays):
+            self.assertEqual(array.shape, expected_array.shape)
+            self.assertTrue(np.allclose(array, expected_array, equal_nan=True))
+
+    def test_bands(self):
+        out_tif = os.path.join(self.folder, 'out.tif')
+        self.run_script(out_tif, '--all_frames')
+        bands = self.read_bands(out_tif)
+        for time_index in range(len(self.times)):
+            self.assertArraysEqual(bands[2 * time_index:2 * time_index + 2], self.expected_arrays(time_index))
+
+    def test_files(self):
+        out_tif = os.path.join(self.folder, 'out.tif')
+        self.run_script(out_tif, '--frame_index', '2', '0', '--multi_frame_output', 'files')
+        self.assertFalse(os.path.exists(out_tif))
+        for time_index in (2, 0):
+            self.assertArraysEqual(self.read_bands(os.path.join(self.folder, 'out_%i.tif' % time_index)),
+                                   self.expected_arrays(time_index))
+
+    def run_script_by_tiles(self, out_tif, multi_frame_output):
+        # 12 x 12 cells: 9 tiles (with partial tiles on the last rows and columns), located by batches of 2 tiles
+        self.assertEqual(len(list(self.script.grid_tiles(12, 12, 5))), 9)
+        previous_memory = settings.SERAFIN_BLOCK_MEMORY
+        settings.SERAFIN_BLOCK_MEMORY = 1  # blocks of a single frame
+        try:
+            self.run_script(out_tif, '--all_frames', '--multi_frame_output', multi_frame_output,
+                            '--tile_size', '5', '--nb_processes', '2')
+        finally:
+            settings.SERAFIN_BLOCK_MEMORY = previous_memory
+
+    def test_bands_by_tiles(self):
+        out_tif = os.path.join(self.folder, 'out.tif')
+        self.run_script_by_tiles(out_tif, 'bands')
+        bands = self.read_bands(out_tif)
+        for time_index in range(len(self.times)):
+            self.assertArraysEqual(bands[2 * time_index:2 * time_index + 2], self.expected_arrays(time_index))
+
+    def test_files_by_tiles(self):
+        out_tif = os.path.join(self.folder, 'out.tif')
+        self.run_script_by_tiles(out_tif, 'files')
+        for time_index in range(len(self.times)):
+            self.assertArraysEqual(self.read_bands(os.path.join(self.folder, 'out_%i.tif' % time_index)),
+                                   self.expected_arrays(time_index))
+
+    def test_clip(self):
+        out_tif = os.path.join(self.folder, 'out.tif')
+        self.run_script(out_tif, '--frame_index', '1', '--vars', 'U', '--Hmin_to_clip', '0')
+        self.assertArraysEqual(self.read_bands(out_tif), self.expected_arrays(1, 0)[1:])
+
+    def test_no_value_inside(self):
+        out_tif = os.path.join(self.folder, 'out.tif')
+        with self.assertLogs(self.script.logger, 'INFO') as logs:
+            self.run_script(out_tif, '--Hmin_to_clip', '10')  # all the cells are clipped
+        self.assertTrue(all(np.isnan(band).all() for band in self.read_bands(out_tif)))
+        self.assertIn('[nan, nan]', logs.output[-1])
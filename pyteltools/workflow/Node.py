@@ -5,8 +5,6 @@ from PyQt5.QtWidgets import (QAction, QApplication, QDialog, QMenu, QMessageBox,
                              QGraphicsItem, QGraphicsLineItem, QGraphicsProxyWidget, QGraphicsRectItem,
                              QProgressBar, QStyle, QWidget)
 
-from shapely.geometry import Polygon
-
 from .util import ConfigureDialog
 
 
@@ -264,22 +262,14 @@ class Node(QGraphicsItem):
         pass
 
     def construct_mesh(self, mesh):
-        five_percent = 0.05 * mesh.nb_triangles
-        nb_processed = 0
-        current_percent = 0
-
-        for i, j, k in mesh.ikle:
-            t = Polygon([mesh.points[i], mesh.points[j], mesh.points[k]])
-            mesh.triangles[i, j, k] = t
-            mesh.index.insert(i, t.bounds, obj=(i, j, k))
-
-            nb_processed += 1
-            if nb_processed > five_percent:
-                nb_processed = 0
-                current_percent += 5
-                self.progress_bar.setValue(int(current_percent))
+        def iter_steps(steps, unit):
+            for i, step in enumerate(steps):
+                yield step
+                self.progress_bar.setValue(int(100 * (i + 1) / len(steps)))
                 QApplication.processEvents()
 
+        # Vectorized construction (or read from the index cache)
+        mesh._construct_index(iter_steps)
         self.progress_bar.setValue(0)
         QApplication.processEvents()
 
@@ -3,7 +3,6 @@ from multiprocessing import Process, Queue
 import numpy as np
 import os
 from shapefile import ShapefileException
-from shapely.geometry import Polygon
 
 from pyteltools.conf import settings
 from pyteltools.geom import BlueKenue, Shapefile
@@ -75,7 +74,7 @@ def fail_message(reason, node_name, job_id, second_job_id=''):
 def read_slf_2d(node_id, fid, filename, language, job_id):
     data = SerafinData(job_id, filename, language)
     try:
-        is_2d = data.read()
+        is_2d = data.read(use_cache=True)  # headers are preloaded in the cache (see `header_cache.preload`)
     except (Serafin.SerafinRequestError, Serafin.SerafinValidationError) as e:
         return False, node_id, fid, data, fail_message(e.message, 'Load Serafin 2D', job_id)
     if not is_2d:
@@ -88,7 +87,7 @@ def read_slf_2d(node_id, fid, filename, language, job_id):
 def read_slf_3d(node_id, fid, filename, language, job_id):
     data = SerafinData(job_id, filename, language)
     try:
-        is_2d = data.read()
+        is_2d = data.read(use_cache=True)  # headers are preloaded in the cache (see `header_cache.preload`)
     except (Serafin.SerafinRequestError, Serafin.SerafinValidationError) as e:
         return False, node_id, fid, data, fail_message(e.message, 'Load Serafin 3D', job_id)
     if is_2d:
@@ -785,10 +784,7 @@ def write_slf_vertical_aggregation(input_data, filename):
 
 
 def construct_mesh(mesh):
-    for i, j, k in mesh.ikle:
-        t = Polygon([mesh.points[i], mesh.points[j], mesh.points[k]])
-        mesh.triangles[i, j, k] = t
-        mesh.index.insert(i, t.bounds, obj=(i, j, k))
+    mesh._construct_index(lambda x, unit: x, use_cache=True)
 
 
 def compute_volume(node_id, fid, data, aux_data, options, csv_separator, fmt_float):
@@ -1001,16 +997,16 @@ def interpolate_points(node_id, fid, data, aux_data, options, csv_separator, fmt
         input_stream.header = data.header
         input_stream.time = data.time
 
-        for index, index_time in enumerate(data.selected_time_indices):
-            row = [str(data.time[index_time])]
+        # frames are interpolated by blocks when they are iterated
+        var_values = MeshInterpolator.iter_interpolate_on_points(input_stream, selected_vars,
+                                                                 data.selected_time_indices, point_interpolators)
 
-            var_values = []
-            for var in selected_vars:
-                var_values.append(input_stream.read_var_in_frame(index_time, var))
+        for index_time, values in zip(data.selected_time_indices, var_values):
+            row = [str(data.time[index_time])]
 
-            for (i, j, k), interpolator in point_interpolators:
+            for index_point in range(len(point_interpolators)):
                 for index_var in range(nb_selected_vars):
-                    row.append(fmt_float.format(interpolator.dot(var_values[index_var][[i, j, k]])))
+                    row.append(fmt_float.format(values[index_var, index_point]))
             csv_data.add_row(row)
 
     csv_data.write(filename, csv_separator)
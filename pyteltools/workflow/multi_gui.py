@@ -10,6 +10,7 @@ from time import time
 import sys
 
 from pyteltools.conf import settings
+from pyteltools.slf import header_cache
 
 from .MultiNode import Box, MultiLink
 from . import multi_func as worker
@@ -691,6 +692,9 @@ class MultiWidget(QWidget):
             for path, job_id, fid in zip(paths, job_ids, self.table.input_columns[node_id]):
                 slf_tasks.append((fun, (node_id, fid, os.path.join(path, name),
                                         self.scene.language, job_id)))
+        # parse in parallel the headers of the files which are not cached yet
+        nb_cold_files = header_cache.preload([args[2] for _, args in slf_tasks], self.scene.language, self.ncsize)
+        logger.debug('%i Serafin header(s) added to the cache' % nb_cold_files)
         self.worker.add_tasks(slf_tasks)
         if not self.worker.started:
             self.worker.start()
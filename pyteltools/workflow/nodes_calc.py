@@ -531,18 +531,9 @@ class ComputeVolumeNode(TwoInOneOutNode):
                                   'start time': self.in_data.start_time, 'language': self.in_data.language}
 
             for i, time_index in enumerate(calculator.time_indices):
-                i_result = [str(calculator.input_stream.time[time_index])]
                 values = calculator.read_values_in_frame(time_index)
-
-                for j in range(len(calculator.polygons)):
-                    weight = calculator.weights[j]
-                    volume = calculator.volume_in_frame_in_polygon(weight, values, calculator.polygons[j])
-                    if calculator.volume_type == VolumeCalculator.POSITIVE:
-                        for v in volume:
-                            i_result.append(fmt_float.format(v))
-                    else:
-                        i_result.append(fmt_float.format(volume))
-                self.data.add_row(i_result)
+                volumes = calculator.volumes_in_frame(values)
+                self.data.add_row(calculator.format_volumes(time_index, volumes, fmt_float))
 
                 self.progress_bar.setValue(int(100 * (i+1) / len(calculator.time_indices)))
                 QApplication.processEvents()
@@ -804,9 +795,7 @@ class ComputeFluxNode(TwoInOneOutNode):
                 for var_ID in calculator.var_IDs:
                     values.append(calculator.input_stream.read_var_in_frame(time_index, var_ID))
 
-                for j in range(len(calculator.sections)):
-                    intersections = calculator.intersections[j]
-                    flux = calculator.flux_in_frame(intersections, values)
+                for flux in calculator.fluxes_in_frame(values):
                     i_result.append(fmt_float.format(flux))
                 self.data.add_row(i_result)
 
@@ -956,16 +945,17 @@ class InterpolateOnPointsNode(TwoInOneOutNode):
             input_stream.header = self.in_data.header
             input_stream.time = self.in_data.time
 
-            for index, index_time in enumerate(self.in_data.selected_time_indices):
-                row = [str(self.in_data.time[index_time])]
+            # frames are interpolated by blocks when they are iterated
+            var_values = MeshInterpolator.iter_interpolate_on_points(input_stream, selected_vars,
+                                                                     self.in_data.selected_time_indices,
+                                                                     point_interpolators)
 
-                var_values = []
-                for var in selected_vars:
-                    var_values.append(input_stream.read_var_in_frame(index_time, var))
+            for index, (index_time, values) in enumerate(zip(self.in_data.selected_time_indices, var_values)):
+                row = [str(self.in_data.time[index_time])]
 
-                for (i, j, k), interpolator in point_interpolators:
+                for index_point in range(len(point_interpolators)):
                     for index_var in range(nb_selected_vars):
-                        row.append(fmt_float.format(interpolator.dot(var_values[index_var][[i, j, k]])))
+                        row.append(fmt_float.format(values[index_var, index_point]))
 
                 self.data.add_row(row)
                 self.progress_bar.setValue(int(100 * (index+1) / nb_frames))
@@ -26,6 +26,7 @@ setup(
     include_package_data=True,  # see data files in `MANIFEST.in`
     scripts=cli_files,
     install_requires=requirements,
+    python_requires='>=3.8',  # Rtree>=1.1
     description='Python library for Telemac post-processing tasks',
     url='https://github.com/CNR-Engineering/PyTelTools',
 )